@@ -0,0 +1,185 @@
+"""
+Benchmark suite of pyshart hot paths: graph construction, plotting, item access, rendering and colors.
+Results are recorded as JSON, a previous results file can be given to report regressions.
+
+Usage: python -m benchmarks.run [--output results.json] [--compare previous.json] [--quick]
+"""
+import argparse
+import datetime
+import io
+import json
+import platform
+import random
+import sys
+import timeit
+import tracemalloc
+import typing
+
+import pyshart.color
+import pyshart.graph
+import pyshart.render
+
+# A benchmark whose time grows by more than this ratio (compared to previous results) is reported as a regression.
+REGRESSION_RATIO = 1.2
+
+
+def _graph(points: typing.List[pyshart.graph.VisualPoint], size: int) -> pyshart.graph.Graph:
+    return pyshart.graph.Graph(points, size, size // 2, 1, 1, 10, 10, True, True)
+
+
+def _points(count: int, size: int) -> typing.List[pyshart.graph.VisualPoint]:
+    rand = random.Random(count)
+    return [
+        pyshart.graph.VisualPoint(rand.randint(-size, size), rand.randint(-size // 2, size // 2), fore=pyshart.color.get_color('r'))
+        for _ in range(count)
+    ]
+
+
+def _measure(func: typing.Callable[[], typing.Any], number: int, repeat: int) -> typing.Dict[str, float]:
+    """
+    Time 'func' (best of 'repeat' runs of 'number' calls) and trace the peak memory of a single call.
+
+    :rtype: typing.Dict[str, float]
+    """
+    seconds = min(timeit.repeat(func, number=number, repeat=repeat)) / number
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return dict(seconds=seconds, peak_bytes=peak)
+
+
+Benchmark = typing.Tuple[str, typing.Dict[str, typing.Any], typing.Callable[[], typing.Any], typing.Dict[str, typing.Any]]
+
+
+def benchmarks(quick: bool = False) -> typing.Iterator[Benchmark]:
+    """
+    Yield the benchmarks (name, parameters, function to time, extra results).
+
+    :param quick: use small sizes only (smoke run), defaults to False.
+    :type quick: bool
+    """
+    sizes   = (20,) if quick else (20, 80, 320)
+    counts  = (100,) if quick else (100, 10000, 100000)
+
+    for size in sizes:
+        for count in counts:
+            points = _points(count, size)
+            yield 'graph_init', dict(size=size, points=count), lambda points=points, size=size: _graph(points, size), {}
+
+    for size in sizes:
+        graph   = _graph([], size)
+        cells   = [(x, y) for x in range(-size, size + 1, 3) for y in range(-size // 2, size // 2 + 1, 3)]
+        token   = pyshart.color.ColoredString('X', fore=pyshart.color.get_color('r'))
+
+        def setitem(graph=graph, cells=cells, token=token):
+            for cell in cells:
+                graph[cell] = token
+
+        def getitem(graph=graph, cells=cells):
+            for cell in cells:
+                graph[cell]
+
+        yield 'graph_setitem', dict(size=size, ops=len(cells)), setitem, {}
+        yield 'graph_getitem', dict(size=size, ops=len(cells)), getitem, {}
+
+    for size in sizes:
+        for count in counts:
+            graph = _graph(_points(count, size), size)
+            params = dict(size=size, points=count)
+            emitted = dict(bytes=len('\n'.join(graph._draw()).encode()) + 1)
+            yield 'graph_draw_rows', params, graph._draw, emitted
+            yield 'graph_draw', params, lambda graph=graph: graph.draw(io.StringIO()), emitted
+            encoder = pyshart.render.SGREncoder()
+            compact = dict(bytes=len('\n'.join(encoder.encode(row) for row in graph._draw()).encode()) + 1)
+            yield 'graph_draw_compact', params, lambda graph=graph: graph.draw(io.StringIO(), fmt='compact'), compact
+
+    for count in counts:
+        strings = [pyshart.color.ColoredString('X', fore=pyshart.color.get_color('r')) for _ in range(count)]
+        yield 'colored_string_concat', dict(strings=count), lambda strings=strings: ''.join(s + '' for s in strings), {}
+
+    keys = list(pyshart.color.COLORED_FORE_DESCRIPTION_MAP) + ['RED', 'lightblue_ex']
+    yield 'get_color', dict(ops=len(keys)), lambda: [pyshart.color.get_color(key) for key in keys], {}
+
+
+def run(quick: bool = False, number: int = None, repeat: int = 3) -> typing.Dict[str, typing.Any]:
+    """
+    Run the benchmarks.
+
+    :param quick: use small sizes only (smoke run), defaults to False.
+    :type quick: bool
+    :param number: calls per timing run, defaults to None (1 for quick runs, 5 otherwise).
+    :type number: int, optional
+    :param repeat: timing runs (the best is kept), defaults to 3.
+    :type repeat: int
+    :return: the results document (meta data and results).
+    :rtype: typing.Dict[str, typing.Any]
+    """
+    if number is None:
+        number = 1 if quick else 5
+    results = []
+    for name, params, func, extra in benchmarks(quick=quick):
+        results.append(dict(name=name, params=params, **_measure(func, number=number, repeat=repeat), **extra))
+    return dict(
+        meta=dict(
+            python      = platform.python_version(),
+            platform    = platform.platform(),
+            time        = datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            quick       = quick,
+        ),
+        results=results,
+    )
+
+
+def _key(result: typing.Dict[str, typing.Any]) -> str:
+    return result['name'] + json.dumps(result['params'], sort_keys=True)
+
+
+def compare(
+        current : typing.Dict[str, typing.Any],
+        previous: typing.Dict[str, typing.Any],
+        ratio   : float = REGRESSION_RATIO,
+) -> typing.List[str]:
+    """
+    Returns a line per benchmark slower than in the previous results by more than 'ratio'.
+
+    :rtype: typing.List[str]
+    """
+    before = {_key(result): result for result in previous['results']}
+    lines = []
+    for result in current['results']:
+        old = before.get(_key(result))
+        if old is not None and result['seconds'] > old['seconds'] * ratio:
+            lines.append(f"{result['name']} {result['params']}: {old['seconds']:.6f}s -> {result['seconds']:.6f}s")
+    return lines
+
+
+def main(argv: typing.List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description='pyshart benchmark suite')
+    parser.add_argument('--output', help='results JSON file (default: stdout)')
+    parser.add_argument('--compare', help='previous results JSON file to report regressions against')
+    parser.add_argument('--quick', action='store_true', help='small sizes only (smoke run)')
+    parser.add_argument('--repeat', type=int, default=3, help='timing runs, the best is kept')
+    args = parser.parse_args(argv)
+
+    results = run(quick=args.quick, repeat=args.repeat)
+    document = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as writer:
+            writer.write(document + '\n')
+    else:
+        print(document)
+
+    if args.compare:
+        with open(args.compare, 'r') as reader:
+            regressions = compare(results, json.load(reader))
+        for line in regressions:
+            print(f'REGRESSION {line}', file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
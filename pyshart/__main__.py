@@ -0,0 +1,71 @@
+"""
+Command line entry point: plot columns of a CSV or JSON lines file (or stdin) to the terminal.
+
+Usage: python -m pyshart FILE -y COLUMN [-x COLUMN] [--follow] [--mmap] [--width 80] [--height 20]
+"""
+import argparse
+import sys
+import typing
+
+from . import ingest
+from . import render
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m pyshart', description='Plot columns of a CSV or JSON lines file.')
+    parser.add_argument('path', help="input file, '-' for stdin")
+    parser.add_argument('-y', required=True, help='y column: CSV name or index, JSON key')
+    parser.add_argument('-x', help='x column (default: the line number)')
+    parser.add_argument('--format', choices=[fmt.value for fmt in ingest.InputFormat], help='input format (default: by extension, csv)')
+    parser.add_argument('--delimiter', default=',', help='CSV delimiter')
+    parser.add_argument('--no-header', dest='header', action='store_false', help='the CSV file has no header line')
+    parser.add_argument('--xlim', nargs=2, type=float, metavar=('LOW', 'HIGH'), help='x axis limits (default: the data limits)')
+    parser.add_argument('--ylim', nargs=2, type=float, metavar=('LOW', 'HIGH'), help='y axis limits (default: the data limits)')
+    parser.add_argument('--width', type=int, default=80, help='maximal number of columns')
+    parser.add_argument('--height', type=int, default=20, help='maximal number of rows')
+    parser.add_argument('--block-size', type=int, default=ingest.BLOCK_SIZE, help='bytes read per block')
+    parser.add_argument('--mmap', action='store_true', help='map the input file in memory')
+    parser.add_argument('-f', '--follow', action='store_true', help='keep plotting data appended to the file')
+    parser.add_argument('--interval', type=float, default=0.5, help='follow mode redraw interval (seconds)')
+    parser.add_argument('--plain', action='store_true', help='no colors')
+    return parser
+
+
+def main(argv: typing.List[str] = None) -> int:
+    parser  = _parser()
+    args    = parser.parse_args(argv)
+    limits  = None
+    if args.xlim or args.ylim:
+        if not (args.xlim and args.ylim):
+            parser.error('--xlim and --ylim must be given together')
+        limits = (args.xlim[0], args.xlim[1], args.ylim[0], args.ylim[1])
+    if args.follow and args.path == '-' and limits is None:
+        parser.error('following stdin requires --xlim and --ylim')
+    colors  = None if args.plain else ingest.binning.density_colors()
+    options = dict(
+        y           = args.y,
+        x           = args.x,
+        fmt         = args.format,
+        delimiter   = args.delimiter,
+        header      = args.header,
+        limits      = limits,
+        width       = args.width,
+        height      = args.height,
+        colors      = colors,
+    )
+    try:
+        if args.follow:
+            ingest.follow_file(args.path, interval=args.interval, **options)
+        else:
+            graph = ingest.plot_file(args.path, block_size=args.block_size, use_mmap=args.mmap, **options)
+            graph.draw(fmt=render.Format.PLAIN if args.plain else render.Format.COMPACT)
+    except KeyboardInterrupt:
+        return 130
+    except (OSError, KeyError) as error:
+        print(f'pyshart: {error}', file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Asynclive module that contains the AsyncLiveChart class.
+Provides an asyncio front end of live.LiveRenderer: samples are read from async iterators and rendered on a timer.
+"""
+import asyncio
+import concurrent.futures
+import math
+import typing
+
+from . import graph
+from . import live
+
+
+def _is_finite(*values: typing.Any) -> bool:
+    """
+    Returns whether all the values are finite numbers.
+
+    :rtype: bool
+    """
+    try:
+        return all(math.isfinite(value) for value in values)
+    except TypeError:
+        return False
+
+
+def _apply_samples(target: typing.Any, samples: typing.List[typing.Any]) -> None:
+    """
+    Default samples handler: values are appended to time series, (x, y) data values pairs are plotted
+    in the cell 'round(v / step)' (out of bounds are dropped). Samples that are not finite numbers (pairs) are dropped.
+
+    :rtype: None
+    """
+    if hasattr(target, 'append'):
+        for value in samples:
+            if _is_finite(value):
+                target.append(value)
+        return
+    points = [sample for sample in samples if isinstance(sample, (tuple, list)) and len(sample) == 2 and _is_finite(*sample)]
+    if points:
+        xs, ys = zip(*points)
+        target.plot_many(xs, ys, clip=True, data=True)
+
+
+class AsyncLiveChart:
+    """
+    AsyncLiveChart class redraws a graph in place (see live.LiveRenderer) from within an asyncio event loop.
+    Samples received from the subscribed sources between two frames are coalesced and applied at once,
+    frames are rendered every 'interval' seconds and written from a worker thread: a slow terminal never blocks
+    the event loop, while a frame is still being written the next frames are skipped (their rows stay dirty).
+    """
+    def __init__(
+            self,
+            graph   : graph.Graph,
+            stream  : typing.TextIO = None,
+            interval: float = 0.1,
+            apply   : typing.Callable[[typing.Any, typing.List[typing.Any]], None] = _apply_samples,
+    ):
+        self.graph      = graph
+        self.renderer   = live.LiveRenderer(graph, stream=stream)
+        self.interval   = interval
+        self.apply      = apply
+        self.sources    = []    # type: typing.List[typing.AsyncIterable[typing.Any]]
+        self.frames     = 0
+        self.skipped    = 0
+        self._pending   = []    # type: typing.List[typing.Any]
+        self._write     = None  # type: typing.Optional[asyncio.Future]
+        self._executor  = None  # type: typing.Optional[concurrent.futures.ThreadPoolExecutor]
+
+    def subscribe(self, source: typing.AsyncIterable[typing.Any]) -> None:
+        """
+        Add a source of samples (e.g. an async generator reading a queue, a socket or a subprocess output).
+
+        :rtype: None
+        """
+        self.sources.append(source)
+
+    def feed(self, sample: typing.Any) -> None:
+        """
+        Add a single sample, it is applied with the others on the next frame.
+
+        :rtype: None
+        """
+        self._pending.append(sample)
+
+    async def _consume(self, source: typing.AsyncIterable[typing.Any]) -> None:
+        async for sample in source:
+            self._pending.append(sample)
+
+    def _emit(self, frame: str) -> None:
+        # Runs in the worker thread.
+        self.renderer.stream.write(frame)
+        self.renderer.stream.flush()
+
+    def tick(self) -> bool:
+        """
+        Apply the pending samples and start writing the changed rows, unless the previous frame is still being written.
+
+        :return: whether a frame was started.
+        :rtype: bool
+        """
+        samples, self._pending = self._pending, []
+        if samples:
+            self.apply(self.graph, samples)
+        if self._write is not None and not self._write.done():
+            self.skipped += 1
+            return False
+        frame = self.renderer._frame()
+        if frame:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            self._write = asyncio.get_event_loop().run_in_executor(self._executor, self._emit, frame)
+            self.frames += 1
+        return True
+
+    async def run(self) -> None:
+        """
+        Consume the sources and render frames until every source is exhausted (forever when there is none),
+        then render the last frame and wait for it to be written.
+
+        :rtype: None
+        """
+        loop        = asyncio.get_event_loop()
+        consumers   = [loop.create_task(self._consume(source)) for source in self.sources]
+        done        = asyncio.gather(*consumers) if consumers else loop.create_future()
+        try:
+            while not done.done():
+                await asyncio.wait([done], timeout=self.interval)
+                self.tick()
+            done.result()
+            if self._write is not None:
+                await self._write
+            self.tick()
+            if self._write is not None:
+                await self._write
+        finally:
+            for consumer in consumers:
+                consumer.cancel()
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
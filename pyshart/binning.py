@@ -0,0 +1,139 @@
+"""
+Binning module that aggregates raw (x, y) data into graph cells.
+Provides the reducers used to solve cells collisions and the mapping of aggregated values onto tokens and colors.
+"""
+import collections
+import enum
+import itertools
+import operator
+import typing
+
+from . import color
+
+# Tokens ordered from the lowest to the highest density.
+DENSITY_TOKENS  = '.:-=+*#%@'
+# Fore colors (shortcuts, see color.get_color) ordered from the lowest to the highest density.
+DENSITY_COLORS  = ('blu', 'c', 'g', 'y', 'r')
+
+# Color codes or palette ids (see color.Palette, e.g. a gradient) ordered from the lowest to the highest level.
+Colors = typing.Sequence[typing.Union[str, int]]
+
+
+class Reducer(enum.Enum):
+    """
+    Reducer enum holds the aggregation options of the values falling in the same cell.
+    """
+
+    COUNT   = 'count'
+    MIN     = 'min'
+    MAX     = 'max'
+    MEAN    = 'mean'
+    LAST    = 'last'
+
+
+def _cells(values: typing.Iterable[float], step: float) -> typing.Iterator[int]:
+    # Builtins only (no python level function call per value).
+    return map(round, map(operator.truediv, values, itertools.repeat(step)))
+
+
+def bin_points(
+        xs      : typing.Iterable[float],
+        ys      : typing.Iterable[float],
+        step_x  : float = 1,
+        step_y  : float = 1,
+        values  : typing.Iterable[float] = None,
+        reducer : Reducer = Reducer.COUNT,
+) -> typing.Dict[typing.Tuple[int, int], float]:
+    """
+    Bin raw (x, y) data into cells in a single pass, a value 'v' falls in the cell 'round(v / step)'.
+
+    :param xs: raw 'x' values.
+    :type xs: typing.Iterable[float]
+    :param ys: raw 'y' values, parallel to 'xs'.
+    :type ys: typing.Iterable[float]
+    :param step_x: 'x' units per cell, defaults to 1.
+    :type step_x: float
+    :param step_y: 'y' units per cell, defaults to 1.
+    :type step_y: float
+    :param values: values to reduce, parallel to 'xs', defaults to None ('ys' are used).
+    :type values: typing.Iterable[float], optional
+    :param reducer: aggregation of the values in the same cell, defaults to Reducer.COUNT.
+    :type reducer: Reducer
+    :raises ValueError: unknown reducer.
+    :return: mapping from cell (x, y) to its aggregated value.
+    :rtype: typing.Dict[typing.Tuple[int, int], float]
+    """
+    reducer = Reducer(reducer)
+    if values is None and reducer is not Reducer.COUNT:
+        ys, values = itertools.tee(ys)
+    cells = zip(_cells(xs, step_x), _cells(ys, step_y))
+    if reducer is Reducer.COUNT:
+        return dict(collections.Counter(cells))
+    if reducer is Reducer.LAST:
+        return dict(zip(cells, values))
+    bins = {}   # type: typing.Dict[typing.Tuple[int, int], float]
+    if reducer is Reducer.MIN:
+        for cell, value in zip(cells, values):
+            if cell not in bins or value < bins[cell]:
+                bins[cell] = value
+    elif reducer is Reducer.MAX:
+        for cell, value in zip(cells, values):
+            if cell not in bins or value > bins[cell]:
+                bins[cell] = value
+    else:
+        sums    = collections.defaultdict(float)
+        counts  = collections.Counter()
+        for cell, value in zip(cells, values):
+            sums[cell]  += value
+            counts[cell] += 1
+        bins = {cell: total / counts[cell] for cell, total in sums.items()}
+    return bins
+
+
+def count_cells(values: typing.Iterable[float], step: float = 1) -> typing.Dict[int, int]:
+    """
+    Count raw values per (one dimensional) cell in a single pass, a value 'v' falls in the cell 'round(v / step)'.
+
+    :param values: raw values.
+    :type values: typing.Iterable[float]
+    :param step: units per cell, defaults to 1.
+    :type step: float
+    :return: mapping from cell to its count.
+    :rtype: typing.Dict[int, int]
+    """
+    return dict(collections.Counter(_cells(values, step)))
+
+
+def levels(bins: typing.Dict[typing.Hashable, float], count: int) -> typing.Dict[typing.Hashable, int]:
+    """
+    Quantize aggregated values linearly into 'count' levels (0 is the lowest value).
+
+    :param bins: mapping from cell to its aggregated value (see 'bin_points' and 'count_cells').
+    :type bins: typing.Dict[typing.Hashable, float]
+    :param count: number of levels.
+    :type count: int
+    :return: mapping from cell to its level.
+    :rtype: typing.Dict[typing.Hashable, int]
+    """
+    if not bins:
+        return {}
+    low     = min(bins.values())
+    high    = max(bins.values())
+    if high == low:
+        return dict.fromkeys(bins, count - 1)
+    scale   = (count - 1) / (high - low)
+    return {cell: int((value - low) * scale) for cell, value in bins.items()}
+
+
+def density_colors(names: typing.Sequence[typing.Union[str, int]] = DENSITY_COLORS) -> typing.List[int]:
+    """
+    Resolve a sequence of fore color shortcuts (or full names) into palette ids (see color.Palette).
+    Palette ids (e.g. of color.Palette.gradient) are kept as is.
+
+    :param names: color shortcuts or palette ids, defaults to DENSITY_COLORS.
+    :type names: typing.Sequence[typing.Union[str, int]]
+    :return: list of palette ids.
+    :rtype: typing.List[int]
+    """
+    palette = color.get_palette()
+    return [name if isinstance(name, int) else palette.id(name, color.ColorType.FORE) for name in names]
@@ -0,0 +1,216 @@
+"""
+Canvas module that contains the Canvas class.
+Provides a compact cell storage for graphs: a code-point grid and a parallel style-index grid.
+"""
+import array
+import itertools
+import typing
+
+import colorama
+
+from . import color
+
+# 'u' is deprecated since python 3.13 in favour of 'w', both hold one unicode code point per item.
+CHAR_TYPECODE   = 'w' if 'w' in array.typecodes else 'u'
+STYLE_TYPECODE  = 'H'
+
+# Style index of a cell without any color.
+NO_STYLE        = 0
+# Reserved style index of a cell that holds an arbitrary (multi character) string.
+OVERFLOW_STYLE  = 0xFFFF
+
+
+class Canvas:
+    """
+    Canvas class stores a grid of single characters and their style indices.
+    Row 0 is the bottom row of the graph, rendering is done top to bottom.
+    Cells that hold more than a single character (e.g. axis labels) are kept aside in the overflow mapping.
+    Style indices are local to the canvas ('prefixes[index]' is the escape prefix), palette ids are mapped on first use.
+
+    :raises IndexError: illegal access to the underlying arrays (index out of bounds).
+    """
+    def __init__(self, width: int, height: int, fill: str = ' '):
+        self.width      = width
+        self.height     = height
+        self.fill       = fill
+        self.chars      = [array.array(CHAR_TYPECODE, fill * width) for _ in range(height)]
+        self.styles     = [array.array(STYLE_TYPECODE, bytes(2 * width)) for _ in range(height)]
+        self.overflow   = {}    # type: typing.Dict[typing.Tuple[int, int], str]
+        self.prefixes   = ['']  # type: typing.List[str]
+        self._style_ids = {'': NO_STYLE}
+        # Rows changed since the last call to 'pop_dirty'.
+        self.dirty      = set(range(height))
+
+    @classmethod
+    def from_rows(
+            cls,
+            chars   : typing.List[array.array],
+            styles  : typing.List[array.array],
+            overflow: typing.Dict[typing.Tuple[int, int], str] = None,
+            prefixes: typing.List[str] = None,
+            fill    : str = ' ',
+    ) -> 'Canvas':
+        """
+        Create a canvas holding the given rows as is (no copy, no fill).
+
+        :param chars: code points rows (CHAR_TYPECODE arrays), bottom row first.
+        :type chars: typing.List[array.array]
+        :param styles: style indices rows (STYLE_TYPECODE arrays), parallel to 'chars'.
+        :type styles: typing.List[array.array]
+        :param overflow: mapping from cell (row, col) to its multi character value, defaults to None.
+        :type overflow: typing.Dict[typing.Tuple[int, int], str], optional
+        :param prefixes: escape prefixes by style index (index 0 is no style), defaults to None.
+        :type prefixes: typing.List[str], optional
+        :param fill: the fill character, defaults to ' '.
+        :type fill: str
+        :raises ValueError: if the rows sizes differ.
+        :return: the canvas.
+        :rtype: Canvas
+        """
+        width = len(chars[0]) if chars else 0
+        if len(styles) != len(chars) or any(len(row) != width for row in itertools.chain(chars, styles)):
+            raise ValueError('chars and styles rows must all be of the same size')
+        self            = cls.__new__(cls)
+        self.width      = width
+        self.height     = len(chars)
+        self.fill       = fill
+        self.chars      = chars
+        self.styles     = styles
+        self.overflow   = dict(overflow or {})
+        self.prefixes   = list(prefixes or [''])
+        self._style_ids = {prefix: sid for sid, prefix in enumerate(self.prefixes)}
+        self.dirty      = set(range(self.height))
+        return self
+
+    def style_id(self, prefix: typing.Union[str, int]) -> int:
+        """
+        Returns (and registers if needed) the style index of the given escape prefix.
+        Palette ids (see color.Palette) are resolved into their color code first.
+
+        :param prefix: escape codes prefix (fore + back + style) or palette id.
+        :type prefix: typing.Union[str, int]
+        :raises ValueError: unknown palette id, or too many distinct styles in the canvas.
+        :return: the style index within the canvas.
+        :rtype: int
+        """
+        if isinstance(prefix, int):
+            codes = color.get_palette().codes
+            if not 0 <= prefix < len(codes):
+                raise ValueError(f'unknown palette id {prefix}')
+            prefix = codes[prefix]
+        sid = self._style_ids.get(prefix)
+        if sid is None:
+            sid = len(self.prefixes)
+            if sid >= OVERFLOW_STYLE:
+                raise ValueError('too many distinct styles in canvas')
+            self.prefixes.append(prefix)
+            self._style_ids[prefix] = sid
+        return sid
+
+    def put(self, row: int, col: int, char: str, style: int = NO_STYLE) -> None:
+        """
+        Put a single character with the given style index in the cell (row, col).
+        Strings longer than a single character are stored as is (without style) in the overflow mapping.
+
+        :param row: row index (0 is the bottom row).
+        :type row: int
+        :param col: column index.
+        :type col: int
+        :param char: the cell value.
+        :type char: str
+        :param style: style index (see 'style_id'), defaults to NO_STYLE.
+        :type style: int
+        :rtype: None
+        """
+        self.dirty.add(row)
+        if len(char) == 1:
+            self.chars[row][col]    = char
+            self.styles[row][col]   = style
+            if self.overflow:
+                self.overflow.pop((row, col), None)
+        else:
+            self.chars[row][col]    = self.fill
+            self.styles[row][col]   = OVERFLOW_STYLE
+            self.overflow[(row, col)] = char
+
+    def clear(self, row: int, col: int) -> None:
+        """
+        Reset the cell (row, col) to the fill character.
+
+        :rtype: None
+        """
+        self.put(row, col, self.fill)
+
+    def is_blank(self, row: int, col: int) -> bool:
+        """
+        Returns whether the cell (row, col) holds the fill character without style.
+
+        :rtype: bool
+        """
+        return self.styles[row][col] == NO_STYLE and self.chars[row][col] == self.fill
+
+    def get(self, row: int, col: int) -> str:
+        """
+        Returns the rendered value of the cell (row, col).
+
+        :return: the cell value including its escape codes.
+        :rtype: str
+        """
+        style = self.styles[row][col]
+        if style == NO_STYLE:
+            return self.chars[row][col]
+        if style == OVERFLOW_STYLE:
+            return self.overflow[(row, col)]
+        return self.prefixes[style] + self.chars[row][col] + colorama.Style.RESET_ALL
+
+    def pop_dirty(self) -> typing.Set[int]:
+        """
+        Returns the rows changed since the last call and resets the tracking.
+
+        :return: set of changed row indices.
+        :rtype: typing.Set[int]
+        """
+        dirty, self.dirty = self.dirty, set()
+        return dirty
+
+    def render_row(self, row: int, start: int = 0, stop: int = None) -> str:
+        """
+        Render a single row, emitting one escape sequence per run of equally styled cells.
+
+        :param row: row index (0 is the bottom row).
+        :type row: int
+        :param start: first column to render, defaults to 0.
+        :type start: int
+        :param stop: column to stop rendering at, defaults to None (the row end).
+        :type stop: int
+        :return: the rendered row.
+        :rtype: str
+        """
+        chars   = self.chars[row]
+        styles  = self.styles[row]
+        if start != 0 or stop is not None:
+            chars   = chars[start:stop]
+            styles  = styles[start:stop]
+        if not any(styles):
+            return chars.tounicode()
+        parts   = []
+        begin   = 0
+        for style, run in itertools.groupby(styles):
+            end = begin + sum(1 for _ in run)
+            if style == NO_STYLE:
+                parts.append(chars[begin:end].tounicode())
+            elif style == OVERFLOW_STYLE:
+                parts.extend(self.overflow[(row, start + col)] for col in range(begin, end))
+            else:
+                parts.append(self.prefixes[style] + chars[begin:end].tounicode() + colorama.Style.RESET_ALL)
+            begin = end
+        return ''.join(parts)
+
+    def render(self) -> typing.List[str]:
+        """
+        Render the whole canvas.
+
+        :return: list of rendered rows, top row first.
+        :rtype: typing.List[str]
+        """
+        return [self.render_row(row) for row in range(self.height - 1, -1, -1)]
@@ -0,0 +1,104 @@
+"""
+Charts module that contains the Histogram and Heatmap classes.
+Provides chart types built on the Graph canvas, counting raw observations without a VisualPoint per observation.
+"""
+import typing
+
+from . import binning
+from . import canvas
+from . import graph
+
+
+class Histogram(graph.Graph):
+    """
+    Histogram class is a Graph of vertical bars counting raw values per bucket.
+    Buckets are "nice" (see graph.nice_step), a value 'v' falls in the bucket 'round(v / step_x)'.
+    Bars intensity (count) may be mapped onto colors (from the lowest to the highest count, see binning.Colors).
+    """
+    def __init__(
+            self,
+            values      : typing.Iterable[float],
+            width       : int = 80,
+            height      : int = 20,
+            normalizer_x: int = 10,
+            normalizer_y: int = 10,
+            token       : str = '#',
+            colors      : binning.Colors = None,
+    ):
+        if len(token) != 1:
+            raise ValueError('token length must be of size 1')
+        values, low, high = graph._extent(values)
+        step_x, height_x, neg_height_x, unit_x = graph.axis_extents(low, high, width)
+        self.counts = binning.count_cells(values, step_x)
+        step_y, height_y, _, unit_y = graph.axis_extents(0, max(self.counts.values(), default=0), height)
+        super().__init__(
+            points          = [],
+            height_x        = height_x,
+            height_y        = height_y,
+            step_x          = step_x,
+            step_y          = step_y,
+            normalizer_x    = normalizer_x,
+            normalizer_y    = normalizer_y,
+            negative_x      = neg_height_x > 0,
+            negative_y      = False,
+            neg_height_x    = neg_height_x,
+            unit_x          = unit_x,
+            unit_y          = unit_y,
+        )
+        if colors:
+            count_levels    = binning.levels(self.counts, len(colors))
+            sids            = [self.canvas.style_id(code) for code in colors]
+        for x, count in self.counts.items():
+            sid = sids[count_levels[x]] if colors else canvas.NO_STYLE
+            # A non empty bucket always gets a visible bar.
+            bar = min(max(int(round(count / step_y)), 1), height_y)
+            col = x + self.neg_height_x
+            for y in range(1, bar + 1):
+                self.canvas.put(y, col, token, sid)
+
+
+class Heatmap(graph.Graph):
+    """
+    Heatmap class is a Graph whose cells are colored by the aggregated raw data falling in them.
+    The layout is computed from the data (see graph.Graph.auto), the aggregation is done by binning.bin_points.
+    Cells are colored by the basic density colors unless given 'colors', e.g. a truecolor color.Palette.gradient.
+    """
+    def __init__(
+            self,
+            xs          : typing.Iterable[float],
+            ys          : typing.Iterable[float],
+            values      : typing.Iterable[float] = None,
+            reducer     : binning.Reducer = binning.Reducer.COUNT,
+            width       : int = 80,
+            height      : int = 20,
+            normalizer_x: int = 10,
+            normalizer_y: int = 10,
+            token       : str = '█',
+            colors      : binning.Colors = None,
+    ):
+        xs, min_x, max_x = graph._extent(xs)
+        ys, min_y, max_y = graph._extent(ys)
+        step_x, height_x, neg_height_x, unit_x = graph.axis_extents(min_x, max_x, width)
+        step_y, height_y, neg_height_y, unit_y = graph.axis_extents(min_y, max_y, height)
+        super().__init__(
+            points          = [],
+            height_x        = height_x,
+            height_y        = height_y,
+            step_x          = step_x,
+            step_y          = step_y,
+            normalizer_x    = normalizer_x,
+            normalizer_y    = normalizer_y,
+            negative_x      = neg_height_x > 0,
+            negative_y      = neg_height_y > 0,
+            neg_height_x    = neg_height_x,
+            neg_height_y    = neg_height_y,
+            unit_x          = unit_x,
+            unit_y          = unit_y,
+        )
+        self.plot_binned(
+            xs, ys,
+            values  = values,
+            reducer = reducer,
+            tokens  = token,
+            colors  = colors if colors is not None else binning.density_colors(),
+        )
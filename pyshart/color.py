@@ -1,7 +1,8 @@
 import colorama
 import enum
+import functools
+import sys
 import typing
-colorama.init()
 
 COLORED_FORE_DESCRIPTION_MAP = dict(
     bla     = colorama.Fore.BLACK,
@@ -56,6 +57,182 @@ class ColorType(enum.Enum):
     BACK    = 2
     STYLE   = 3
 
+# colorama module holding the named codes of each color type.
+_COLORAMA_MODULES = {
+    ColorType.FORE  : 'Fore',
+    ColorType.BACK  : 'Back',
+    ColorType.STYLE : 'Style',
+}
+
+# SGR parameter introducing an extended (256 colors / truecolor) color of each color type.
+_EXTENDED_SGR = {
+    ColorType.FORE  : 38,
+    ColorType.BACK  : 48,
+}
+
+
+class Palette:
+    """
+    Palette class resolves colors once into compact integer ids.
+    Every shortcut and full name (of every color type) is mapped to an id, 'codes[id]' is the color code.
+    Id 0 is reserved for "no color" (an empty code). Canvases map the palette ids onto their own style indices.
+    """
+
+    def __init__(self):
+        self.codes  = ['']  # type: typing.List[str]
+        self._ids   = {}    # type: typing.Dict[typing.Tuple[ColorType, str], int]
+        self._codes = {'': 0}
+        descriptions = {
+            ColorType.FORE  : COLORED_FORE_DESCRIPTION_MAP,
+            ColorType.BACK  : COLORED_BACK_DESCRIPTION_MAP,
+            ColorType.STYLE : COLORED_STYLE_DESCRIPTION_MAP,
+        }
+        for ctype, module in _COLORAMA_MODULES.items():
+            m = getattr(colorama, module)
+            for name, code in vars(m).items():
+                if name.isupper():
+                    self._ids[(ctype, name)] = self.register(code)
+            for key, code in descriptions[ctype].items():
+                self._ids[(ctype, key)] = self.register(code)
+
+    def register(self, code: str) -> int:
+        """
+        Returns (and registers if needed) the id of the given color code.
+
+        :param code: color code (escape sequence).
+        :type code: str
+        :rtype: int
+        """
+        cid = self._codes.get(code)
+        if cid is None:
+            cid = len(self.codes)
+            self.codes.append(code)
+            self._codes[code] = cid
+        return cid
+
+    def id(self, key: str, ctype: ColorType = ColorType.FORE) -> int:
+        """
+        Returns the id of a color by string shortcut or full string.
+
+        :param key: color shortcut key or full string (case insensitive).
+        :type key: str
+        :param ctype: color type (fore/back/style), defaults to ColorType.FORE
+        :type ctype: ColorType
+        :raises KeyError: unknown color.
+        :rtype: int
+        """
+        cid = self._ids.get((ctype, key))
+        if cid is None:
+            cid = self._ids.get((ctype, key.upper()))
+            if cid is None:
+                raise KeyError(f'unknown color {key} of type {_COLORAMA_MODULES.get(ctype, ctype)}')
+        return cid
+
+    def code(self, cid: int) -> str:
+        """
+        Returns the color code of the given id.
+
+        :rtype: str
+        """
+        return self.codes[cid]
+
+    def xterm(self, index: int, ctype: ColorType = ColorType.FORE) -> int:
+        """
+        Returns the id of a color from the 256 colors table.
+
+        :param index: color index (0-255).
+        :type index: int
+        :param ctype: color type (fore/back), defaults to ColorType.FORE
+        :type ctype: ColorType
+        :raises ValueError: the index is out of range.
+        :rtype: int
+        """
+        if not 0 <= index <= 255:
+            raise ValueError(f'illegal 256 colors index {index}')
+        return self.register(f'\x1b[{_EXTENDED_SGR[ctype]};5;{index}m')
+
+    def rgb(self, red: int, green: int, blue: int, ctype: ColorType = ColorType.FORE) -> int:
+        """
+        Returns the id of a truecolor color.
+
+        :param red: red component (0-255).
+        :type red: int
+        :param green: green component (0-255).
+        :type green: int
+        :param blue: blue component (0-255).
+        :type blue: int
+        :param ctype: color type (fore/back), defaults to ColorType.FORE
+        :type ctype: ColorType
+        :raises ValueError: a component is out of range.
+        :rtype: int
+        """
+        if not all(0 <= component <= 255 for component in (red, green, blue)):
+            raise ValueError(f'illegal truecolor color ({red}, {green}, {blue})')
+        return self.register(f'\x1b[{_EXTENDED_SGR[ctype]};2;{red};{green};{blue}m')
+
+    def gradient(
+            self,
+            start   : typing.Tuple[int, int, int],
+            stop    : typing.Tuple[int, int, int],
+            steps   : int,
+            ctype   : ColorType = ColorType.FORE,
+    ) -> typing.List[int]:
+        """
+        Returns the ids of a linear truecolor gradient from 'start' to 'stop' (both included).
+
+        :param start: first (red, green, blue) color.
+        :type start: typing.Tuple[int, int, int]
+        :param stop: last (red, green, blue) color.
+        :type stop: typing.Tuple[int, int, int]
+        :param steps: number of colors.
+        :type steps: int
+        :param ctype: color type (fore/back), defaults to ColorType.FORE
+        :type ctype: ColorType
+        :rtype: typing.List[int]
+        """
+        if steps == 1:
+            return [self.rgb(*start, ctype=ctype)]
+        return [
+            self.rgb(*(round(a + (b - a) * i / (steps - 1)) for a, b in zip(start, stop)), ctype=ctype)
+            for i in range(steps)
+        ]
+
+
+_PALETTE = None # type: typing.Optional[Palette]
+
+# Whether the standard streams were prepared for colored output (see 'init').
+_INITIALIZED = False
+
+
+def init() -> None:
+    """
+    Prepare the terminal for colored output, once (called on the first render to a standard stream).
+    Only Windows consoles need it (colorama enables their escape codes support, or translates the escape codes),
+    other terminals get the raw escape codes: the standard streams are not wrapped.
+
+    :rtype: None
+    """
+    global _INITIALIZED
+    if _INITIALIZED:
+        return
+    _INITIALIZED = True
+    if sys.platform == 'win32':
+        # 'just_fix_windows_console' exists since colorama 0.4.6, older versions wrap the streams.
+        getattr(colorama, 'just_fix_windows_console', colorama.init)()
+
+
+def get_palette() -> Palette:
+    """
+    Returns the shared palette (built on first use).
+
+    :rtype: Palette
+    """
+    global _PALETTE
+    if _PALETTE is None:
+        _PALETTE = Palette()
+    return _PALETTE
+
+
 def get_color(key: str, ctype: ColorType = None) -> str:
     """
     Returns color code (from colorama) by string shortcut or full string.
@@ -70,47 +247,61 @@ def get_color(key: str, ctype: ColorType = None) -> str:
 
     if ctype is None:
         ctype = ColorType.FORE
-
-    def _get_color(key: str, ctype: str, kmap: typing.Dict) -> str:
-        if key in kmap:
-            return kmap[key]
-        m = getattr(colorama, ctype)
-        try:
-            return getattr(m, key.upper())
-        except AttributeError:
-            raise KeyError(f'unknown color {key} of type {ctype}')
-    
-    if ctype == ColorType.FORE:
-        return _get_color(key, 'Fore', COLORED_FORE_DESCRIPTION_MAP)
-    elif ctype == ColorType.BACK:
-        return _get_color(key, 'Back', COLORED_BACK_DESCRIPTION_MAP)
-    elif ctype == ColorType.STYLE:
-        return _get_color(key, 'Style', COLORED_STYLE_DESCRIPTION_MAP)
-    else:
+    if ctype not in _COLORAMA_MODULES:
         raise ValueError(f'unknown color type {ctype}')
+    palette = get_palette()
+    return palette.codes[palette.id(key, ctype)]
+
+
+# Interned escape codes prefixes shared by all the ColoredString instances, keyed by (fore, back, style).
+_PREFIXES = {}  # type: typing.Dict[typing.Tuple[str, str, str], str]
+
+
+def get_prefix(fore: str = None, back: str = None, style: str = None) -> str:
+    """
+    Returns the interned escape codes prefix (fore + back + style) of the given color codes.
+
+    :param fore: fore color code, defaults to None
+    :type fore: str, optional
+    :param back: back color code, defaults to None
+    :type back: str, optional
+    :param style: style code, defaults to None
+    :type style: str, optional
+    :return: the escape codes prefix.
+    :rtype: str
+    """
+    key = (fore, back, style)
+    prefix = _PREFIXES.get(key)
+    if prefix is None:
+        prefix = sys.intern((fore or '') + (back or '') + (style or ''))
+        _PREFIXES[key] = prefix
+    return prefix
 
 
 class ColoredString(str):
     """
     ColoredString object that wraps string and let you change it colors easily.
+    ColoredString is immutable, its rendered form is computed once on construction.
     """
 
     def __new__(cls, value, *args, **kwargs):
         return super().__new__(cls, value)
 
     def __init__(self, value, fore=None, back=None, style=None):
-        self.value  = value
-        self.fore   = fore
-        self.back   = back
-        self.style  = style
-
-    @property
-    def _value(self) -> str:
-        fore    = self.fore                 if self.fore    is not None else ''
-        back    = self.back                 if self.back    is not None else ''
-        style   = self.style                if self.style   is not None else ''
-        end     = colorama.Style.RESET_ALL  if any([fore, back, style]) else ''
-        return fore + back + style + self.value + end
+        prefix = get_prefix(fore, back, style)
+        set_attr = super().__setattr__
+        set_attr('value',   value)
+        set_attr('fore',    fore)
+        set_attr('back',    back)
+        set_attr('style',   style)
+        set_attr('prefix',  prefix)
+        set_attr('_end',    colorama.Style.RESET_ALL if prefix else '')
+        set_attr('_value',  prefix + value + self._end)
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        raise AttributeError('ColoredString is immutable')
+
+    __delattr__ = __setattr__
 
     def __str__(self) -> str:
         return self._value
@@ -131,15 +322,25 @@ class ColoredString(str):
     def __mul__(self, other: int) -> str:
         if not isinstance(other, int):
             raise TypeError('can\'t multiply sequence by non-int of type \'{type(other)}\'')
-        # In order to return a string with the color prefix and not multiple prefixes we create new ColoredString and take its value.
-        return ColoredString(
-            value   = self.value * other,
-            fore    = self.fore,
-            back    = self.back,
-            style   = self.style,
-        )._value
+        # A single color prefix for the whole multiplied string (and not multiple prefixes).
+        return self.prefix + self.value * other + self._end
 
     __rmul__ = __mul__
 
 
+@functools.lru_cache(maxsize=4096)
+def colored(value: str, fore: str = None, back: str = None, style: str = None) -> ColoredString:
+    """
+    Returns a (cached) ColoredString, repeated tokens of the same color share a single instance.
 
+    :param value: the string to color.
+    :type value: str
+    :param fore: fore color code, defaults to None
+    :type fore: str, optional
+    :param back: back color code, defaults to None
+    :type back: str, optional
+    :param style: style code, defaults to None
+    :type style: str, optional
+    :rtype: ColoredString
+    """
+    return ColoredString(value, fore, back, style)
@@ -0,0 +1,191 @@
+"""
+Dashboard module that contains the Dashboard class.
+Provides a grid (small multiples) layout composing several graphs into one frame, straight from their canvas rows.
+"""
+import typing
+
+from . import graph
+from . import render
+
+# A frame line segment: (panel key, canvas row, padding) for a graph row, (None, text, width) for a title or blank.
+Segment = typing.Tuple[typing.Optional[typing.Tuple[int, int]], typing.Any, int]
+
+
+def _scale(panel: graph.Graph, axis: str) -> typing.Tuple[typing.Any, ...]:
+    """
+    Returns what an axis labels depend on: its step, unit, normalizer and extents.
+
+    :rtype: typing.Tuple[typing.Any, ...]
+    """
+    return tuple(getattr(panel, name + axis) for name in ('step_', 'unit_', 'normalizer_', 'height_', 'neg_height_'))
+
+
+class Dashboard:
+    """
+    Dashboard class lays out graphs in rows and columns and composes them into a single frame.
+    Panels rows are rendered once and cached, only the rows changed since the last frame are rendered again.
+    A Dashboard can be drawn like a Graph (see render.render) and refreshed by live.LiveRenderer.
+    'gap' is the number of spaces between columns (and of blank lines between rows),
+    'share_x' shows the x axis row only on the bottom panels (when it is their bottom row),
+    'share_y' shows the y axis column only on the left panels (when it is their first column),
+    panels sharing an axis (same grid column for 'x', same grid row for 'y') must have the same scale on it.
+    """
+    def __init__(self, gap: int = 2, share_x: bool = False, share_y: bool = False):
+        self.gap         = gap
+        self.share_x     = share_x
+        self.share_y     = share_y
+        self.panels      = {}   # type: typing.Dict[typing.Tuple[int, int], typing.Tuple[graph.Graph, typing.Optional[str]]]
+        self._lines      = []   # type: typing.List[typing.List[Segment]]
+        self._frame_rows = {}   # type: typing.Dict[typing.Tuple[typing.Tuple[int, int], int], int]
+        self._starts     = {}   # type: typing.Dict[typing.Tuple[int, int], int]
+        self._cache      = {}   # type: typing.Dict[typing.Tuple[int, int], typing.Dict[int, str]]
+        self._dirty      = set()    # type: typing.Set[int]
+
+    @property
+    def height(self) -> int:
+        """
+        Number of lines of the composed frame.
+
+        :rtype: int
+        """
+        return len(self._lines)
+
+    def add(self, panel: graph.Graph, row: int, col: int, title: str = None) -> None:
+        """
+        Place a graph in the grid cell (row, col), replacing any graph already there.
+
+        :param panel: the graph to place.
+        :type panel: graph.Graph
+        :param row: grid row (0 is the top row).
+        :type row: int
+        :param col: grid column (0 is the left column).
+        :type col: int
+        :param title: panel title (shown above the panel), defaults to None.
+        :type title: str, optional
+        :raises ValueError: the panel scale differs from the panels it shares an axis with.
+        :rtype: None
+        """
+        for (other_row, other_col), (other, _) in self.panels.items():
+            if (other_row, other_col) == (row, col):
+                continue
+            if self.share_x and other_col == col and _scale(other, 'x') != _scale(panel, 'x'):
+                raise ValueError(f'panel ({row}, {col}) does not share the x axis of panel ({other_row}, {other_col})')
+            if self.share_y and other_row == row and _scale(other, 'y') != _scale(panel, 'y'):
+                raise ValueError(f'panel ({row}, {col}) does not share the y axis of panel ({other_row}, {other_col})')
+        self.panels[(row, col)] = (panel, title)
+        self._cache[(row, col)] = {}
+        panel.pop_dirty()
+        self._layout()
+
+    def _layout(self) -> None:
+        """
+        Compute the frame lines segments of the current panels.
+
+        :rtype: None
+        """
+        grid_rows   = sorted({row for row, _ in self.panels})
+        grid_cols   = sorted({col for _, col in self.panels})
+        self._starts = {
+            (row, col): 1 if self.share_y and col != grid_cols[0] and panel.neg_height_x == 0 else 0
+            for (row, col), (panel, _) in self.panels.items()
+        }
+        widths = {
+            col: max(
+                max(panel.width - self._starts[key], len(title or ''))
+                for key, (panel, title) in self.panels.items() if key[1] == col
+            )
+            for col in grid_cols
+        }
+        lines = []  # type: typing.List[typing.List[Segment]]
+        for index, grid_row in enumerate(grid_rows):
+            if index and self.gap:
+                lines.append([(None, '', 0)])
+            keys = [(grid_row, col) for col in grid_cols]
+            rows = {}
+            for key in keys:
+                if key not in self.panels:
+                    continue
+                panel = self.panels[key][0]
+                skip_axis = self.share_x and index != len(grid_rows) - 1 and panel.neg_height_y == 0
+                rows[key] = [r for r in range(panel.height - 1, -1, -1) if not (skip_axis and r == 0)]
+            if any(self.panels[key][1] for key in rows):
+                lines.append([(None, (self.panels[key][1] or '') if key in rows else '', widths[key[1]]) for key in keys])
+            for i in range(max(len(panel_rows) for panel_rows in rows.values())):
+                line = []
+                for key in keys:
+                    if key in rows and i < len(rows[key]):
+                        panel = self.panels[key][0]
+                        line.append((key, rows[key][i], widths[key[1]] - (panel.width - self._starts[key])))
+                    else:
+                        line.append((None, '', widths[key[1]]))
+                lines.append(line)
+        self._lines         = lines
+        self._frame_rows    = {
+            (key, canvas_row): len(lines) - 1 - index
+            for index, line in enumerate(lines) for key, canvas_row, _ in line if key is not None
+        }
+        self._dirty         = set(range(len(lines)))
+
+    def _panel_row(self, key: typing.Tuple[int, int], row: int) -> str:
+        """
+        Returns the (cached) rendered canvas row of a panel.
+
+        :rtype: str
+        """
+        cache = self._cache[key]
+        line = cache.get(row)
+        if line is None:
+            line = cache[row] = self.panels[key][0]._draw_row(row, self._starts[key])
+        return line
+
+    def pop_dirty(self) -> typing.Set[int]:
+        """
+        Returns the frame lines changed since the last call, re-rendering only the changed panels rows.
+
+        :return: set of changed frame rows (0 is the bottom line).
+        :rtype: typing.Set[int]
+        """
+        dirty, self._dirty = self._dirty, set()
+        for key, (panel, _) in self.panels.items():
+            cache = self._cache[key]
+            for row in panel.pop_dirty():
+                cache.pop(row, None)
+                frame_row = self._frame_rows.get((key, row))
+                if frame_row is not None:
+                    dirty.add(frame_row)
+        return dirty
+
+    def _draw_row(self, row: int) -> str:
+        """
+        Create the string that represents a single frame line.
+
+        :param row: frame row (0 is the bottom line).
+        :type row: int
+        :rtype: str
+        """
+        parts = []
+        for key, value, padding in self._lines[len(self._lines) - 1 - row]:
+            if key is None:
+                parts.append(value.ljust(padding))
+            else:
+                parts.append(self._panel_row(key, value) + ' ' * padding)
+        return (' ' * self.gap).join(parts).rstrip(' ')
+
+    def _draw(self) -> typing.List[str]:
+        """
+        Create a list of strings that represents the frame.
+
+        :return: list of strings representing lines within the frame.
+        :rtype: typing.List[str]
+        """
+        self.pop_dirty()
+        return [self._draw_row(row) for row in range(self.height - 1, -1, -1)]
+
+    def draw(self, target: typing.Any = None, fmt: render.Format = render.Format.ANSI) -> None:
+        """
+        Draw the composed frame to the screen (or to any other target, see render.render).
+
+        :rtype: None
+        """
+        self.pop_dirty()
+        render.render(self, target=target, fmt=fmt)
@@ -1,13 +1,21 @@
 """
-Graph module that contains the Graph class and the Point namedtuple.
+Graph module that contains the Graph class and the Point dataclasses.
 Provides utilities to save and format graph information.
 """
+import array
 import dataclasses
 import enum
 import math
+import operator
 import typing
 
+from . import binning
+from . import canvas
 from . import color
+from . import instrument
+from . import raster
+from . import render
+from . import subcell
 
 
 class Quarter(enum.IntFlag):
@@ -32,11 +40,45 @@ class Quarter(enum.IntFlag):
         :return: The closet quarter (sub-plane).
         :rtype: Quarter.
         """
-        if self.name is None:
+        # Composite values are not members (their name is None, or the joined names since python 3.11).
+        if self.name not in Quarter.__members__:
             return Quarter.WHOLE_PLANE
         return self
 
 
+def get_quarter(x: int, y: int) -> Quarter:
+    """
+    Returns the quarter of the given 'x' and 'y' values.
+
+    :rtype: Quarter
+    """
+    if x >= 0:
+        return Quarter.QUARTER1 if y >= 0 else Quarter.QUARTER4
+    return Quarter.QUARTER2 if y > 0 else Quarter.QUARTER3
+
+
+def _slotted(cls: type) -> type:
+    """
+    Recreate a dataclass with '__slots__' holding its own fields (dataclasses 'slots' argument exists only since python 3.10).
+
+    :param cls: dataclass to recreate.
+    :type cls: type
+    :return: the slotted dataclass.
+    :rtype: type
+    """
+    inherited   = {name for base in cls.__mro__[1:] for name in getattr(base, '__slots__', ())}
+    cls_dict    = dict(cls.__dict__)
+    names       = tuple(field.name for field in dataclasses.fields(cls) if field.name not in inherited)
+    for name in names:
+        # Defaults are already captured by the generated __init__.
+        cls_dict.pop(name, None)
+    cls_dict.pop('__dict__', None)
+    cls_dict.pop('__weakref__', None)
+    cls_dict['__slots__'] = names
+    return type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+
+@_slotted
 @dataclasses.dataclass
 class Point:
     """
@@ -44,19 +86,15 @@ class Point:
     """
     x: int
     y: int
-    quarter: int = dataclasses.field(init=False)
-
-    def __post_init__(self) -> None:
-        if self.x >= 0:
-            if self.y >= 0:
-                self.quarter = Quarter.QUARTER1
-            else:
-                self.quarter = Quarter.QUARTER4
-        if self.x < 0:
-            if self.y > 0:
-                self.quarter = Quarter.QUARTER2
-            else:
-                self.quarter = Quarter.QUARTER3
+
+    @property
+    def quarter(self) -> Quarter:
+        """
+        The quarter of the point (computed on demand).
+
+        :rtype: Quarter
+        """
+        return get_quarter(self.x, self.y)
 
     def __mul__(self, multiplier: int) -> 'Point':
         """
@@ -85,6 +123,7 @@ class Point:
         self.y *= y
         return self
 
+@_slotted
 @dataclasses.dataclass
 class VisualPoint(Point):
     """
@@ -96,8 +135,6 @@ class VisualPoint(Point):
     style : str = ''
 
     def __post_init__(self):
-        # Interesting, if you do not call explicitly your super __post_init__ function it won't be invoked...
-        super().__post_init__()
         if len(self.token) != 1:
             raise ValueError('token length must be of size 1')
 
@@ -108,17 +145,169 @@ class VisualPoint(Point):
         :rtype: color.ColoredString
         """
 
-        return color.ColoredString(
-            value   = self.token, 
+        return color.colored(
+            value   = self.token,
             fore    = self.fore,
             back    = self.back,
             style   = self.style,
         )
 
 
+class PointArray:
+    """
+    PointArray class holds many points as parallel 'x' and 'y' arrays (struct of arrays).
+    It can be plotted at once with 'Graph.plot_many(points.xs, points.ys)'.
+    """
+
+    def __init__(self, xs: typing.Iterable[int] = (), ys: typing.Iterable[int] = ()):
+        self.xs = array.array('l', xs)
+        self.ys = array.array('l', ys)
+        if len(self.xs) != len(self.ys):
+            raise ValueError('xs and ys must be of the same length')
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def __iter__(self) -> typing.Iterator[typing.Tuple[int, int]]:
+        return zip(self.xs, self.ys)
+
+    def __getitem__(self, index: int) -> Point:
+        return Point(self.xs[index], self.ys[index])
+
+    def append(self, x: int, y: int) -> None:
+        """
+        Append a single point.
+
+        :rtype: None
+        """
+        self.xs.append(x)
+        self.ys.append(y)
+
+    def extend(self, xs: typing.Iterable[int], ys: typing.Iterable[int]) -> None:
+        """
+        Append many points given as parallel 'x' and 'y' values.
+
+        :rtype: None
+        """
+        xs = array.array('l', xs)
+        ys = array.array('l', ys)
+        if len(xs) != len(ys):
+            raise ValueError('xs and ys must be of the same length')
+        self.xs.extend(xs)
+        self.ys.extend(ys)
+
+    def quarters(self) -> typing.List[Quarter]:
+        """
+        Returns the quarter of every point.
+
+        :rtype: typing.List[Quarter]
+        """
+        return list(map(get_quarter, self.xs, self.ys))
+
+
+def nice_step(span: float, cells: int) -> float:
+    """
+    Returns the smallest "nice" step (1, 2 or 5 times a power of 10) covering 'span' within 'cells' cells.
+
+    :param span: the range to cover.
+    :type span: float
+    :param cells: the number of cells available.
+    :type cells: int
+    :rtype: float
+    """
+    if span <= 0 or cells <= 0:
+        return 1
+    raw         = span / cells
+    magnitude   = 10 ** math.floor(math.log10(raw))
+    for multiplier in (1, 2, 5, 10):
+        step = multiplier * magnitude
+        # Rounding errors of the magnitude must not pick the next multiplier.
+        if step >= raw * (1 - 1e-9):
+            return int(step) if step >= 1 else step
+    return 10 * magnitude
+
+
+def axis_extents(low: float, high: float, cells: int) -> typing.Tuple[float, int, int, float]:
+    """
+    Returns the layout of an axis covering [low, high] (and the origin) within 'cells' cells.
+
+    :param low: lowest value on the axis.
+    :type low: float
+    :param high: highest value on the axis.
+    :type high: float
+    :param cells: number of cells available (including the origin).
+    :type cells: int
+    :return: the axis (step, height, negative height, labels unit).
+    :rtype: typing.Tuple[float, int, int, float]
+    """
+    low     = min(low, 0)
+    high    = max(high, 0)
+    step    = nice_step(high - low, cells - 1)
+    while True:
+        # Both sides are rounded up (the tolerance absorbs the division errors), the next nice step is taken
+        # when they don't fit together (a step covering the span always fits both within 3 cells).
+        height      = math.ceil(high / step - 1e-9)
+        neg_height  = math.ceil(-low / step - 1e-9)
+        if height + neg_height + 1 <= cells or step >= high - low:
+            break
+        step = nice_step(step * 1.01, 1)
+    return step, height, neg_height, 10 ** math.floor(math.log10(step))
+
+
+# array.array typecodes of integer items.
+_INT_TYPECODES = frozenset('bBhHiIlLqQ')
+
+
+def _check_array(values: typing.Sequence[int]) -> None:
+    """
+    Check that numpy arrays and array.array hold integers (other sequences are checked by '_int_cells').
+
+    :raises TypeError: if the array items are not integers (e.g. floats, see Graph.plot_binned for raw data values).
+    :rtype: None
+    """
+    dtype = getattr(values, 'dtype', None)
+    if dtype is not None and dtype.kind not in 'iu':
+        raise TypeError(f'points coordinates must be integers, not {dtype}')
+    if isinstance(values, array.array) and values.typecode not in _INT_TYPECODES:
+        raise TypeError(f"points coordinates must be integers, not array '{values.typecode}'")
+
+
+def _int_cells(cells: typing.Set[typing.Tuple[int, int]]) -> typing.Set[typing.Tuple[int, int]]:
+    """
+    Returns the (distinct) cells with int coordinates, integral values (e.g. numpy integer scalars) are converted.
+
+    :raises TypeError: if a coordinate is not an integer (e.g. a float, see Graph.plot_binned for raw data values).
+    :rtype: typing.Set[typing.Tuple[int, int]]
+    """
+    cell_xs, cell_ys = zip(*cells)
+    if set(map(type, cell_xs)) | set(map(type, cell_ys)) <= {int}:
+        return cells
+    try:
+        return set(zip(map(operator.index, cell_xs), map(operator.index, cell_ys)))
+    except TypeError as error:
+        raise TypeError(f'points coordinates must be integers ({error})') from None
+
+
+def _extent(values: typing.Iterable[float]) -> typing.Tuple[typing.Sequence[float], float, float]:
+    """
+    Returns the values (as a sequence) and their minimum and maximum (0 for no values).
+
+    :rtype: typing.Tuple[typing.Sequence[float], float, float]
+    """
+    if not isinstance(values, typing.Sized):
+        values = list(values)
+    if len(values) == 0:
+        return values, 0, 0
+    return values, min(values), max(values)
+
+
 class Graph:
     """
     Graph class to store information about a graph, format it and draw it contents to the screen.
+    A lazy graph only records its axes and points: a row is written (labels and points) when first read,
+    the whole canvas when first accessed, and invalid points raise on the first access instead of the construction.
+    Points, plot_many, plot_line and plot_subcell take cell coordinates (a cell spans 'step' units) unless 'data' is set,
+    plot_binned and Graph.auto take data values (divided by the steps).
 
     :raises IndexError: illegal access to the underlying array (index out of bounds).
     """
@@ -132,10 +321,13 @@ class Graph:
             normalizer_x: int,
             normalizer_y: int,
             negative_x: bool,
-            negative_y: bool
+            negative_y: bool,
+            neg_height_x: int = None,
+            neg_height_y: int = None,
+            unit_x: float = 1,
+            unit_y: float = 1,
+            lazy: bool = False,
     ):
-        # TODO: (Daniel) Replace negative vars with get pos_width, neg_width, pos_height, neg_height with default values.
-        #                The main reason is that the graph may not be symmetric.
         self.points   = points
         self.height_x = height_x
         self.height_y = height_y
@@ -143,69 +335,674 @@ class Graph:
         self.step_y = step_y
         self.normalizer_x = normalizer_x
         self.normalizer_y = normalizer_y
-        self.negative_x = negative_x
-        self.negative_y = negative_y
-        self.width = (height_x*2 if negative_x else height_x) + 1
-        self.height = (height_y*2 if negative_y else height_y) + 1
-        self.graph = [[' ']*(self.width) for _ in range(self.height)]
-        self[(0, 0)] = '0'
+        # Labels are the axes values in multiples of the units (normalized).
+        self.unit_x = unit_x
+        self.unit_y = unit_y
+        # The negative extents default to the positive ones (a symmetric graph), they may differ for one-sided data.
+        if neg_height_x is None:
+            neg_height_x = height_x if negative_x else 0
+        if neg_height_y is None:
+            neg_height_y = height_y if negative_y else 0
+        self.neg_height_x = neg_height_x
+        self.neg_height_y = neg_height_y
+        self.negative_x = neg_height_x > 0
+        self.negative_y = neg_height_y > 0
+        self.width = height_x + self.neg_height_x + 1
+        self.height = height_y + self.neg_height_y + 1
+        self.lazy = lazy
+        # Rows not written yet and the points of each row (lazy graphs only).
+        self._pending = set()   # type: typing.Set[int]
+        self._row_points = {}   # type: typing.Dict[int, typing.List[typing.Tuple[int, VisualPoint]]]
+        if lazy:
+            # The 'canvas' attribute is set once every row is written (see '__getattr__').
+            self._canvas = None # type: typing.Optional[canvas.Canvas]
+            self._pending = set(range(self.height))
+            return
+        self.canvas = self._canvas = canvas.Canvas(width=self.width, height=self.height)
+
+        with instrument.phase(instrument.LABELS):
+            self._label_axes()
+
+        profile = instrument.active()
+        if profile is not None:
+            self._plot_points_profiled(profile)
+            return
+        for point in self.points:
+            # Collisions are not solved here (last point overrides), use 'plot_binned' to aggregate them.
+            self[point] = point.tokenize()
+
+    def _labels(self) -> typing.Tuple[typing.List[str], typing.List[str]]:
+        """
+        Format the axes labels, from the origin outwards (labels are shared by both sides of each axis).
+
+        :return: the 'x' and 'y' labels.
+        :rtype: typing.Tuple[typing.List[str], typing.List[str]]
+        """
+        labels_x = [str(int(round(self.step_x * (i+1) / self.unit_x, 9)) % self.normalizer_x) for i in range(max(self.height_x, self.neg_height_x))]
+        labels_y = [str(int(round(self.step_y * (i+1) / self.unit_y, 9)) % self.normalizer_y) for i in range(max(self.height_y, self.neg_height_y))]
+        return labels_x, labels_y
+
+    def _label_axes(self) -> None:
+        """
+        Write the axes and their labels to the canvas.
 
+        :rtype: None
+        """
+        labels_x, labels_y = self._labels()
+        axis_row, axis_col = self.neg_height_y, self.neg_height_x
+        put = self._canvas.put
+        put(axis_row, axis_col, '0')
         for i in range(self.height_x):
-            self[(i+1, 0)] = str(int(self.step_x * (i+1)) % self.normalizer_x)
-            if self.negative_x:
-                self[(-(i+1), 0)] = str(int(self.step_x * (i+1)) % self.normalizer_x)
+            put(axis_row, axis_col + i + 1, labels_x[i])
+        for i in range(self.neg_height_x):
+            put(axis_row, axis_col - i - 1, labels_x[i])
         for i in range(self.height_y):
-            self[(0, i+1)] = str(int(self.step_y * (i+1)) % self.normalizer_y)
-            if self.negative_y:
-                self[(0, -(i+1))] = str(int(self.step_y * (i+1)) % self.normalizer_y)
+            put(axis_row + i + 1, axis_col, labels_y[i])
+        for i in range(self.neg_height_y):
+            put(axis_row - i - 1, axis_col, labels_y[i])
+
+    def __getattr__(self, name: str) -> typing.Any:
+        # Only called for missing attributes: the canvas of a lazy graph is written on first access.
+        if name != 'canvas' or '_pending' not in self.__dict__:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        self._write_rows(list(self._pending))
+        return self._canvas
+
+    def _allocate(self) -> canvas.Canvas:
+        """
+        Create the canvas of a lazy graph and dispatch its points to their rows (no row is written yet).
 
+        :raises IndexError: if a point has an illegal index (negative / out of bounds).
+        :return: the canvas.
+        :rtype: canvas.Canvas
+        """
+        if self._canvas is None:
+            row_points = {}     # type: typing.Dict[int, typing.List[typing.Tuple[int, VisualPoint]]]
+            for (row, col), point in zip(self._validate_points(instrument.active()), self.points):
+                row_points.setdefault(row, []).append((col, point))
+            self._row_points    = row_points
+            self._axis_labels   = self._labels()
+            self._canvas        = canvas.Canvas(width=self.width, height=self.height)
+        return self._canvas
+
+    def _write_rows(self, rows: typing.Iterable[int]) -> canvas.Canvas:
+        """
+        Write the labels and points of the given rows of a lazy graph, rows already written are skipped.
+
+        :param rows: canvas rows indices (0 is the bottom row).
+        :type rows: typing.Iterable[int]
+        :return: the canvas.
+        :rtype: canvas.Canvas
+        """
+        cells = self._allocate()
+        labels_x, labels_y = self._axis_labels
+        axis_row, axis_col = self.neg_height_y, self.neg_height_x
+        profile = instrument.active()
+        with instrument.phase(instrument.POINTS):
+            for row in rows:
+                if row not in self._pending:
+                    continue
+                self._pending.discard(row)
+                if row == axis_row:
+                    cells.put(row, axis_col, '0')
+                    for i in range(self.height_x):
+                        cells.put(row, axis_col + i + 1, labels_x[i])
+                    for i in range(self.neg_height_x):
+                        cells.put(row, axis_col - i - 1, labels_x[i])
+                else:
+                    cells.put(row, axis_col, labels_y[abs(row - axis_row) - 1])
+                for col, point in self._row_points.pop(row, ()):
+                    if profile is not None:
+                        profile.counts[instrument.PLOTTED] += 1
+                        if not cells.is_blank(row, col):
+                            profile.counts[instrument.COLLISIONS] += 1
+                    self._put(row, col, point.tokenize())
+        if not self._pending:
+            self.canvas = cells
+        return cells
+
+    def _plot_points_profiled(self, profile: instrument.Profile) -> None:
+        """
+        Plot the constructor points like the regular path does, measuring each phase and counting the work.
+
+        :param profile: the active profile.
+        :type profile: instrument.Profile
+        :raises IndexError: if a point has an illegal index (every illegal point is counted first, nothing is written).
+        :rtype: None
+        """
+        with profile.phase(instrument.TOKENIZE):
+            tokens = [point.tokenize() for point in self.points]
+        with profile.phase(instrument.POINTS):
+            cells = self._validate_points(profile)
+            is_blank = self._canvas.is_blank
+            for (row, col), token in zip(cells, tokens):
+                if not is_blank(row, col):
+                    profile.counts[instrument.COLLISIONS] += 1
+                self._put(row, col, token)
+            profile.counts[instrument.PLOTTED] += len(cells)
+
+    def _validate_points(self, profile: typing.Optional[instrument.Profile]) -> typing.List[typing.Tuple[int, int]]:
+        """
+        Returns the canvas (row, col) of the constructor points, counting the illegal ones when profiling.
+
+        :raises IndexError: if a point has an illegal index (the first one is raised once all are counted).
+        :rtype: typing.List[typing.Tuple[int, int]]
+        """
+        cells = []
+        error = None
         for point in self.points:
-            # Meanwhile collisions are not solved (last point overrides).
-            # TODO: (Daniel): Solve collisions.
-            self[point] = str(point.tokenize())
+            try:
+                cells.append(self._transform_true_point(*self._validate_point(point)))
+            except IndexError as exc:
+                if profile is None:
+                    raise
+                profile.counts[instrument.CLIPPED] += 1
+                error = error or exc
+        if error is not None:
+            raise error
+        return cells
 
-    def __getitem__(self, point: Point) -> str:
-        point = self._validate_point(point=point)
-        point = self._transform_true_point(point=point)
-        return self.graph[point.x][point.y]
+    @classmethod
+    def auto(
+            cls,
+            xs          : typing.Iterable[float],
+            ys          : typing.Iterable[float],
+            width       : int = 80,
+            height      : int = 20,
+            normalizer_x: int = 10,
+            normalizer_y: int = 10,
+            token       : str = 'X',
+            fore        : str = '',
+            back        : str = '',
+            style       : str = '',
+    ) -> 'Graph':
+        """
+        Create a graph whose extents and steps are computed from the data, and plot the data.
+        Extents are asymmetric (one-sided data gets no negative side) and steps are "nice" (see 'nice_step'),
+        labels are in units of the steps power of 10 (e.g. a step of 2000 is labeled 2, 4, 6...).
 
-    def __setitem__(self, point: Point, char: str) -> None:
-        point = self._validate_point(point=point)
-        point = self._transform_true_point(point=point)
-        self.graph[point.x][point.y] = char
+        :param xs: raw 'x' values.
+        :type xs: typing.Iterable[float]
+        :param ys: raw 'y' values, parallel to 'xs'.
+        :type ys: typing.Iterable[float]
+        :param width: maximal number of columns, defaults to 80.
+        :type width: int
+        :param height: maximal number of rows, defaults to 20.
+        :type height: int
+        :param normalizer_x: 'x' labels normalizer, defaults to 10.
+        :type normalizer_x: int
+        :param normalizer_y: 'y' labels normalizer, defaults to 10.
+        :type normalizer_y: int
+        :param token: the points token, defaults to 'X'.
+        :type token: str
+        :param fore: fore color code, defaults to ''.
+        :type fore: str
+        :param back: back color code, defaults to ''.
+        :type back: str
+        :param style: style code, defaults to ''.
+        :type style: str
+        :return: the plotted graph.
+        :rtype: Graph
+        """
+        xs, min_x, max_x = _extent(xs)
+        ys, min_y, max_y = _extent(ys)
+        step_x, height_x, neg_height_x, unit_x = axis_extents(min_x, max_x, width)
+        step_y, height_y, neg_height_y, unit_y = axis_extents(min_y, max_y, height)
+        graph = cls(
+            points          = [],
+            height_x        = height_x,
+            height_y        = height_y,
+            step_x          = step_x,
+            step_y          = step_y,
+            normalizer_x    = normalizer_x,
+            normalizer_y    = normalizer_y,
+            negative_x      = neg_height_x > 0,
+            negative_y      = neg_height_y > 0,
+            neg_height_x    = neg_height_x,
+            neg_height_y    = neg_height_y,
+            unit_x          = unit_x,
+            unit_y          = unit_y,
+        )
+        prefix = fore + back + style
+        graph.plot_binned(xs, ys, tokens=token, colors=[prefix] if prefix else None)
+        return graph
 
-    def __delitem__(self, point: Point) -> None:
-        point = self._validate_point(point=point)
-        point = self._transform_true_point(point=point)
-        self.graph[point.x][point.y] = ' '
+    @classmethod
+    def from_canvas(
+            cls,
+            cells       : canvas.Canvas,
+            height_x    : int,
+            height_y    : int,
+            step_x      : float = 1,
+            step_y      : float = 1,
+            normalizer_x: int = 10,
+            normalizer_y: int = 10,
+            neg_height_x: int = 0,
+            neg_height_y: int = 0,
+            unit_x      : float = 1,
+            unit_y      : float = 1,
+    ) -> 'Graph':
+        """
+        Create a graph of the given axes holding an already drawn canvas (axes labels included), nothing is plotted.
 
-    def _transform_true_point(self, point: Point) -> 'Point':
+        :param cells: the canvas, of the graph width and height.
+        :type cells: canvas.Canvas
+        :raises ValueError: if the canvas size does not match the axes.
+        :return: the graph.
+        :rtype: Graph
         """
-        Construct a "true value" for the given Point in relation to the graph.
+        # A lazy graph records its layout only: neither its canvas nor its labels are created.
+        graph = cls(
+            points          = [],
+            height_x        = height_x,
+            height_y        = height_y,
+            step_x          = step_x,
+            step_y          = step_y,
+            normalizer_x    = normalizer_x,
+            normalizer_y    = normalizer_y,
+            negative_x      = neg_height_x > 0,
+            negative_y      = neg_height_y > 0,
+            neg_height_x    = neg_height_x,
+            neg_height_y    = neg_height_y,
+            unit_x          = unit_x,
+            unit_y          = unit_y,
+            lazy            = True,
+        )
+        if (cells.width, cells.height) != (graph.width, graph.height):
+            raise ValueError(f'canvas of {cells.width}x{cells.height} cells, the axes need {graph.width}x{graph.height}')
+        graph.canvas    = graph._canvas = cells
+        graph._pending  = set()
+        return graph
 
-        :return: the constructed true Point.
-        :rtype: Point
+    def __getitem__(self, point: typing.Union[Point, typing.Tuple[int, int]]) -> str:
+        row, col = self._transform_true_point(*self._validate_point(point=point))
+        if self._pending:
+            self._write_rows((row,))
+        return self._canvas.get(row, col)
+
+    def __setitem__(self, point: typing.Union[Point, typing.Tuple[int, int]], char: str) -> None:
+        row, col = self._transform_true_point(*self._validate_point(point=point))
+        if self._pending:
+            self._write_rows((row,))
+        self._put(row, col, char)
+
+    def __delitem__(self, point: typing.Union[Point, typing.Tuple[int, int]]) -> None:
+        row, col = self._transform_true_point(*self._validate_point(point=point))
+        if self._pending:
+            self._write_rows((row,))
+        self._canvas.clear(row, col)
+
+    def _put(self, row: int, col: int, char: str) -> None:
+        """
+        Write a value (plain or colored string) to the canvas cell (row, col).
+
+        :rtype: None
+        """
+        if isinstance(char, color.ColoredString) and len(char.value) == 1:
+            # Keep the character and its style apart, the canvas renders the escape codes per run.
+            self._canvas.put(row, col, char.value, self._canvas.style_id(char.prefix))
+        else:
+            self._canvas.put(row, col, str(char))
+
+    def plot_many(
+            self,
+            xs      : typing.Sequence[int],
+            ys      : typing.Sequence[int],
+            token   : str = 'X',
+            fore    : str = '',
+            back    : str = '',
+            style   : str = '',
+            clip    : bool = False,
+            data    : bool = False,
+    ) -> None:
+        """
+        Plot many points sharing the same token and color at once.
+        Duplicated cells are collapsed before scattering, so the per-point work is done by builtins only
+        (numpy arrays are bounded and clipped by their own reductions, then converted at once).
+        Every value is checked before anything is written.
+
+        :param xs: 'x' cell coordinates, or data values (see 'data'): list, array.array, numpy array or any sequence.
+        :type xs: typing.Sequence[int]
+        :param ys: 'y' values, parallel to 'xs'.
+        :type ys: typing.Sequence[int]
+        :param token: the points token, defaults to 'X'.
+        :type token: str
+        :param fore: fore color code, defaults to ''.
+        :type fore: str
+        :param back: back color code, defaults to ''.
+        :type back: str
+        :param style: style code, defaults to ''.
+        :type style: str
+        :param clip: drop out of bounds points instead of raising, defaults to False.
+        :type clip: bool
+        :param data: the values are data values, rounded to the cell 'round(v / step)' (like 'plot_binned'),
+            defaults to False (integer cell coordinates).
+        :type data: bool
+        :raises ValueError: if the token is not of size 1 or 'xs' and 'ys' lengths differ.
+        :raises TypeError: if a cell coordinate is not an integer.
+        :raises IndexError: if a point has an illegal index and 'clip' is not set.
+        :rtype: None
+        """
+        if len(token) != 1:
+            raise ValueError('token length must be of size 1')
+        if len(xs) != len(ys):
+            raise ValueError('xs and ys must be of the same length')
+        if len(xs) == 0:
+            return
+        if data:
+            xs, ys = self._scaled(xs, ys, rounded=True)
+        _check_array(xs)
+        _check_array(ys)
+        vectorized  = hasattr(xs, 'dtype') and hasattr(ys, 'dtype')
+        if vectorized:
+            lo_x, hi_x, lo_y, hi_y = int(xs.min()), int(xs.max()), int(ys.min()), int(ys.max())
+        else:
+            xs      = xs.tolist() if hasattr(xs, 'dtype') else xs
+            ys      = ys.tolist() if hasattr(ys, 'dtype') else ys
+            cells   = _int_cells(set(zip(xs, ys)))
+            # The bounds of the distinct cells (far fewer than the points once in bounds).
+            cell_xs, cell_ys = zip(*cells)
+            lo_x, hi_x, lo_y, hi_y = min(cell_xs), max(cell_xs), min(cell_ys), max(cell_ys)
+        min_x, min_y    = self._min_point()
+        in_bounds       = min_x <= lo_x and hi_x <= self.height_x and min_y <= lo_y and hi_y <= self.height_y
+        profile         = instrument.active()
+        if not (in_bounds or clip):
+            if profile is not None:
+                self._count_points(profile, xs, ys, None)
+            if (lo_x < 0 and not self.negative_x) or (lo_y < 0 and not self.negative_y):
+                raise IndexError("Illegal negative index value supplied!")
+            raise IndexError("Index value out of bounds!")
+        raw_xs, raw_ys = xs, ys
+        if vectorized:
+            if not in_bounds:
+                inside  = (xs >= min_x) & (xs <= self.height_x) & (ys >= min_y) & (ys <= self.height_y)
+                xs, ys  = xs[inside], ys[inside]
+            cells = set(zip(xs.tolist(), ys.tolist()))
+        elif not in_bounds:
+            cells = {(x, y) for x, y in cells if min_x <= x <= self.height_x and min_y <= y <= self.height_y}
+        if profile is not None:
+            self._count_points(profile, raw_xs, raw_ys, cells)
+        offset_x    = self.neg_height_x
+        offset_y    = self.neg_height_y
+        sid         = self.canvas.style_id(fore + back + style)
+        chars       = self.canvas.chars
+        styles      = self.canvas.styles
+        overflow    = self.canvas.overflow
+        dirty       = self.canvas.dirty
+        for x, y in cells:
+            row = y + offset_y
+            col = x + offset_x
+            chars[row][col]  = token
+            styles[row][col] = sid
+            dirty.add(row)
+            if overflow:
+                overflow.pop((row, col), None)
+
+    def _scaled(
+            self,
+            xs      : typing.Iterable[float],
+            ys      : typing.Iterable[float],
+            rounded : bool,
+    ) -> typing.Tuple[typing.Sequence[float], typing.Sequence[float]]:
+        """
+        Returns data values in cell units (divided by the steps), rounded to cells like binning.bin_points if 'rounded'.
+        numpy arrays are divided (and rounded) by numpy.
+
+        :rtype: typing.Tuple[typing.Sequence[float], typing.Sequence[float]]
+        """
+        if hasattr(xs, 'dtype') and hasattr(ys, 'dtype'):
+            xs, ys = xs / self.step_x, ys / self.step_y
+            if rounded:
+                return xs.round().astype('int64'), ys.round().astype('int64')
+            return xs, ys
+        if rounded:
+            return list(binning._cells(xs, self.step_x)), list(binning._cells(ys, self.step_y))
+        return [x / self.step_x for x in xs], [y / self.step_y for y in ys]
+
+    def _count_points(
+            self,
+            profile : instrument.Profile,
+            xs      : typing.Sequence[int],
+            ys      : typing.Sequence[int],
+            cells   : typing.Optional[typing.Set[typing.Tuple[int, int]]],
+    ) -> None:
+        """
+        Count the raw points of a plot: out of bounds (clipped), written (plotted) and written over a non blank cell
+        or over an earlier point of the plot (collisions). Called before writing the distinct in bounds 'cells',
+        with None when the plot raises instead (nothing is written).
+
+        :rtype: None
+        """
+        min_x, min_y    = self._min_point()
+        inside          = sum(1 for x, y in zip(xs, ys) if min_x <= x <= self.height_x and min_y <= y <= self.height_y)
+        profile.counts[instrument.CLIPPED] += len(xs) - inside
+        if cells is None:
+            return
+        is_blank = self.canvas.is_blank
+        occupied = sum(1 for x, y in cells if not is_blank(y + self.neg_height_y, x + self.neg_height_x))
+        profile.counts[instrument.PLOTTED]      += inside
+        profile.counts[instrument.COLLISIONS]   += inside - len(cells) + occupied
+
+    def plot_binned(
+            self,
+            xs      : typing.Iterable[float],
+            ys      : typing.Iterable[float],
+            values  : typing.Iterable[float] = None,
+            reducer : binning.Reducer = binning.Reducer.COUNT,
+            tokens  : str = binning.DENSITY_TOKENS,
+            colors  : binning.Colors = None,
+    ) -> None:
+        """
+        Aggregate raw data into the graph cells and plot each cell by its aggregated value.
+        A raw value 'v' falls in the cell 'round(v / step)', points out of the graph bounds are dropped.
+
+        :param xs: raw 'x' values.
+        :type xs: typing.Iterable[float]
+        :param ys: raw 'y' values, parallel to 'xs'.
+        :type ys: typing.Iterable[float]
+        :param values: values to reduce, defaults to None ('ys' are used).
+        :type values: typing.Iterable[float], optional
+        :param reducer: aggregation of the values in the same cell, defaults to binning.Reducer.COUNT.
+        :type reducer: binning.Reducer
+        :param tokens: tokens from the lowest to the highest value, defaults to binning.DENSITY_TOKENS.
+        :type tokens: str
+        :param colors: color codes or palette ids from the lowest to the highest value (see binning.density_colors), defaults to None.
+        :type colors: binning.Colors, optional
+        :rtype: None
+        """
+        self.plot_bins(binning.bin_points(xs, ys, self.step_x, self.step_y, values, reducer), tokens, colors)
+
+    def plot_bins(
+            self,
+            bins    : typing.Dict[typing.Tuple[int, int], float],
+            tokens  : str = binning.DENSITY_TOKENS,
+            colors  : binning.Colors = None,
+    ) -> None:
+        """
+        Plot cells by their aggregated value (see binning.bin_points), cells out of the graph bounds are dropped.
+
+        :param bins: mapping from cell (x, y) to its aggregated value.
+        :type bins: typing.Dict[typing.Tuple[int, int], float]
+        :param tokens: tokens from the lowest to the highest value, defaults to binning.DENSITY_TOKENS.
+        :type tokens: str
+        :param colors: color codes or palette ids from the lowest to the highest value (see binning.density_colors), defaults to None.
+        :type colors: binning.Colors, optional
+        :rtype: None
         """
-        true_x = point.x + self.width  // 2 if self.negative_x else point.x
-        true_y = point.y + self.height // 2 if self.negative_y else point.y
-        return Point(true_x, true_y)
+        min_x, min_y = self._min_point()
+        binned = len(bins)
+        bins = {
+            (x, y): value for (x, y), value in bins.items()
+            if min_x <= x <= self.height_x and min_y <= y <= self.height_y
+        }
+        profile = instrument.active()
+        if profile is not None:
+            # Cells (not raw points) are counted, the points falling in the same cell are aggregated.
+            is_blank = self.canvas.is_blank
+            profile.counts[instrument.CLIPPED]      += binned - len(bins)
+            profile.counts[instrument.PLOTTED]      += len(bins)
+            profile.counts[instrument.COLLISIONS]   += sum(
+                1 for x, y in bins if not is_blank(y + self.neg_height_y, x + self.neg_height_x)
+            )
+        token_levels = binning.levels(bins, len(tokens))
+        if colors:
+            color_levels    = binning.levels(bins, len(colors))
+            sids            = [self.canvas.style_id(code) for code in colors]
+        offset_x    = self.neg_height_x
+        offset_y    = self.neg_height_y
+        for (x, y), level in token_levels.items():
+            sid = sids[color_levels[(x, y)]] if colors else canvas.NO_STYLE
+            self.canvas.put(y + offset_y, x + offset_x, tokens[level], sid)
 
-    def _validate_point(self, point: Point) -> None:
+    def plot_subcell(
+            self,
+            xs      : typing.Iterable[float],
+            ys      : typing.Iterable[float],
+            mode    : subcell.SubcellMode = subcell.SubcellMode.BRAILLE,
+            fore    : str = '',
+            back    : str = '',
+            style   : str = '',
+            data    : bool = False,
+    ) -> None:
+        """
+        Plot points with sub-character resolution (braille: 2x4 dots per cell, half-block: 1x2 dots per cell).
+        Values are in cell units (see 'data'), fractions address the dots within a cell (the cell 'c' covers [c - 0.5, c + 0.5)).
+        Dots are merged into cells already holding glyphs of the same mode, points out of the graph bounds are dropped.
+
+        :param xs: 'x' values.
+        :type xs: typing.Iterable[float]
+        :param ys: 'y' values, parallel to 'xs'.
+        :type ys: typing.Iterable[float]
+        :param mode: sub-character mode, defaults to subcell.SubcellMode.BRAILLE.
+        :type mode: subcell.SubcellMode
+        :param fore: fore color code, defaults to ''.
+        :type fore: str
+        :param back: back color code, defaults to ''.
+        :type back: str
+        :param style: style code, defaults to ''.
+        :type style: str
+        :param data: the values are data values (divided by the steps), defaults to False (cell units).
+        :type data: bool
+        :rtype: None
+        """
+        if data:
+            xs, ys = self._scaled(xs, ys, rounded=False)
+        mode            = subcell.SubcellMode(mode)
+        glyphs          = mode.glyphs
+        min_x, min_y    = self._min_point()
+        sid             = self.canvas.style_id(fore + back + style)
+        for (x, y), mask in subcell.pack(xs, ys, mode).items():
+            if not (min_x <= x <= self.height_x and min_y <= y <= self.height_y):
+                continue
+            row, col = self._transform_true_point(x, y)
+            if self.canvas.styles[row][col] != canvas.OVERFLOW_STYLE:
+                mask |= subcell.mask_of(self.canvas.chars[row][col], mode)
+            self.canvas.put(row, col, glyphs[mask], sid)
+
+    def plot_line(
+            self,
+            xs      : typing.Sequence[float],
+            ys      : typing.Sequence[float],
+            token   : str = 'X',
+            fore    : str = '',
+            back    : str = '',
+            style   : str = '',
+            data    : bool = False,
+    ) -> None:
+        """
+        Plot the polyline connecting the given vertices, segments are clipped against the graph bounds.
+
+        :param xs: vertices 'x' values, in cell units (see 'data').
+        :type xs: typing.Sequence[float]
+        :param ys: vertices 'y' values, parallel to 'xs'.
+        :type ys: typing.Sequence[float]
+        :param token: the line token, defaults to 'X'.
+        :type token: str
+        :param fore: fore color code, defaults to ''.
+        :type fore: str
+        :param back: back color code, defaults to ''.
+        :type back: str
+        :param style: style code, defaults to ''.
+        :type style: str
+        :param data: the vertices are data values (divided by the steps), defaults to False (cell units).
+        :type data: bool
+        :raises ValueError: if the token is not of size 1 or 'xs' and 'ys' lengths differ.
+        :rtype: None
+        """
+        if len(token) != 1:
+            raise ValueError('token length must be of size 1')
+        if data:
+            xs, ys = self._scaled(xs, ys, rounded=False)
+        min_x, min_y    = self._min_point()
+        cells           = raster.polyline(xs, ys, (min_x, min_y, self.height_x, self.height_y))
+        sid             = self.canvas.style_id(fore + back + style)
+        for x, y in cells:
+            row, col = self._transform_true_point(x, y)
+            self.canvas.put(row, col, token, sid)
+
+    def _min_point(self) -> typing.Tuple[int, int]:
+        """
+        Returns the lowest legal 'x' and 'y' values of the graph.
+
+        :rtype: typing.Tuple[int, int]
+        """
+        return -self.neg_height_x, -self.neg_height_y
+
+    def _transform_true_point(self, x: int, y: int) -> typing.Tuple[int, int]:
+        """
+        Construct the "true value" (canvas row and column) of the given 'x' and 'y' in relation to the graph.
+
+        :return: the canvas row and column.
+        :rtype: typing.Tuple[int, int]
+        """
+        return y + self.neg_height_y, x + self.neg_height_x
+
+    def _validate_point(self, point: typing.Union[Point, typing.Tuple[int, int]]) -> typing.Tuple[int, int]:
         """
         Validate a given point against the graph.
 
-        :param point: Point to check against the graph.
-        :type point: Point
+        :param point: Point (or plain 'x' and 'y' pair) to check against the graph.
+        :type point: typing.Union[Point, typing.Tuple[int, int]]
         :raises IndexError: if the Point has an illegal index (negative / out of bounds), raise.
-        :rtype: None
+        :return: the point 'x' and 'y' values.
+        :rtype: typing.Tuple[int, int]
         """
-        if isinstance(point, (tuple, list)):
-            point = Point(*point)
-        if (point.x < 0 and not self.negative_x) or (point.y < 0 and not self.negative_y):
+        if isinstance(point, Point):
+            x, y = point.x, point.y
+        else:
+            x, y = point
+        if (x < 0 and not self.negative_x) or (y < 0 and not self.negative_y):
             raise IndexError("Illegal negative index value supplied!")
-        if not -self.height_x <= point.x <= self.height_x or not -self.height_y <= point.y <= self.height_y:
+        if not -self.neg_height_x <= x <= self.height_x or not -self.neg_height_y <= y <= self.height_y:
             raise IndexError("Index value out of bounds!")
-        return point
+        return x, y
+
+    def pop_dirty(self) -> typing.Set[int]:
+        """
+        Returns the rows changed since the last call (see canvas.Canvas.pop_dirty).
+
+        :return: set of changed row indices (0 is the bottom row).
+        :rtype: typing.Set[int]
+        """
+        if self._pending:
+            # Rows written later are reported by then.
+            self._allocate()
+        return self._canvas.pop_dirty()
+
+    def _draw_row(self, row: int, start: int = 0) -> str:
+        """
+        Create the string that represents a single row of the graph.
+
+        :param row: canvas row index (0 is the bottom row).
+        :type row: int
+        :param start: first column to draw, defaults to 0.
+        :type start: int
+        :return: string representing the row.
+        :rtype: str
+        """
+        if self._pending:
+            self._write_rows((row,))
+        return self._canvas.render_row(row, start)
 
     def _draw(self) -> typing.List[str]:
         """
@@ -214,14 +1011,19 @@ class Graph:
         :return: list of strings representing rows within the graph.
         :rtype: typing.List[str]
         """
-        return [''.join(self.graph[i]) for i in range(len(self.graph))][::-1]
+        with instrument.phase(instrument.ROWS):
+            return [self._draw_row(row) for row in range(self.height - 1, -1, -1)]
 
-    def draw(self) -> None:
+    def draw(self, target: typing.Any = None, fmt: render.Format = render.Format.ANSI) -> None:
         """
-        Draw the stored Graph to the screen.
+        Draw the stored Graph to the screen (or to any other target, see render.render).
 
-        :return: this function only prints.
+        :param target: text stream, binary stream, file descriptor or socket, defaults to None (sys.stdout).
+        :type target: typing.Any, optional
+        :param fmt: output format (ansi/plain/html/compact), defaults to render.Format.ANSI.
+        :type fmt: render.Format
+        :return: this function only writes.
         :rtype: None
         """
-        print('\n'.join(self._draw()))
+        render.render(self, target=target, fmt=fmt)
 
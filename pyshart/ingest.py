@@ -0,0 +1,412 @@
+"""
+Ingest module that streams 'x' and 'y' columns out of CSV and JSON lines files into graphs.
+Provides a generator pipeline (blocks -> lines -> columns chunks) whose memory use is bounded by the block size.
+"""
+import array
+import collections
+import contextlib
+import csv
+import enum
+import io
+import json
+import math
+import mmap
+import shutil
+import sys
+import tempfile
+import time
+import typing
+
+from . import binning
+from . import graph
+from . import live
+from . import render
+
+# Bytes read per block (a chunk holds the values of the complete lines of a block).
+BLOCK_SIZE = 1 << 20
+
+Chunk   = typing.Tuple[array.array, array.array]
+Limits  = typing.Tuple[float, float, float, float]
+
+
+class InputFormat(enum.Enum):
+    """
+    InputFormat enum holds the supported input file formats.
+    """
+
+    CSV     = 'csv'
+    JSONL   = 'jsonl'
+
+    @classmethod
+    def of(cls, path: str) -> 'InputFormat':
+        """
+        Returns the format matching the file extension (CSV by default).
+
+        :rtype: InputFormat
+        """
+        if path.endswith(('.jsonl', '.ndjson', '.json')):
+            return cls.JSONL
+        return cls.CSV
+
+
+def read_blocks(
+        reader      : typing.BinaryIO,
+        block_size  : int = BLOCK_SIZE,
+        use_mmap    : bool = False,
+        follow      : bool = False,
+        interval    : float = 0.5,
+) -> typing.Iterator[bytes]:
+    """
+    Yield the content of a binary file in blocks.
+    When following, the reader is polled every 'interval' seconds past its end, an empty block is yielded when idle.
+
+    :param reader: binary file (or stdin buffer).
+    :type reader: typing.BinaryIO
+    :param block_size: bytes per block, defaults to BLOCK_SIZE.
+    :type block_size: int
+    :param use_mmap: map regular files in memory instead of reading them (ignored when following), defaults to False.
+    :type use_mmap: bool
+    :param follow: keep reading data appended to the file (like 'tail -f'), defaults to False.
+    :type follow: bool
+    :param interval: polling interval (seconds) when following, defaults to 0.5.
+    :type interval: float
+    :rtype: typing.Iterator[bytes]
+    """
+    if use_mmap and not follow:
+        try:
+            mapped = mmap.mmap(reader.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, io.UnsupportedOperation):
+            # Not a regular file (pipe, terminal) or an empty one.
+            mapped = None
+        if mapped is not None:
+            with mapped:
+                for offset in range(0, len(mapped), block_size):
+                    yield mapped[offset:offset + block_size]
+            return
+    read = getattr(reader, 'read1', reader.read)
+    while True:
+        block = read(block_size)
+        if block:
+            yield block
+        elif not follow:
+            return
+        else:
+            yield b''
+            time.sleep(interval)
+
+
+def split_lines(blocks: typing.Iterable[bytes]) -> typing.Iterator[typing.List[bytes]]:
+    """
+    Yield the complete lines of each block (a line split across blocks is yielded with the block completing it).
+    Empty blocks (see 'read_blocks' follow mode) yield empty lists.
+
+    :rtype: typing.Iterator[typing.List[bytes]]
+    """
+    rest = b''
+    for block in blocks:
+        lines   = (rest + block).split(b'\n')
+        rest    = lines.pop()
+        yield lines
+    if rest:
+        yield [rest]
+
+
+def _column(value: str) -> typing.Union[int, str]:
+    """
+    Returns a CSV column selector: an index for digits, a name otherwise.
+
+    :rtype: typing.Union[int, str]
+    """
+    return int(value) if isinstance(value, str) and value.isdigit() else value
+
+
+def _resolve(column: typing.Union[int, str, None], names: typing.Optional[typing.List[str]]) -> typing.Optional[int]:
+    """
+    Returns the index of a CSV column selector (None stays None).
+
+    :raises KeyError: the column name is not in the header (or there is no header).
+    :rtype: typing.Optional[int]
+    """
+    if column is None or isinstance(column, int):
+        return column
+    if names is None or column not in names:
+        raise KeyError(f'column {column!r} not in header {names!r}')
+    return names.index(column)
+
+
+def read_columns(
+        batches     : typing.Iterable[typing.List[bytes]],
+        y           : typing.Union[int, str],
+        x           : typing.Union[int, str] = None,
+        fmt         : InputFormat = InputFormat.CSV,
+        delimiter   : str = ',',
+        header      : bool = True,
+        encoding    : str = 'utf-8',
+) -> typing.Iterator[Chunk]:
+    """
+    Yield the selected columns of each lines batch as parallel 'x' and 'y' arrays.
+    Lines with missing, non numeric or non finite (nan, inf) values are skipped, CSV quoted values must not span lines.
+
+    :param batches: lines batches (see 'split_lines').
+    :type batches: typing.Iterable[typing.List[bytes]]
+    :param y: 'y' column: CSV column name or index, JSON key.
+    :type y: typing.Union[int, str]
+    :param x: 'x' column, defaults to None (the line number of the value).
+    :type x: typing.Union[int, str], optional
+    :param fmt: input format, defaults to InputFormat.CSV.
+    :type fmt: InputFormat
+    :param delimiter: CSV delimiter, defaults to ','.
+    :type delimiter: str
+    :param header: the first CSV line holds the columns names, defaults to True.
+    :type header: bool
+    :param encoding: input encoding, defaults to 'utf-8'.
+    :type encoding: str
+    :raises KeyError: a CSV column name is not in the header (see '_resolve').
+    :rtype: typing.Iterator[Chunk]
+    """
+    fmt         = InputFormat(fmt)
+    columns     = None  # type: typing.Optional[typing.Tuple[typing.Optional[int], int]]
+    number      = 0
+    for batch in batches:
+        xs      = array.array('d')
+        ys      = array.array('d')
+        lines   = (line.decode(encoding).rstrip('\r') for line in batch)
+        if fmt is InputFormat.CSV:
+            rows = csv.reader(lines, delimiter=delimiter)
+            if columns is None:
+                names = None
+                if header:
+                    names = next(rows, None)
+                    if names is None:
+                        # The header is still to come (empty batch when following).
+                        yield xs, ys
+                        continue
+                columns = (_resolve(_column(x), names), _resolve(_column(y), names))
+            x_col, y_col = columns
+            for row in rows:
+                number += 1
+                try:
+                    value_y = float(row[y_col])
+                    value_x = number - 1 if x_col is None else float(row[x_col])
+                except (IndexError, ValueError):
+                    continue
+                if not (math.isfinite(value_x) and math.isfinite(value_y)):
+                    continue
+                xs.append(value_x)
+                ys.append(value_y)
+        else:
+            for line in lines:
+                if not line.strip():
+                    continue
+                number += 1
+                try:
+                    record  = json.loads(line)
+                    value_y = float(record[y])
+                    value_x = number - 1 if x is None else float(record[x])
+                except (KeyError, IndexError, TypeError, ValueError):
+                    continue
+                if not (math.isfinite(value_x) and math.isfinite(value_y)):
+                    continue
+                xs.append(value_x)
+                ys.append(value_y)
+        yield xs, ys
+
+
+def extents(chunks: typing.Iterable[Chunk]) -> typing.Optional[Limits]:
+    """
+    Returns the limits (min x, max x, min y, max y) of the chunks values, None when there are none.
+
+    :rtype: typing.Optional[Limits]
+    """
+    limits = None   # type: typing.Optional[Limits]
+    for xs, ys in chunks:
+        if not xs:
+            continue
+        chunk_limits = (min(xs), max(xs), min(ys), max(ys))
+        if limits is not None:
+            chunk_limits = (
+                min(limits[0], chunk_limits[0]), max(limits[1], chunk_limits[1]),
+                min(limits[2], chunk_limits[2]), max(limits[3], chunk_limits[3]),
+            )
+        limits = chunk_limits
+    return limits
+
+
+def fitted_graph(
+        limits      : Limits,
+        width       : int = 80,
+        height      : int = 20,
+        normalizer_x: int = 10,
+        normalizer_y: int = 10,
+) -> graph.Graph:
+    """
+    Create an empty graph whose layout covers the given limits (see graph.Graph.auto).
+
+    :param limits: (min x, max x, min y, max y).
+    :type limits: Limits
+    :rtype: graph.Graph
+    """
+    min_x, max_x, min_y, max_y = limits
+    step_x, height_x, neg_height_x, unit_x = graph.axis_extents(min_x, max_x, width)
+    step_y, height_y, neg_height_y, unit_y = graph.axis_extents(min_y, max_y, height)
+    return graph.Graph(
+        points          = [],
+        height_x        = height_x,
+        height_y        = height_y,
+        step_x          = step_x,
+        step_y          = step_y,
+        normalizer_x    = normalizer_x,
+        normalizer_y    = normalizer_y,
+        negative_x      = neg_height_x > 0,
+        negative_y      = neg_height_y > 0,
+        neg_height_x    = neg_height_x,
+        neg_height_y    = neg_height_y,
+        unit_x          = unit_x,
+        unit_y          = unit_y,
+    )
+
+
+def count_chunks(
+        target  : graph.Graph,
+        chunks  : typing.Iterable[Chunk],
+        counts  : typing.Counter[typing.Tuple[int, int]] = None,
+) -> typing.Counter[typing.Tuple[int, int]]:
+    """
+    Count the chunks values per cell of the target graph (the memory use is bounded by the number of cells).
+
+    :param target: the graph whose steps define the cells.
+    :type target: graph.Graph
+    :param chunks: 'x' and 'y' values chunks (see 'read_columns').
+    :type chunks: typing.Iterable[Chunk]
+    :param counts: counts to add to, defaults to None (new counts).
+    :type counts: typing.Counter[typing.Tuple[int, int]], optional
+    :return: mapping from cell (x, y) to its count.
+    :rtype: typing.Counter[typing.Tuple[int, int]]
+    """
+    counts = counts if counts is not None else collections.Counter()
+    for xs, ys in chunks:
+        counts.update(binning.bin_points(xs, ys, target.step_x, target.step_y))
+    return counts
+
+
+@contextlib.contextmanager
+def open_input(path: str, seekable: bool = True) -> typing.Iterator[typing.BinaryIO]:
+    """
+    Open an input file in binary mode, '-' is stdin.
+    A seekable stdin is needed to read it twice (layout then plotting), it is then spooled to a temporary file.
+
+    :param path: file path or '-'.
+    :type path: str
+    :param seekable: spool a non seekable stdin to a temporary file, defaults to True.
+    :type seekable: bool
+    :rtype: typing.Iterator[typing.BinaryIO]
+    """
+    if path != '-':
+        with open(path, 'rb') as reader:
+            yield reader
+        return
+    stdin = sys.stdin.buffer
+    if not seekable or stdin.seekable():
+        yield stdin
+        return
+    with tempfile.TemporaryFile() as spool:
+        shutil.copyfileobj(stdin, spool, BLOCK_SIZE)
+        spool.seek(0)
+        yield spool
+
+
+def plot_file(
+        path        : str,
+        y           : typing.Union[int, str],
+        x           : typing.Union[int, str] = None,
+        fmt         : InputFormat = None,
+        delimiter   : str = ',',
+        header      : bool = True,
+        limits      : Limits = None,
+        width       : int = 80,
+        height      : int = 20,
+        block_size  : int = BLOCK_SIZE,
+        use_mmap    : bool = False,
+        tokens      : str = binning.DENSITY_TOKENS,
+        colors      : binning.Colors = None,
+) -> graph.Graph:
+    """
+    Plot the density of the selected columns of a file, reading it in blocks (twice when 'limits' are not given).
+
+    :param path: file path or '-' (stdin).
+    :type path: str
+    :param limits: (min x, max x, min y, max y) of the graph, defaults to None (the data limits).
+    :type limits: Limits, optional
+    :return: the plotted graph.
+    :rtype: graph.Graph
+    """
+    fmt = InputFormat(fmt) if fmt is not None else InputFormat.of(path)
+
+    def chunks(reader):
+        batches = split_lines(read_blocks(reader, block_size=block_size, use_mmap=use_mmap))
+        return read_columns(batches, y=y, x=x, fmt=fmt, delimiter=delimiter, header=header)
+
+    with open_input(path, seekable=limits is None) as reader:
+        if limits is None:
+            limits = extents(chunks(reader)) or (0, 0, 0, 0)
+            reader.seek(0)
+        target = fitted_graph(limits, width=width, height=height)
+        target.plot_bins(count_chunks(target, chunks(reader)), tokens=tokens, colors=colors)
+    return target
+
+
+def follow_file(
+        path        : str,
+        y           : typing.Union[int, str],
+        x           : typing.Union[int, str] = None,
+        fmt         : InputFormat = None,
+        delimiter   : str = ',',
+        header      : bool = True,
+        limits      : Limits = None,
+        width       : int = 80,
+        height      : int = 20,
+        interval    : float = 0.5,
+        stream      : typing.TextIO = None,
+        tokens      : str = binning.DENSITY_TOKENS,
+        colors      : binning.Colors = None,
+) -> None:
+    """
+    Plot a file and keep plotting the lines appended to it (like 'tail -f'), redrawing changed rows in place.
+    Without 'limits' the layout is computed from the data already in the file, later values out of it are dropped.
+    Runs until interrupted.
+
+    :param path: file path or '-' (stdin, 'limits' are then required).
+    :type path: str
+    :param interval: polling and redraw interval (seconds), defaults to 0.5.
+    :type interval: float
+    :param stream: output stream, defaults to None (sys.stdout).
+    :type stream: typing.TextIO, optional
+    :raises ValueError: following stdin without 'limits'.
+    :rtype: None
+    """
+    if path == '-' and limits is None:
+        raise ValueError('limits are required to follow stdin')
+    fmt = InputFormat(fmt) if fmt is not None else InputFormat.of(path)
+
+    def chunks(reader, follow):
+        batches = split_lines(read_blocks(reader, follow=follow, interval=interval))
+        return read_columns(batches, y=y, x=x, fmt=fmt, delimiter=delimiter, header=header)
+
+    with open_input(path, seekable=False) as reader:
+        if limits is None:
+            limits = extents(chunks(reader, follow=False)) or (0, 0, 0, 0)
+            reader.seek(0)
+        target      = fitted_graph(limits, width=width, height=height)
+        renderer    = live.LiveRenderer(target, stream=stream, encoder=render.SGREncoder(render.terminal_capability()))
+        counts      = collections.Counter()     # type: typing.Counter[typing.Tuple[int, int]]
+        changed     = True
+        last        = None  # type: typing.Optional[float]
+        for chunk in chunks(reader, follow=True):
+            if chunk[0]:
+                count_chunks(target, (chunk,), counts)
+                changed = True
+            now = time.monotonic()
+            if changed and (last is None or now - last >= interval):
+                target.plot_bins(counts, tokens=tokens, colors=colors)
+                renderer.refresh(force=True)
+                changed, last = False, now
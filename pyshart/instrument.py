@@ -0,0 +1,135 @@
+"""
+Instrument module that contains the Profile class.
+Provides opt-in measurements of the graphs construction and rendering phases (times and counters).
+"""
+import collections
+import time
+import typing
+
+# Phases.
+LABELS          = 'labels'      # axes labels formatting and writing
+POINTS          = 'points'      # points validation, transformation and writing
+TOKENIZE        = 'tokenize'    # VisualPoint.tokenize
+ROWS            = 'rows'        # rows rendering (runs join)
+OUTPUT          = 'output'      # writing to the target
+
+# Counters, of raw points (binned plots count cells, the points falling in the same cell are aggregated).
+PLOTTED         = 'points_plotted'          # points written to the canvas
+CLIPPED         = 'points_clipped'          # points out of the graph bounds (dropped, or raising)
+COLLISIONS      = 'collisions_overwritten'  # points written over a non blank cell (an earlier point or an axis label)
+ESCAPE_BYTES    = 'escape_bytes'
+
+# The profile measuring the current work, None when profiling is disabled.
+_active = None  # type: typing.Optional[Profile]
+
+
+class _NullPhase:
+    """
+    Phase context manager used when profiling is disabled, does nothing.
+    """
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    """
+    Phase context manager adding its elapsed time to a profile phase.
+    """
+    def __init__(self, profile: 'Profile', name: str):
+        self.profile    = profile
+        self.name       = name
+        self.start      = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.profile.times[self.name] += time.perf_counter() - self.start
+
+
+class Profile:
+    """
+    Profile class accumulates the time spent in each phase and the counters of the work done while it is active.
+    Profiling is enabled by using a profile as a context manager (profiles may be nested, the innermost is active),
+    when it exits the optional callback is called with the profile.
+    When no profile is active the graphs only pay a check per phase (not per point or per row).
+    The active profile is process wide, graphs used concurrently from other threads are measured too.
+    """
+    def __init__(self, callback: typing.Callable[['Profile'], typing.Any] = None):
+        self.callback   = callback
+        self.times      = collections.defaultdict(float)    # type: typing.DefaultDict[str, float]
+        self.counts     = collections.Counter()             # type: typing.Counter[str]
+        self._previous  = None                              # type: typing.Optional[Profile]
+
+    def __enter__(self) -> 'Profile':
+        global _active
+        self._previous, _active = _active, self
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        global _active
+        _active, self._previous = self._previous, None
+        if self.callback is not None:
+            self.callback(self)
+
+    def phase(self, name: str) -> _Phase:
+        """
+        Returns a context manager adding its elapsed time to the given phase.
+
+        :rtype: _Phase
+        """
+        return _Phase(self, name)
+
+    def timed(self, iterable: typing.Iterable[typing.Any], name: str) -> typing.Iterator[typing.Any]:
+        """
+        Iterate over 'iterable', adding the time spent producing its items to the given phase.
+
+        :rtype: typing.Iterator[typing.Any]
+        """
+        clock       = time.perf_counter
+        iterator    = iter(iterable)
+        while True:
+            start = clock()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.times[name] += clock() - start
+                return
+            self.times[name] += clock() - start
+            yield item
+
+    def report(self) -> str:
+        """
+        Returns a human readable summary of the phases times (in milliseconds) and of the counters.
+
+        :rtype: str
+        """
+        lines = [f'{name:<24}{seconds * 1000:>12.3f} ms' for name, seconds in self.times.items()]
+        lines.extend(f'{name:<24}{count:>12}' for name, count in self.counts.items())
+        return '\n'.join(lines)
+
+
+def active() -> typing.Optional[Profile]:
+    """
+    Returns the active profile, None when profiling is disabled.
+
+    :rtype: typing.Optional[Profile]
+    """
+    return _active
+
+
+def phase(name: str) -> typing.Union[_Phase, _NullPhase]:
+    """
+    Returns a context manager measuring the given phase in the active profile (a no-op when profiling is disabled).
+
+    :rtype: typing.Union[_Phase, _NullPhase]
+    """
+    if _active is None:
+        return _NULL_PHASE
+    return _Phase(_active, name)
@@ -0,0 +1,182 @@
+"""
+Layers module that contains the LayeredGraph class.
+Provides named series (layers) with z-order and per layer collision policies, composed in a single pass.
+"""
+import dataclasses
+import enum
+import typing
+
+from . import binning
+from . import canvas
+from . import color
+from . import graph
+
+
+class Collision(enum.Enum):
+    """
+    Collision enum holds what a layer does to a cell already taken by a lower layer.
+    """
+
+    OVERWRITE   = 'overwrite'   # the layer token replaces the cell.
+    KEEP_FIRST  = 'keep_first'  # the cell keeps the lower layer token.
+    BLEND       = 'blend'       # the cell shows a density glyph of the number of layers hitting it.
+    LEGEND      = 'legend'      # the cell shows the overlap marker (listed in the legend).
+
+
+@dataclasses.dataclass
+class Layer:
+    """
+    Layer dataclass that holds a named series, its look, z-order and collision policy.
+    """
+    name    : str
+    z       : int = 0
+    token   : str = 'X'
+    fore    : str = ''
+    back    : str = ''
+    style   : str = ''
+    policy  : Collision = Collision.OVERWRITE
+    # Canvas (row, column) cells of the series.
+    cells   : typing.Set[typing.Tuple[int, int]] = dataclasses.field(default_factory=set, repr=False)
+
+    def __post_init__(self):
+        if len(self.token) != 1:
+            raise ValueError('token length must be of size 1')
+        self.policy = Collision(self.policy)
+
+
+class LayeredGraph(graph.Graph):
+    """
+    LayeredGraph class is a Graph plotting named layers on top of its axes.
+    Layers are composed (lowest z first) into the canvas by 'compose', in one pass over the layers cells.
+    Only the axes and the constructor points lie under the layers: every later point is plotted by a layer,
+    the Graph plotting methods (item assignment, plot_many, plot_binned, plot_line...) raise TypeError.
+    """
+    def __init__(self, *args, overlap_marker: str = '#', **kwargs):
+        super().__init__(*args, **kwargs)
+        self.overlap_marker = overlap_marker
+        self.layers         = {}    # type: typing.Dict[str, Layer]
+        # The axes (and constructor points) the layers are composed on.
+        self._base_chars    = [row[:] for row in self.canvas.chars]
+        self._base_styles   = [row[:] for row in self.canvas.styles]
+        self._base_overflow = dict(self.canvas.overflow)
+
+    def add_layer(
+            self,
+            name    : str,
+            xs      : typing.Sequence[int],
+            ys      : typing.Sequence[int],
+            z       : int = 0,
+            token   : str = 'X',
+            fore    : str = '',
+            back    : str = '',
+            style   : str = '',
+            policy  : Collision = Collision.OVERWRITE,
+    ) -> Layer:
+        """
+        Add (or replace) a named layer, points out of the graph bounds are dropped.
+        The canvas is updated on the next 'compose'.
+
+        :param name: layer name (shown in the legend).
+        :type name: str
+        :param xs: 'x' values.
+        :type xs: typing.Sequence[int]
+        :param ys: 'y' values, parallel to 'xs'.
+        :type ys: typing.Sequence[int]
+        :param z: z-order, higher layers are composed later, defaults to 0.
+        :type z: int
+        :param token: the layer token, defaults to 'X'.
+        :type token: str
+        :param fore: fore color code, defaults to ''.
+        :type fore: str
+        :param back: back color code, defaults to ''.
+        :type back: str
+        :param style: style code, defaults to ''.
+        :type style: str
+        :param policy: collision policy against lower layers, defaults to Collision.OVERWRITE.
+        :type policy: Collision
+        :return: the added layer.
+        :rtype: Layer
+        """
+        if len(xs) != len(ys):
+            raise ValueError('xs and ys must be of the same length')
+        min_x, min_y = self._min_point()
+        layer = Layer(name=name, z=z, token=token, fore=fore, back=back, style=style, policy=policy)
+        layer.cells = {
+            self._transform_true_point(x, y) for x, y in set(zip(xs, ys))
+            if min_x <= x <= self.height_x and min_y <= y <= self.height_y
+        }
+        self.layers[name] = layer
+        return layer
+
+    def remove_layer(self, name: str) -> None:
+        """
+        Remove a named layer, the canvas is updated on the next 'compose'.
+
+        :raises KeyError: unknown layer.
+        :rtype: None
+        """
+        del self.layers[name]
+
+    def compose(self) -> None:
+        """
+        Compose all the layers into the canvas according to their z-order and collision policies.
+
+        :rtype: None
+        """
+        cells = {}  # type: typing.Dict[typing.Tuple[int, int], typing.List]
+        for layer in sorted(self.layers.values(), key=lambda layer: layer.z):
+            sid     = self.canvas.style_id(layer.fore + layer.back + layer.style)
+            policy  = layer.policy
+            for cell in layer.cells:
+                current = cells.get(cell)
+                if current is None:
+                    cells[cell] = [layer.token, sid, 1]
+                    continue
+                current[2] += 1
+                if policy is Collision.OVERWRITE:
+                    current[0], current[1] = layer.token, sid
+                elif policy is Collision.BLEND:
+                    current[0] = binning.DENSITY_TOKENS[min(current[2], len(binning.DENSITY_TOKENS)) - 1]
+                    current[1] = canvas.NO_STYLE
+                elif policy is Collision.LEGEND:
+                    current[0], current[1] = self.overlap_marker, canvas.NO_STYLE
+
+        target = self.canvas
+        for row in range(self.height):
+            target.chars[row][:]    = self._base_chars[row]
+            target.styles[row][:]   = self._base_styles[row]
+        target.overflow = dict(self._base_overflow)
+        for (row, col), (char, sid, _) in cells.items():
+            target.put(row, col, char, sid)
+        target.dirty.update(range(self.height))
+
+    def _layers_only(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        raise TypeError(f'{type(self).__name__} points are plotted by layers only (see add_layer)')
+
+    def __setitem__(self, point: typing.Union[graph.Point, typing.Tuple[int, int]], char: str) -> None:
+        # The constructor points are plotted (by Graph.__init__) before the layers exist.
+        if hasattr(self, 'layers'):
+            self._layers_only()
+        super().__setitem__(point, char)
+
+    __delitem__     = _layers_only
+    plot_many       = _layers_only
+    plot_bins       = _layers_only
+    plot_binned     = _layers_only
+    plot_subcell    = _layers_only
+    plot_line       = _layers_only
+
+    def legend(self) -> typing.List[str]:
+        """
+        Create the legend lines (colored token and layer name), from the top layer down.
+
+        :return: list of strings representing the legend.
+        :rtype: typing.List[str]
+        """
+        lines = [
+            f'{color.colored(layer.token, layer.fore, layer.back, layer.style)} {layer.name}'
+            for layer in sorted(self.layers.values(), key=lambda layer: -layer.z)
+        ]
+        if any(layer.policy is Collision.LEGEND for layer in self.layers.values()):
+            lines.append(f'{self.overlap_marker} overlap')
+        return lines
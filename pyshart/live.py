@@ -0,0 +1,81 @@
+"""
+Live module that contains the LiveRenderer class.
+Provides incremental redraw of a Graph: only rows changed since the last frame are sent to the terminal.
+"""
+import sys
+import time
+import typing
+
+from . import color
+from . import graph
+from . import render
+
+CSI = '\x1b['
+
+
+class LiveRenderer:
+    """
+    LiveRenderer class redraws a graph in place, rewriting only its changed rows.
+    The first frame is drawn as a whole, following frames move the cursor up to each changed row.
+    Rows may be re-encoded with the minimal escape sequences by a render.SGREncoder.
+    """
+    def __init__(
+            self,
+            graph   : graph.Graph,
+            stream  : typing.TextIO = None,
+            max_fps : float = None,
+            encoder : render.SGREncoder = None,
+    ):
+        self.graph      = graph
+        self.encoder    = encoder
+        self.stream     = stream if stream is not None else sys.stdout
+        if self.stream is sys.stdout or self.stream is sys.stderr:
+            color.init()
+        self.max_fps    = max_fps
+        self._interval  = 1.0 / max_fps if max_fps else 0.0
+        self._last      = None  # type: typing.Optional[float]
+        self._drawn     = False
+
+    def _frame(self) -> str:
+        """
+        Build the next frame, consuming the graph dirty rows.
+
+        :return: the escape sequences and rows to write.
+        :rtype: str
+        """
+        dirty = self.graph.pop_dirty()
+        if not self._drawn:
+            self._drawn = True
+            rows = self.graph._draw()
+            if self.encoder is not None:
+                rows = [self.encoder.encode(row) for row in rows]
+            return '\n'.join(rows) + '\n'
+        parts = []
+        # The cursor rests on the line below the graph, row 0 is the last line of the graph.
+        for row in sorted(dirty, reverse=True):
+            up = row + 1
+            line = self.graph._draw_row(row)
+            if self.encoder is not None:
+                line = self.encoder.encode(line)
+            parts.append(f'{CSI}{up}A\r{line}{CSI}K{CSI}{up}B\r')
+        return ''.join(parts)
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Send the rows changed since the last frame in one buffered write.
+        When 'max_fps' is set, frames requested too early are skipped (their rows are kept for the next frame).
+
+        :param force: ignore the frame rate cap, defaults to False.
+        :type force: bool
+        :return: whether a frame was written.
+        :rtype: bool
+        """
+        now = time.monotonic()
+        if not force and self._last is not None and now - self._last < self._interval:
+            return False
+        frame = self._frame()
+        if frame:
+            self.stream.write(frame)
+            self.stream.flush()
+        self._last = now
+        return True
@@ -0,0 +1,95 @@
+"""
+Parallel module that builds and renders many graphs across a process pool.
+Provides the Panel spec (data shipped as compact arrays) and the batch rendering API.
+"""
+import array
+import concurrent.futures
+import dataclasses
+import io
+import typing
+
+from . import graph
+from . import render
+
+
+@dataclasses.dataclass
+class Panel:
+    """
+    Panel dataclass that holds a graph data (as 'd' arrays, pickled compactly) and its look.
+    The graph is laid out by Graph.auto.
+    """
+    xs          : typing.Sequence[float]
+    ys          : typing.Sequence[float]
+    width       : int = 80
+    height      : int = 20
+    normalizer_x: int = 10
+    normalizer_y: int = 10
+    token       : str = 'X'
+    fore        : str = ''
+    back        : str = ''
+    style       : str = ''
+    fmt         : render.Format = render.Format.ANSI
+
+    def __post_init__(self):
+        if not isinstance(self.xs, array.array):
+            self.xs = array.array('d', self.xs)
+        if not isinstance(self.ys, array.array):
+            self.ys = array.array('d', self.ys)
+        if len(self.xs) != len(self.ys):
+            raise ValueError('xs and ys must be of the same length')
+
+
+def render_panel(panel: Panel, encoding: str = 'utf-8') -> bytes:
+    """
+    Build and render a single panel.
+
+    :param panel: the panel to render.
+    :type panel: Panel
+    :param encoding: output encoding, defaults to 'utf-8'.
+    :type encoding: str
+    :return: the rendered panel.
+    :rtype: bytes
+    """
+    panel_graph = graph.Graph.auto(
+        xs              = panel.xs,
+        ys              = panel.ys,
+        width           = panel.width,
+        height          = panel.height,
+        normalizer_x    = panel.normalizer_x,
+        normalizer_y    = panel.normalizer_y,
+        token           = panel.token,
+        fore            = panel.fore,
+        back            = panel.back,
+        style           = panel.style,
+    )
+    target = io.BytesIO()
+    render.render(panel_graph, target=target, fmt=panel.fmt, encoding=encoding)
+    return target.getvalue()
+
+
+def render_panels(
+        panels      : typing.Iterable[Panel],
+        max_workers : int = None,
+        chunksize   : int = 1,
+        encoding    : str = 'utf-8',
+) -> typing.List[bytes]:
+    """
+    Build and render many panels across a process pool, the results keep the panels order.
+
+    :param panels: the panels to render.
+    :type panels: typing.Iterable[Panel]
+    :param max_workers: number of worker processes, defaults to None (the number of CPUs), 1 renders in process.
+    :type max_workers: int, optional
+    :param chunksize: number of panels sent to a worker at once, defaults to 1.
+    :type chunksize: int
+    :param encoding: output encoding, defaults to 'utf-8'.
+    :type encoding: str
+    :return: the rendered panels.
+    :rtype: typing.List[bytes]
+    """
+    panels      = list(panels)
+    encodings   = [encoding] * len(panels)
+    if max_workers == 1 or len(panels) <= 1:
+        return list(map(render_panel, panels, encodings))
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(render_panel, panels, encodings, chunksize=chunksize))
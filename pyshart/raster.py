@@ -0,0 +1,104 @@
+"""
+Raster module that rasterizes line segments into graph cells.
+Provides segments clipping (Liang-Barsky) and integer Bresenham rasterization.
+"""
+import typing
+
+Segment = typing.Tuple[int, int, int, int]
+
+
+def clip_segment(
+        x0      : float,
+        y0      : float,
+        x1      : float,
+        y1      : float,
+        bounds  : typing.Tuple[int, int, int, int],
+) -> typing.Optional[Segment]:
+    """
+    Clip a segment against a rectangle (Liang-Barsky), the clipped end points are rounded to cells.
+
+    :param bounds: (min_x, min_y, max_x, max_y) inclusive bounds.
+    :type bounds: typing.Tuple[int, int, int, int]
+    :return: the clipped segment (x0, y0, x1, y1), None if the segment is out of the bounds.
+    :rtype: typing.Optional[Segment]
+    """
+    min_x, min_y, max_x, max_y = bounds
+    dx      = x1 - x0
+    dy      = y1 - y0
+    start   = 0.0
+    stop    = 1.0
+    for p, q in ((-dx, x0 - min_x), (dx, max_x - x0), (-dy, y0 - min_y), (dy, max_y - y0)):
+        if p == 0:
+            if q < 0:
+                return None
+            continue
+        t = q / p
+        if p < 0:
+            if t > stop:
+                return None
+            start = max(start, t)
+        else:
+            if t < start:
+                return None
+            stop = min(stop, t)
+    return (
+        int(round(x0 + start * dx)),
+        int(round(y0 + start * dy)),
+        int(round(x0 + stop * dx)),
+        int(round(y0 + stop * dy)),
+    )
+
+
+def bresenham(x0: int, y0: int, x1: int, y1: int) -> typing.Iterator[typing.Tuple[int, int]]:
+    """
+    Yield the cells of the segment from (x0, y0) to (x1, y1), both included (integer Bresenham).
+
+    :rtype: typing.Iterator[typing.Tuple[int, int]]
+    """
+    dx  = abs(x1 - x0)
+    dy  = -abs(y1 - y0)
+    sx  = 1 if x0 < x1 else -1
+    sy  = 1 if y0 < y1 else -1
+    err = dx + dy
+    while True:
+        yield x0, y0
+        if x0 == x1 and y0 == y1:
+            return
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x0  += sx
+        if e2 <= dx:
+            err += dx
+            y0  += sy
+
+
+def polyline(
+        xs      : typing.Sequence[float],
+        ys      : typing.Sequence[float],
+        bounds  : typing.Tuple[int, int, int, int],
+) -> typing.Set[typing.Tuple[int, int]]:
+    """
+    Returns the cells of the polyline connecting the vertices, clipped against the bounds.
+    The per segment cost depends on its visible cells only.
+
+    :param xs: vertices 'x' values.
+    :type xs: typing.Sequence[float]
+    :param ys: vertices 'y' values, parallel to 'xs'.
+    :type ys: typing.Sequence[float]
+    :param bounds: (min_x, min_y, max_x, max_y) inclusive bounds.
+    :type bounds: typing.Tuple[int, int, int, int]
+    :rtype: typing.Set[typing.Tuple[int, int]]
+    """
+    if len(xs) != len(ys):
+        raise ValueError('xs and ys must be of the same length')
+    cells = set()   # type: typing.Set[typing.Tuple[int, int]]
+    if len(xs) == 1:
+        segments = [(xs[0], ys[0], xs[0], ys[0])]
+    else:
+        segments = zip(xs, ys, xs[1:], ys[1:])
+    for x0, y0, x1, y1 in segments:
+        clipped = clip_segment(x0, y0, x1, y1, bounds)
+        if clipped is not None:
+            cells.update(bresenham(*clipped))
+    return cells
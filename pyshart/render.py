@@ -0,0 +1,477 @@
+"""
+Render module that streams graphs rows into writable sinks.
+Provides ANSI, plain (ANSI-stripped) and HTML output formats, written top to bottom without building the whole frame.
+"""
+import enum
+import functools
+import html
+import io
+import os
+import re
+import sys
+import time
+import typing
+
+from . import color
+from . import instrument
+
+# Select Graphic Rendition escape sequence (the only escape sequences the graphs emit).
+SGR_PATTERN = re.compile('\x1b\\[([0-9;]*)m')
+
+# Raw sinks (file descriptors / sockets) are flushed once this many bytes are pending.
+FLUSH_SIZE = 1 << 16
+
+# CSS colors of the 16 basic SGR colors (normal 0-7, bright 8-15).
+CSS_COLORS = (
+    '#000000', '#cd0000', '#00cd00', '#cdcd00', '#0000ee', '#cd00cd', '#00cdcd', '#e5e5e5',
+    '#7f7f7f', '#ff0000', '#00ff00', '#ffff00', '#5c5cff', '#ff00ff', '#00ffff', '#ffffff',
+)
+
+
+class Format(enum.Enum):
+    """
+    Format enum holds the rendering output options.
+    """
+
+    ANSI    = 'ansi'
+    PLAIN   = 'plain'
+    HTML    = 'html'
+    # ANSI with the minimal SGR transitions, colors reduced to the terminal capability (see SGREncoder).
+    COMPACT = 'compact'
+
+
+class Capability(enum.IntEnum):
+    """
+    Capability enum holds the terminal color support levels (the number of colors).
+    """
+
+    NONE        = 0
+    BASIC       = 16
+    EXTENDED    = 256
+    TRUECOLOR   = 1 << 24
+
+
+def detect_capability(environ: typing.Mapping[str, str] = None) -> Capability:
+    """
+    Returns the color support of the terminal described by the environment ('NO_COLOR', 'TERM', 'COLORTERM').
+
+    :param environ: environment variables, defaults to None (os.environ).
+    :type environ: typing.Mapping[str, str], optional
+    :rtype: Capability
+    """
+    environ = os.environ if environ is None else environ
+    term    = environ.get('TERM', '')
+    if 'NO_COLOR' in environ or term == 'dumb':
+        return Capability.NONE
+    if environ.get('COLORTERM', '').lower() in ('truecolor', '24bit') or 'WT_SESSION' in environ:
+        return Capability.TRUECOLOR
+    if '256' in term:
+        return Capability.EXTENDED
+    return Capability.BASIC
+
+
+@functools.lru_cache(maxsize=None)
+def terminal_capability() -> Capability:
+    """
+    Returns the color support of the terminal, detected once per process (see 'detect_capability').
+
+    :rtype: Capability
+    """
+    return detect_capability()
+
+
+def strip_ansi(text: str) -> str:
+    """
+    Returns the text without its SGR escape sequences.
+
+    :rtype: str
+    """
+    return SGR_PATTERN.sub('', text)
+
+
+def _xterm_css(index: int) -> str:
+    """
+    Returns the CSS color of a 256 colors table index.
+
+    :rtype: str
+    """
+    if index < 16:
+        return CSS_COLORS[index]
+    return '#{:02x}{:02x}{:02x}'.format(*_xterm_rgb(index))
+
+
+def _xterm_rgb(index: int) -> typing.Tuple[int, int, int]:
+    """
+    Returns the (red, green, blue) levels of a 256 colors table index.
+
+    :rtype: typing.Tuple[int, int, int]
+    """
+    if index < 16:
+        code = CSS_COLORS[index]
+        return int(code[1:3], 16), int(code[3:5], 16), int(code[5:7], 16)
+    if index < 232:
+        index -= 16
+        levels = [0 if v == 0 else 55 + v * 40 for v in (index // 36, index // 6 % 6, index % 6)]
+        return levels[0], levels[1], levels[2]
+    gray = 8 + (index - 232) * 10
+    return gray, gray, gray
+
+
+def _nearest(rgb: typing.Sequence[int], indices: typing.Iterable[int]) -> int:
+    """
+    Returns the 256 colors table index (out of 'indices') nearest to the given (red, green, blue) levels.
+
+    :rtype: int
+    """
+    return min(indices, key=lambda index: sum((a - b) ** 2 for a, b in zip(rgb, _xterm_rgb(index))))
+
+
+def _apply_sgr(state: typing.Dict[str, str], params: str) -> None:
+    """
+    Update the CSS state (color, background, font-weight, opacity) by the SGR parameters.
+
+    :rtype: None
+    """
+    codes = [int(code) if code else 0 for code in params.split(';')]
+    i = 0
+    while i < len(codes):
+        code = codes[i]
+        if code == 0:
+            state.clear()
+        elif code == 1:
+            state['font-weight'] = 'bold'
+        elif code == 2:
+            state['opacity'] = '0.6'
+        elif code == 22:
+            state.pop('font-weight', None)
+            state.pop('opacity', None)
+        elif 30 <= code <= 37 or 90 <= code <= 97:
+            state['color'] = CSS_COLORS[code - 30 if code < 90 else code - 82]
+        elif 40 <= code <= 47 or 100 <= code <= 107:
+            state['background'] = CSS_COLORS[code - 40 if code < 100 else code - 92]
+        elif code == 39:
+            state.pop('color', None)
+        elif code == 49:
+            state.pop('background', None)
+        elif code in (38, 48) and i + 1 < len(codes):
+            key = 'color' if code == 38 else 'background'
+            if codes[i + 1] == 5 and i + 2 < len(codes):
+                state[key] = _xterm_css(codes[i + 2])
+                i += 2
+            elif codes[i + 1] == 2 and i + 4 < len(codes):
+                state[key] = '#{:02x}{:02x}{:02x}'.format(*codes[i + 2:i + 5])
+                i += 4
+        i += 1
+
+
+# SGR attributes (besides the colors) and the codes turning them off.
+_SGR_ATTRIBUTES = {1: 'bold', 2: 'dim', 3: 'italic', 4: 'underline', 5: 'blink', 7: 'reverse', 8: 'hidden', 9: 'strike'}
+_SGR_OFF        = {'bold': 22, 'dim': 22, 'italic': 23, 'underline': 24, 'blink': 25, 'reverse': 27, 'hidden': 28, 'strike': 29}
+# Attributes visible on spaces: spaces under any other state are written without switching the state.
+_SPACE_VISIBLE  = ('back', 'underline', 'reverse', 'strike')
+
+
+class SGREncoder:
+    """
+    SGREncoder class re-encodes rendered rows with the minimal SGR transitions, tracking the terminal state:
+    equally styled runs are merged (resets followed by the same prefix vanish), spaces do not switch the state
+    unless their style is visible on them (background, underline...), and a single reset ends a styled row.
+    Colors beyond the terminal capability are reduced to the nearest supported color (all stripped for none).
+    """
+    def __init__(self, capability: Capability = Capability.TRUECOLOR):
+        self.capability = Capability(capability)
+        self._states    = {}    # type: typing.Dict[typing.Tuple[typing.Tuple[typing.Tuple[str, str], ...], str], typing.Dict[str, str]]
+
+    def _color(self, codes: typing.List[int], i: int, back: bool) -> typing.Tuple[typing.Optional[str], int]:
+        """
+        Parse the color at codes[i] (basic, 256 colors or true color), reduced to the capability.
+
+        :return: the color codes (None for no color) and the index of the next code.
+        :rtype: typing.Tuple[typing.Optional[str], int]
+        """
+        code = codes[i]
+        base = 40 if back else 30
+        if code in (38, 48):
+            if i + 2 < len(codes) and codes[i + 1] == 5:
+                index, rgb, i = codes[i + 2], None, i + 3
+            elif i + 4 < len(codes) and codes[i + 1] == 2:
+                index, rgb, i = None, codes[i + 2:i + 5], i + 5
+            else:
+                return None, len(codes)
+            if rgb is not None and self.capability >= Capability.TRUECOLOR:
+                return f'{code};2;{rgb[0]};{rgb[1]};{rgb[2]}', i
+            if index is None:
+                index = _nearest(rgb, range(16, 256))
+            if self.capability >= Capability.EXTENDED:
+                return f'{code};5;{index}', i
+            if index >= 16:
+                index = _nearest(_xterm_rgb(index), range(16))
+            return str(base + index if index < 8 else base + 60 + index - 8), i
+        return str(code), i + 1
+
+    def _apply(self, state: typing.Dict[str, str], params: str) -> None:
+        """
+        Update the SGR state (attribute to its codes) by the SGR parameters.
+
+        :rtype: None
+        """
+        codes = [int(code) if code else 0 for code in params.split(';')]
+        i = 0
+        while i < len(codes):
+            code = codes[i]
+            if code == 0:
+                state.clear()
+            elif code in _SGR_ATTRIBUTES:
+                state[_SGR_ATTRIBUTES[code]] = str(code)
+            elif code == 22:
+                state.pop('bold', None)
+                state.pop('dim', None)
+            elif code in (23, 24, 25, 27, 28, 29):
+                for name, off in _SGR_OFF.items():
+                    if off == code:
+                        state.pop(name, None)
+            elif code == 39:
+                state.pop('fore', None)
+            elif code == 49:
+                state.pop('back', None)
+            elif 30 <= code <= 38 or 90 <= code <= 97 or 40 <= code <= 48 or 100 <= code <= 107:
+                key = 'back' if 40 <= code <= 48 or 100 <= code <= 107 else 'fore'
+                color, i = self._color(codes, i, key == 'back')
+                if color is not None:
+                    state[key] = color
+                continue
+            i += 1
+
+    def _state(self, current: typing.Dict[str, str], params: str) -> typing.Dict[str, str]:
+        """
+        Returns the state following 'current' by the SGR parameters (cached, the returned state must not be mutated).
+
+        :rtype: typing.Dict[str, str]
+        """
+        key = (tuple(sorted(current.items())), params)
+        state = self._states.get(key)
+        if state is None:
+            state = dict(current)
+            self._apply(state, params)
+            if self.capability is Capability.NONE:
+                state = {}
+            state = self._states[key] = state
+        return state
+
+    @staticmethod
+    def transition(current: typing.Dict[str, str], target: typing.Dict[str, str]) -> str:
+        """
+        Returns the shortest SGR sequence switching the terminal from the 'current' state to the 'target' state.
+
+        :rtype: str
+        """
+        if current == target:
+            return ''
+        if not target:
+            return '\x1b[0m'
+        reset   = ['0'] + [target[name] for name in sorted(target)]
+        codes   = []    # type: typing.List[str]
+        removed = [name for name in current if name not in target]
+        for name in removed:
+            off = '39' if name == 'fore' else '49' if name == 'back' else str(_SGR_OFF[name])
+            if off not in codes:
+                codes.append(off)
+        for name in sorted(target):
+            # 22 turns both bold and dim off.
+            if current.get(name) != target[name] or (name in ('bold', 'dim') and '22' in codes):
+                codes.append(target[name])
+        if len(';'.join(reset)) <= len(';'.join(codes)):
+            codes = reset
+        return '\x1b[' + ';'.join(codes) + 'm'
+
+    def encode(self, row: str) -> str:
+        """
+        Re-encode a rendered row (see the class documentation), the terminal state is reset at the row end.
+
+        :param row: a rendered row (with SGR escape sequences).
+        :type row: str
+        :rtype: str
+        """
+        parts   = []
+        emitted = {}    # type: typing.Dict[str, str]
+        wanted  = {}    # type: typing.Dict[str, str]
+        start   = 0
+        matches = list(SGR_PATTERN.finditer(row))
+        for index in range(len(matches) + 1):
+            end     = matches[index].start() if index < len(matches) else len(row)
+            text    = row[start:end]
+            if text:
+                invisible = text.isspace() and not any(name in state for state in (emitted, wanted) for name in _SPACE_VISIBLE)
+                if not invisible:
+                    parts.append(self.transition(emitted, wanted))
+                    emitted = wanted
+                parts.append(text)
+            if index < len(matches):
+                wanted  = self._state(wanted, matches[index].group(1))
+                start   = matches[index].end()
+        parts.append(self.transition(emitted, {}))
+        return ''.join(parts)
+
+
+def to_html(row: str) -> str:
+    """
+    Convert a rendered row into HTML, colored runs become styled spans.
+
+    :param row: a rendered row (with SGR escape sequences).
+    :type row: str
+    :rtype: str
+    """
+    parts   = []
+    state   = {}    # type: typing.Dict[str, str]
+    start   = 0
+    for match in SGR_PATTERN.finditer(row):
+        parts.append(_html_run(row[start:match.start()], state))
+        _apply_sgr(state, match.group(1))
+        start = match.end()
+    parts.append(_html_run(row[start:], state))
+    return ''.join(parts)
+
+
+def _html_run(text: str, state: typing.Dict[str, str]) -> str:
+    """
+    Returns the escaped text, wrapped by a span styled by the CSS state (if any).
+
+    :rtype: str
+    """
+    if not text:
+        return ''
+    if not state:
+        return html.escape(text)
+    css = ';'.join(f'{key}:{value}' for key, value in sorted(state.items()))
+    return f'<span style="{css}">{html.escape(text)}</span>'
+
+
+class Sink:
+    """
+    Sink class adapts any writable target to text writes.
+    Text streams are written as is, binary streams get encoded text,
+    file descriptors and sockets get encoded text in chunks of about FLUSH_SIZE bytes.
+    """
+    def __init__(self, target: typing.Any, encoding: str = 'utf-8'):
+        self.target     = target
+        self.encoding   = encoding
+        self._pending   = bytearray()
+        if isinstance(target, int):
+            self._raw = lambda data: os.write(target, data)
+        elif hasattr(target, 'sendall'):
+            self._raw = target.sendall
+        else:
+            self._raw = None
+        # colorama wraps the standard streams with proxies that are not io.TextIOBase (but do have an encoding).
+        self._text = self._raw is None and (isinstance(target, io.TextIOBase) or hasattr(target, 'encoding'))
+
+    def write(self, text: str) -> None:
+        """
+        Write text to the target.
+
+        :rtype: None
+        """
+        if self._text:
+            self.target.write(text)
+        elif self._raw is None:
+            self.target.write(text.encode(self.encoding))
+        else:
+            self._pending += text.encode(self.encoding)
+            if len(self._pending) >= FLUSH_SIZE:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Send the pending data to the target (and flush it, if it supports flushing).
+
+        :rtype: None
+        """
+        if self._raw is not None:
+            data = memoryview(bytes(self._pending))
+            self._pending.clear()
+            while data:
+                written = self._raw(data)
+                # socket.sendall returns None once everything was sent.
+                data = data[written:] if written is not None else data[:0]
+        elif hasattr(self.target, 'flush'):
+            self.target.flush()
+
+
+def render(
+        graph   : typing.Any,
+        target  : typing.Any = None,
+        fmt     : Format = Format.ANSI,
+        encoding: str = 'utf-8',
+) -> None:
+    """
+    Stream the graph rows, top to bottom, into the target.
+
+    :param graph: the graph to render (see pyshart.graph.Graph).
+    :type graph: pyshart.graph.Graph
+    :param target: text stream, binary stream, file descriptor or socket, defaults to None (sys.stdout).
+    :type target: typing.Any, optional
+    :param fmt: output format, defaults to Format.ANSI.
+    :type fmt: Format
+    :param encoding: encoding of binary targets, defaults to 'utf-8'.
+    :type encoding: str
+    :rtype: None
+    """
+    target  = target if target is not None else sys.stdout
+    fmt     = _terminal_format(target, Format(fmt))
+    sink    = Sink(target, encoding=encoding)
+    if fmt is Format.HTML:
+        sink.write('<pre>')
+    lines   = _lines(graph, fmt)
+    profile = instrument.active()
+    if profile is None:
+        for line in lines:
+            sink.write(line + '\n')
+    else:
+        clock = time.perf_counter
+        for line in profile.timed(lines, instrument.ROWS):
+            if fmt in (Format.ANSI, Format.COMPACT):
+                profile.counts[instrument.ESCAPE_BYTES] += len(line) - len(strip_ansi(line))
+            start = clock()
+            sink.write(line + '\n')
+            profile.times[instrument.OUTPUT] += clock() - start
+    with instrument.phase(instrument.OUTPUT):
+        if fmt is Format.HTML:
+            sink.write('</pre>\n')
+        sink.flush()
+
+
+def _terminal_format(target: typing.Any, fmt: Format) -> Format:
+    """
+    Returns the format to render to the target: escape codes are not written to redirected standard streams.
+    The terminal is prepared for colored output on the first render to a standard stream (see color.init).
+
+    :rtype: Format
+    """
+    if fmt not in (Format.ANSI, Format.COMPACT) or (target is not sys.stdout and target is not sys.stderr):
+        return fmt
+    try:
+        tty = target.isatty()
+    except (AttributeError, ValueError):
+        tty = False
+    if not tty:
+        return Format.PLAIN
+    color.init()
+    return fmt
+
+
+def _lines(graph: typing.Any, fmt: Format) -> typing.Iterator[str]:
+    """
+    Yield the graph rows, top to bottom, in the given format.
+
+    :rtype: typing.Iterator[str]
+    """
+    encoder = SGREncoder(terminal_capability()) if fmt is Format.COMPACT else None
+    for row in range(graph.height - 1, -1, -1):
+        line = graph._draw_row(row)
+        if fmt is Format.PLAIN:
+            line = strip_ansi(line)
+        elif fmt is Format.HTML:
+            line = to_html(line)
+        elif fmt is Format.COMPACT:
+            line = encoder.encode(line)
+        yield line
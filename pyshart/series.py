@@ -0,0 +1,132 @@
+"""
+Series module that contains the TimeSeries class.
+Provides a sliding-window graph for streaming data, backed by a ring buffer of columns.
+"""
+import array
+import typing
+
+from . import canvas
+from . import graph
+
+
+class TimeSeries(graph.Graph):
+    """
+    TimeSeries class is a Graph whose data columns form a ring buffer of 'window' samples.
+    Appending a sample overwrites the oldest column in place, the view is rotated only when rendering,
+    so the per-sample cost does not depend on the window size.
+    The graph canvas holds the axes only, the samples are stored in the 'data' canvas: samples are added by 'append'
+    only, the Graph plotting methods (item assignment, plot_many, plot_binned, plot_line...) raise TypeError.
+
+    :raises ValueError: if 'window' is smaller than 1 or 'token' is not a single character.
+    """
+    def __init__(
+            self,
+            window      : int,
+            height_y    : int,
+            step_x      : int = 1,
+            step_y      : int = 1,
+            normalizer_x: int = 10,
+            normalizer_y: int = 10,
+            negative_y  : bool = False,
+            token       : str = 'X',
+            fore        : str = '',
+            back        : str = '',
+            style       : str = '',
+    ):
+        if window < 1:
+            raise ValueError('window must be at least 1')
+        if len(token) != 1:
+            raise ValueError('token length must be of size 1')
+        super().__init__(
+            points          = [],
+            height_x        = window,
+            height_y        = height_y,
+            step_x          = step_x,
+            step_y          = step_y,
+            normalizer_x    = normalizer_x,
+            normalizer_y    = normalizer_y,
+            negative_x      = False,
+            negative_y      = negative_y,
+        )
+        self.window     = window
+        self.token      = token
+        self.data       = canvas.Canvas(width=window, height=self.height)
+        self._style     = self.data.style_id(fore + back + style)
+        self._axis_row  = self.neg_height_y
+        self._min_y     = -self.neg_height_y
+        # Physical slot -> canvas row of the sample (-1 when the slot is empty).
+        self._rows      = array.array('i', [-1] * window)
+        self._values    = [None] * window   # type: typing.List[typing.Optional[float]]
+        # Physical slot of the oldest sample (and of the next sample to be written).
+        self._head      = 0
+
+    @property
+    def values(self) -> typing.List[float]:
+        """
+        The samples within the window, oldest first.
+
+        :rtype: typing.List[float]
+        """
+        ordered = self._values[self._head:] + self._values[:self._head]
+        return [value for value in ordered if value is not None]
+
+    def append(self, value: float) -> None:
+        """
+        Append a sample, dropping the oldest one once the window is full.
+        Values are scaled by 'step_y' and clipped to the graph height.
+
+        :param value: the sample value.
+        :type value: float
+        :rtype: None
+        """
+        slot    = self._head
+        old     = self._rows[slot]
+        if old >= 0:
+            self.data.clear(old, slot)
+        y       = min(max(int(round(value / self.step_y)), self._min_y), self.height_y)
+        row     = y + self._axis_row
+        self.data.put(row, slot, self.token, self._style)
+        self._rows[slot]    = row
+        self._values[slot]  = value
+        self._head          = (slot + 1) % self.window
+        # Every row holding a sample is shifted by one column.
+        self.canvas.dirty.update(range(self.height))
+
+    def _draw_row(self, row: int, start: int = 0) -> str:
+        head    = self._head
+        axis    = self.canvas.render_row(row, start, 1)
+        # Number of (oldest) samples columns to skip.
+        skip    = max(start - 1, 0)
+        if row != self._axis_row:
+            if skip <= self.window - head:
+                return axis + self.data.render_row(row, head + skip) + self.data.render_row(row, 0, head)
+            return axis + self.data.render_row(row, skip - (self.window - head), head)
+        # The x axis labels show through where there is no sample.
+        cells = []
+        for i in range(skip, self.window):
+            slot = (head + i) % self.window
+            if self._rows[slot] == row:
+                cells.append(self.data.get(row, slot))
+            else:
+                cells.append(self.canvas.get(row, i + 1))
+        return axis + ''.join(cells)
+
+    def __getitem__(self, point: typing.Union[graph.Point, typing.Tuple[int, int]]) -> str:
+        row, col = self._transform_true_point(*self._validate_point(point=point))
+        if col > 0:
+            # Column 1 shows the oldest sample.
+            slot = (self._head + col - 1) % self.window
+            if self._rows[slot] == row:
+                return self.data.get(row, slot)
+        return self.canvas.get(row, col)
+
+    def _append_only(self, *args: typing.Any, **kwargs: typing.Any) -> None:
+        raise TypeError(f'{type(self).__name__} samples are added by append only')
+
+    __setitem__     = _append_only
+    __delitem__     = _append_only
+    plot_many       = _append_only
+    plot_bins       = _append_only
+    plot_binned     = _append_only
+    plot_subcell    = _append_only
+    plot_line       = _append_only
@@ -0,0 +1,210 @@
+"""
+Snapshot module that saves built graphs to a compact binary file and loads them back without re-plotting.
+A snapshot holds the axes spec, the canvas code points and style indices, and optional raw series.
+
+Layout: MAGIC, header size (uint32, little endian), JSON header, then the raw arrays in the order of the header:
+the code points rows, the style indices rows and the series values (float64), in the byte order of the header.
+"""
+import array
+import json
+import mmap
+import os
+import struct
+import sys
+import typing
+
+from . import canvas
+from . import graph
+from . import series as _series
+
+MAGIC   = b'PYSHART\x01'
+VERSION = 1
+
+# Graph attributes saved in the header (the constructor arguments of the graph).
+AXES_FIELDS = (
+    'height_x', 'height_y', 'step_x', 'step_y', 'normalizer_x', 'normalizer_y',
+    'neg_height_x', 'neg_height_y', 'unit_x', 'unit_y',
+)
+
+_HEADER_SIZE = struct.Struct('<I')
+
+
+def save(
+        target  : graph.Graph,
+        file    : typing.Union[str, os.PathLike, typing.BinaryIO],
+        series  : typing.Dict[str, typing.Sequence[float]] = None,
+) -> None:
+    """
+    Save a graph (and optional raw series) to a snapshot file.
+    Only the Graph state (axes and canvas) is saved, subclasses are loaded back as plain graphs.
+
+    :param target: the graph to save.
+    :type target: graph.Graph
+    :param file: file path or binary file.
+    :type file: typing.Union[str, os.PathLike, typing.BinaryIO]
+    :param series: named raw series to save along, defaults to None.
+    :type series: typing.Dict[str, typing.Sequence[float]], optional
+    :raises TypeError: the graph is a time series (its samples are not held by the canvas).
+    :rtype: None
+    """
+    if isinstance(target, _series.TimeSeries):
+        raise TypeError('time series cannot be saved, save their values as a series instead')
+    cells               = target.canvas
+    styles, prefixes    = _used_styles(cells)
+    values              = {name: array.array('d', data) for name, data in (series or {}).items()}
+    header  = dict(
+        version     = VERSION,
+        byteorder   = sys.byteorder,
+        char_size   = array.array(canvas.CHAR_TYPECODE).itemsize,
+        axes        = {name: getattr(target, name) for name in AXES_FIELDS},
+        fill        = cells.fill,
+        prefixes    = prefixes,
+        overflow    = [[row, col, value] for (row, col), value in cells.overflow.items()],
+        series      = [[name, len(data)] for name, data in values.items()],
+    )
+    encoded = json.dumps(header, separators=(',', ':')).encode('utf-8')
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, 'wb') as writer:
+            _write(writer, encoded, cells.chars, styles, values)
+    else:
+        _write(file, encoded, cells.chars, styles, values)
+
+
+def _used_styles(cells: canvas.Canvas) -> typing.Tuple[typing.List[array.array], typing.List[str]]:
+    """
+    Returns the style indices rows renumbered over the styles in use only, and the prefixes of the new indices.
+
+    :rtype: typing.Tuple[typing.List[array.array], typing.List[str]]
+    """
+    used    = sorted(set().union(*cells.styles) - {canvas.NO_STYLE, canvas.OVERFLOW_STYLE})
+    if used == list(range(1, len(cells.prefixes))):
+        return cells.styles, cells.prefixes
+    mapping = {canvas.NO_STYLE: canvas.NO_STYLE, canvas.OVERFLOW_STYLE: canvas.OVERFLOW_STYLE}
+    mapping.update((sid, index) for index, sid in enumerate(used, 1))
+    styles  = [array.array(canvas.STYLE_TYPECODE, [mapping[sid] for sid in row]) for row in cells.styles]
+    return styles, [''] + [cells.prefixes[sid] for sid in used]
+
+
+def _write(
+        writer  : typing.BinaryIO,
+        header  : bytes,
+        chars   : typing.List[array.array],
+        styles  : typing.List[array.array],
+        values  : typing.Dict[str, array.array],
+) -> None:
+    writer.write(MAGIC)
+    writer.write(_HEADER_SIZE.pack(len(header)))
+    writer.write(header)
+    for row in chars:
+        row.tofile(writer)
+    for row in styles:
+        row.tofile(writer)
+    for data in values.values():
+        data.tofile(writer)
+
+
+def _rows(data: typing.Any, offset: int, typecode: str, count: int, width: int, swap: bool) -> typing.List[array.array]:
+    """
+    Read 'count' rows of 'width' items starting at 'offset' of 'data' (bytes or mmap).
+
+    :rtype: typing.List[array.array]
+    """
+    rows = []
+    size = array.array(typecode).itemsize * width
+    for index in range(count):
+        row = array.array(typecode)
+        row.frombytes(data[offset + index * size:offset + (index + 1) * size])
+        if swap:
+            row.byteswap()
+        rows.append(row)
+    return rows
+
+
+def _char_rows(data: typing.Any, offset: int, char_size: int, count: int, width: int, byteorder: str) -> typing.List[array.array]:
+    """
+    Read the code points rows, converting them when the snapshot was saved with another code point size.
+
+    :rtype: typing.List[array.array]
+    """
+    if char_size == array.array(canvas.CHAR_TYPECODE).itemsize:
+        return _rows(data, offset, canvas.CHAR_TYPECODE, count, width, byteorder != sys.byteorder)
+    encoding = ('utf-16' if char_size == 2 else 'utf-32') + ('-le' if byteorder == 'little' else '-be')
+    size = char_size * width
+    return [
+        array.array(canvas.CHAR_TYPECODE, bytes(data[offset + index * size:offset + (index + 1) * size]).decode(encoding))
+        for index in range(count)
+    ]
+
+
+def loads(data: typing.Any) -> typing.Tuple[graph.Graph, typing.Dict[str, array.array]]:
+    """
+    Load a graph (and its raw series) from snapshot data.
+
+    :param data: snapshot bytes (or any buffer supporting slicing, e.g. an mmap).
+    :type data: typing.Any
+    :raises ValueError: if the data is not a snapshot (or of an unsupported version).
+    :return: the graph and the raw series by name.
+    :rtype: typing.Tuple[graph.Graph, typing.Dict[str, array.array]]
+    """
+    if data[:len(MAGIC)] != MAGIC:
+        raise ValueError('not a pyshart snapshot')
+    offset          = len(MAGIC)
+    (header_size,)  = _HEADER_SIZE.unpack(data[offset:offset + _HEADER_SIZE.size])
+    offset          += _HEADER_SIZE.size
+    header          = json.loads(bytes(data[offset:offset + header_size]).decode('utf-8'))
+    offset          += header_size
+    if header['version'] != VERSION:
+        raise ValueError(f"unsupported snapshot version {header['version']}")
+
+    axes    = header['axes']
+    width   = axes['height_x'] + axes['neg_height_x'] + 1
+    height  = axes['height_y'] + axes['neg_height_y'] + 1
+    swap    = header['byteorder'] != sys.byteorder
+    chars   = _char_rows(data, offset, header['char_size'], height, width, header['byteorder'])
+    offset  += header['char_size'] * width * height
+    styles  = _rows(data, offset, canvas.STYLE_TYPECODE, height, width, swap)
+    offset  += array.array(canvas.STYLE_TYPECODE).itemsize * width * height
+    cells   = canvas.Canvas.from_rows(
+        chars,
+        styles,
+        overflow    = {(row, col): value for row, col, value in header['overflow']},
+        prefixes    = header['prefixes'],
+        fill        = header['fill'],
+    )
+    result  = graph.Graph.from_canvas(cells, **axes)
+
+    series = {}
+    for name, length in header['series']:
+        (values,) = _rows(data, offset, 'd', 1, length, swap)
+        series[name] = values
+        offset += values.itemsize * length
+    return result, series
+
+
+def load(
+        file    : typing.Union[str, os.PathLike, typing.BinaryIO],
+        use_mmap: bool = True,
+) -> typing.Tuple[graph.Graph, typing.Dict[str, array.array]]:
+    """
+    Load a graph (and its raw series) from a snapshot file.
+
+    :param file: file path or binary file.
+    :type file: typing.Union[str, os.PathLike, typing.BinaryIO]
+    :param use_mmap: map the file in memory instead of reading it, defaults to True.
+    :type use_mmap: bool
+    :raises ValueError: if the file is not a snapshot (or of an unsupported version).
+    :return: the graph and the raw series by name.
+    :rtype: typing.Tuple[graph.Graph, typing.Dict[str, array.array]]
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, 'rb') as reader:
+            return load(reader, use_mmap=use_mmap)
+    if use_mmap:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError, AttributeError):
+            mapped = None
+        if mapped is not None:
+            with mapped:
+                return loads(mapped)
+    return loads(file.read())
@@ -0,0 +1,117 @@
+"""
+Subcell module that packs points into per cell dots bitmasks.
+Provides the braille (2x4 dots per cell) and half-block (1x2 dots per cell) glyphs tables.
+"""
+import enum
+import itertools
+import math
+import operator
+import typing
+
+BRAILLE_BASE = 0x2800
+
+# Braille dot bits by (column, row from the top) within the cell.
+BRAILLE_BITS = (
+    (0x01, 0x02, 0x04, 0x40),
+    (0x08, 0x10, 0x20, 0x80),
+)
+BRAILLE_GLYPHS = ''.join(chr(BRAILLE_BASE + mask) for mask in range(256))
+
+# Half-block bits by (column, row from the top) within the cell.
+HALF_BLOCK_BITS = (
+    (0x01, 0x02),
+)
+HALF_BLOCK_GLYPHS = ' ▀▄█'
+
+
+class SubcellMode(enum.Enum):
+    """
+    SubcellMode enum holds the sub-character rendering options.
+    """
+
+    BRAILLE     = 'braille'
+    HALF_BLOCK  = 'half_block'
+
+    @property
+    def bits(self) -> typing.Tuple[typing.Tuple[int, ...], ...]:
+        """
+        The dots bits by (column, row from the top) within the cell.
+
+        :rtype: typing.Tuple[typing.Tuple[int, ...], ...]
+        """
+        return BRAILLE_BITS if self is SubcellMode.BRAILLE else HALF_BLOCK_BITS
+
+    @property
+    def glyphs(self) -> str:
+        """
+        The glyphs indexed by dots bitmask.
+
+        :rtype: str
+        """
+        return BRAILLE_GLYPHS if self is SubcellMode.BRAILLE else HALF_BLOCK_GLYPHS
+
+    @property
+    def cols(self) -> int:
+        """
+        Number of dots columns within a cell.
+
+        :rtype: int
+        """
+        return len(self.bits)
+
+    @property
+    def rows(self) -> int:
+        """
+        Number of dots rows within a cell.
+
+        :rtype: int
+        """
+        return len(self.bits[0])
+
+
+def _dots(values: typing.Iterable[float], count: int) -> typing.Iterator[int]:
+    # A cell 'c' covers [c - 0.5, c + 0.5), split into 'count' dots (builtins only).
+    return map(math.floor, map(operator.mul, map(operator.add, values, itertools.repeat(0.5)), itertools.repeat(count)))
+
+
+def pack(
+        xs      : typing.Iterable[float],
+        ys      : typing.Iterable[float],
+        mode    : SubcellMode = SubcellMode.BRAILLE,
+) -> typing.Dict[typing.Tuple[int, int], int]:
+    """
+    Pack points (in cell units, fractions address the dots within a cell) into per cell bitmasks.
+
+    :param xs: 'x' values.
+    :type xs: typing.Iterable[float]
+    :param ys: 'y' values, parallel to 'xs'.
+    :type ys: typing.Iterable[float]
+    :param mode: sub-character mode, defaults to SubcellMode.BRAILLE.
+    :type mode: SubcellMode
+    :return: mapping from cell (x, y) to its dots bitmask.
+    :rtype: typing.Dict[typing.Tuple[int, int], int]
+    """
+    mode    = SubcellMode(mode)
+    bits    = mode.bits
+    cols    = mode.cols
+    rows    = mode.rows
+    masks   = {}    # type: typing.Dict[typing.Tuple[int, int], int]
+    # Python level work is bounded by the number of distinct dots.
+    for dot_x, dot_y in set(zip(_dots(xs, cols), _dots(ys, rows))):
+        cell_x, col = divmod(dot_x, cols)
+        cell_y, row = divmod(dot_y, rows)
+        cell        = (cell_x, cell_y)
+        masks[cell] = masks.get(cell, 0) | bits[col][rows - 1 - row]
+    return masks
+
+
+def mask_of(char: str, mode: SubcellMode = SubcellMode.BRAILLE) -> int:
+    """
+    Returns the dots bitmask of a glyph (0 if the character is not a glyph of the mode).
+
+    :rtype: int
+    """
+    if SubcellMode(mode) is SubcellMode.BRAILLE:
+        mask = ord(char) - BRAILLE_BASE if len(char) == 1 else -1
+        return mask if 0 <= mask < 256 else 0
+    return max(HALF_BLOCK_GLYPHS.find(char), 0)
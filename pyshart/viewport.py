@@ -0,0 +1,376 @@
+"""
+Viewport module that contains the PointIndex and Viewport classes.
+Provides pan and zoom over a large plane of raw points: only the points in view are queried and plotted.
+"""
+import array
+import math
+import typing
+
+from . import binning
+from . import graph
+from . import render
+
+Bucket = typing.Tuple[array.array, array.array]
+
+
+def _quarters(low_x: float, low_y: float, high_x: float, high_y: float) -> graph.Quarter:
+    """
+    Returns the quarters (see graph.get_quarter) intersecting the rectangle [low_x, high_x] x [low_y, high_y].
+
+    :rtype: graph.Quarter
+    """
+    quarters = graph.Quarter(0)
+    if high_x >= 0 and high_y >= 0:
+        quarters |= graph.Quarter.QUARTER1
+    if low_x < 0 and high_y > 0:
+        quarters |= graph.Quarter.QUARTER2
+    if low_x < 0 and low_y <= 0:
+        quarters |= graph.Quarter.QUARTER3
+    if high_x >= 0 and low_y < 0:
+        quarters |= graph.Quarter.QUARTER4
+    return quarters
+
+
+def _label(cell: int, step: float, unit: float, normalizer: int) -> str:
+    """
+    Returns the axis label of a cell of the plane (its absolute value in multiples of the unit, normalized).
+
+    :rtype: str
+    """
+    return str(int(round(step * abs(cell) / unit, 9)) % normalizer)
+
+
+class _ViewGraph(graph.Graph):
+    """
+    Graph of a viewport, its axes cross at the cell (axis_x, axis_y) of the plane and are labelled with absolute values.
+    """
+    def __init__(self, axis_x: int, axis_y: int, **kwargs: typing.Any):
+        self.axis_x = axis_x
+        self.axis_y = axis_y
+        super().__init__(**kwargs)
+
+    def _label_axes(self) -> None:
+        """
+        Write the axes and the absolute labels of their cells to the canvas.
+
+        :rtype: None
+        """
+        axis_row, axis_col = self.neg_height_y, self.neg_height_x
+        put = self._canvas.put
+        for col in range(self.width):
+            put(axis_row, col, _label(self.axis_x + col - axis_col, self.step_x, self.unit_x, self.normalizer_x))
+        for row in range(self.height):
+            if row != axis_row:
+                put(row, axis_col, _label(self.axis_y + row - axis_row, self.step_y, self.unit_y, self.normalizer_y))
+
+
+class PointIndex:
+    """
+    PointIndex class stores raw (x, y) points in a spatial grid: points are split by quarter (see graph.Quarter),
+    then into buckets of 'bucket_x' x 'bucket_y' units, each bucket holding parallel 'x' and 'y' arrays.
+    A query only visits the buckets intersecting the requested rectangle, buckets should be a fraction of a view.
+    """
+    def __init__(self, bucket_x: float = 64, bucket_y: float = 64):
+        if bucket_x <= 0 or bucket_y <= 0:
+            raise ValueError('bucket sizes must be positive')
+        self.bucket_x   = bucket_x
+        self.bucket_y   = bucket_y
+        self.buckets    = {
+            quarter: {} for quarter in (graph.Quarter.QUARTER1, graph.Quarter.QUARTER2, graph.Quarter.QUARTER3, graph.Quarter.QUARTER4)
+        }   # type: typing.Dict[graph.Quarter, typing.Dict[typing.Tuple[int, int], Bucket]]
+        self._count     = 0
+        self._bounds    = None  # type: typing.Optional[typing.Tuple[float, float, float, float]]
+
+    def __len__(self) -> int:
+        return self._count
+
+    def extend(self, xs: typing.Iterable[float], ys: typing.Iterable[float]) -> None:
+        """
+        Add many points given as parallel 'x' and 'y' values.
+
+        :raises ValueError: if 'xs' and 'ys' lengths differ.
+        :rtype: None
+        """
+        xs = array.array('d', xs)
+        ys = array.array('d', ys)
+        if len(xs) != len(ys):
+            raise ValueError('xs and ys must be of the same length')
+        if len(xs) == 0:
+            return
+        bucket_x, bucket_y = self.bucket_x, self.bucket_y
+        for x, y in zip(xs, ys):
+            buckets = self.buckets[graph.get_quarter(x, y)]
+            key     = (math.floor(x / bucket_x), math.floor(y / bucket_y))
+            bucket  = buckets.get(key)
+            if bucket is None:
+                bucket = buckets[key] = (array.array('d'), array.array('d'))
+            bucket[0].append(x)
+            bucket[1].append(y)
+        bounds = (min(xs), min(ys), max(xs), max(ys))
+        if self._bounds is not None:
+            bounds = (
+                min(bounds[0], self._bounds[0]), min(bounds[1], self._bounds[1]),
+                max(bounds[2], self._bounds[2]), max(bounds[3], self._bounds[3]),
+            )
+        self._bounds    = bounds
+        self._count     += len(xs)
+
+    def bounds(self) -> typing.Optional[typing.Tuple[float, float, float, float]]:
+        """
+        Returns the bounding rectangle (low x, low y, high x, high y) of the points, None when empty.
+
+        :rtype: typing.Optional[typing.Tuple[float, float, float, float]]
+        """
+        return self._bounds
+
+    def query(
+            self,
+            low_x   : float,
+            low_y   : float,
+            high_x  : float,
+            high_y  : float,
+    ) -> typing.Tuple[typing.List[float], typing.List[float]]:
+        """
+        Returns the points within the rectangle [low_x, high_x) x [low_y, high_y).
+
+        :return: the points 'x' and 'y' values.
+        :rtype: typing.Tuple[typing.List[float], typing.List[float]]
+        """
+        xs, ys  = [], []    # type: typing.List[float], typing.List[float]
+        first_x = math.floor(low_x / self.bucket_x)
+        first_y = math.floor(low_y / self.bucket_y)
+        last_x  = math.floor(high_x / self.bucket_x)
+        last_y  = math.floor(high_y / self.bucket_y)
+        in_view = _quarters(low_x, low_y, high_x, high_y)
+        for quarter, buckets in self.buckets.items():
+            if not quarter & in_view or not buckets:
+                continue
+            if (last_x - first_x + 1) * (last_y - first_y + 1) <= len(buckets):
+                keys = (
+                    (bx, by) for bx in range(first_x, last_x + 1) for by in range(first_y, last_y + 1)
+                    if (bx, by) in buckets
+                )
+            else:
+                # Zoomed out: fewer buckets exist than the view covers.
+                keys = (
+                    (bx, by) for bx, by in buckets
+                    if first_x <= bx <= last_x and first_y <= by <= last_y
+                )
+            for bx, by in keys:
+                bucket_xs, bucket_ys = buckets[(bx, by)]
+                inner = (
+                    low_x <= bx * self.bucket_x and (bx + 1) * self.bucket_x <= high_x and
+                    low_y <= by * self.bucket_y and (by + 1) * self.bucket_y <= high_y
+                )
+                if inner:
+                    xs.extend(bucket_xs)
+                    ys.extend(bucket_ys)
+                    continue
+                for x, y in zip(bucket_xs, bucket_ys):
+                    if low_x <= x < high_x and low_y <= y < high_y:
+                        xs.append(x)
+                        ys.append(y)
+        return xs, ys
+
+
+class Viewport:
+    """
+    Viewport class shows a window of a PointIndex as a graph of 'width' x 'height' cells centered on (center_x, center_y).
+    Each cell covers 'step_x' x 'step_y' units and cells are aligned on the data origin (the view centre snaps to a cell).
+    The axes cross at the data origin when it is in view, at the center of the view otherwise, labels are absolute values.
+    Panning or zooming only queries the points in view, the graph is built on the first draw after a change.
+    A Viewport can be drawn like a Graph (see render.render) and refreshed by live.LiveRenderer.
+    """
+    def __init__(
+            self,
+            index       : PointIndex,
+            width       : int = 81,
+            height      : int = 21,
+            center_x    : float = 0,
+            center_y    : float = 0,
+            step_x      : float = 1,
+            step_y      : float = 1,
+            normalizer_x: int = 10,
+            normalizer_y: int = 10,
+            tokens      : str = binning.DENSITY_TOKENS,
+            colors      : binning.Colors = None,
+    ):
+        self.index          = index
+        self.height_x       = max(width // 2, 1)
+        self.height_y       = max(height // 2, 1)
+        self.center_x       = center_x
+        self.center_y       = center_y
+        self.step_x         = step_x
+        self.step_y         = step_y
+        self.normalizer_x   = normalizer_x
+        self.normalizer_y   = normalizer_y
+        self.tokens         = tokens
+        self.colors         = colors
+        self._graph         = None  # type: typing.Optional[graph.Graph]
+        self._redrawn       = True
+
+    @property
+    def height(self) -> int:
+        """
+        Number of rows of the view.
+
+        :rtype: int
+        """
+        return 2 * self.height_y + 1
+
+    def bounds(self) -> typing.Tuple[float, float, float, float]:
+        """
+        Returns the rectangle (low x, low y, high x, high y) covered by the view.
+
+        :rtype: typing.Tuple[float, float, float, float]
+        """
+        cell_x, cell_y = self._center_cell()
+        return (
+            (cell_x - self.height_x - 0.5) * self.step_x,
+            (cell_y - self.height_y - 0.5) * self.step_y,
+            (cell_x + self.height_x + 0.5) * self.step_x,
+            (cell_y + self.height_y + 0.5) * self.step_y,
+        )
+
+    def _center_cell(self) -> typing.Tuple[int, int]:
+        """
+        Returns the cell (column, row) of the plane at the center of the view (cell 0 is centered on the data origin).
+
+        :rtype: typing.Tuple[int, int]
+        """
+        return int(round(self.center_x / self.step_x)), int(round(self.center_y / self.step_y))
+
+    def pan(self, dx: float, dy: float) -> None:
+        """
+        Move the view by 'dx' columns and 'dy' rows.
+
+        :rtype: None
+        """
+        self.center_x   += dx * self.step_x
+        self.center_y   += dy * self.step_y
+        self._graph     = None
+
+    def zoom(self, factor: float) -> None:
+        """
+        Zoom the view around its center ('factor' > 1 zooms in, 'factor' < 1 zooms out).
+
+        :raises ValueError: if 'factor' is not positive.
+        :rtype: None
+        """
+        if factor <= 0:
+            raise ValueError('zoom factor must be positive')
+        self.step_x /= factor
+        self.step_y /= factor
+        self._graph = None
+
+    def fit(self) -> None:
+        """
+        Center the view on the index points and pick steps showing all of them.
+
+        :rtype: None
+        """
+        bounds = self.index.bounds()
+        if bounds is None:
+            return
+        low_x, low_y, high_x, high_y = bounds
+        self.center_x   = (low_x + high_x) / 2
+        self.center_y   = (low_y + high_y) / 2
+        self.step_x     = graph.nice_step(high_x - low_x, 2 * self.height_x)
+        self.step_y     = graph.nice_step(high_y - low_y, 2 * self.height_y)
+        self._graph     = None
+
+    def invalidate(self) -> None:
+        """
+        Rebuild the graph on the next draw (e.g. after points were added to the index).
+
+        :rtype: None
+        """
+        self._graph = None
+
+    @property
+    def view(self) -> graph.Graph:
+        """
+        The graph of the current view (built from the points in view on first access after a change).
+
+        :rtype: graph.Graph
+        """
+        if self._graph is None:
+            self._graph     = self._build()
+            self._redrawn   = True
+        return self._graph
+
+    def _build(self) -> graph.Graph:
+        """
+        Create the graph of the current view, plotting the points in view relative to the axes.
+
+        :rtype: graph.Graph
+        """
+        cell_x, cell_y = self._center_cell()
+        axis_x = 0 if abs(cell_x) <= self.height_x else cell_x
+        axis_y = 0 if abs(cell_y) <= self.height_y else cell_y
+        view = _ViewGraph(
+            axis_x          = axis_x,
+            axis_y          = axis_y,
+            points          = [],
+            height_x        = self.height_x + cell_x - axis_x,
+            height_y        = self.height_y + cell_y - axis_y,
+            step_x          = self.step_x,
+            step_y          = self.step_y,
+            normalizer_x    = self.normalizer_x,
+            normalizer_y    = self.normalizer_y,
+            negative_x      = True,
+            negative_y      = True,
+            neg_height_x    = self.height_x - cell_x + axis_x,
+            neg_height_y    = self.height_y - cell_y + axis_y,
+            unit_x          = 10 ** math.floor(math.log10(self.step_x)),
+            unit_y          = 10 ** math.floor(math.log10(self.step_y)),
+        )
+        xs, ys = self.index.query(*self.bounds())
+        if xs:
+            offset_x, offset_y = axis_x * self.step_x, axis_y * self.step_y
+            view.plot_binned(
+                [x - offset_x for x in xs],
+                [y - offset_y for y in ys],
+                tokens  = self.tokens,
+                colors  = self.colors,
+            )
+        return view
+
+    def pop_dirty(self) -> typing.Set[int]:
+        """
+        Returns the rows changed since the last call (every row once the view changed).
+
+        :return: set of changed row indices (0 is the bottom row).
+        :rtype: typing.Set[int]
+        """
+        view = self.view
+        dirty = view.pop_dirty()
+        if self._redrawn:
+            self._redrawn = False
+            return set(range(self.height))
+        return dirty
+
+    def _draw_row(self, row: int, start: int = 0) -> str:
+        """
+        Create the string that represents a single row of the view.
+
+        :rtype: str
+        """
+        return self.view._draw_row(row, start)
+
+    def _draw(self) -> typing.List[str]:
+        """
+        Create a list of strings that represents the view.
+
+        :return: list of strings representing rows within the view.
+        :rtype: typing.List[str]
+        """
+        return self.view._draw()
+
+    def draw(self, target: typing.Any = None, fmt: render.Format = render.Format.ANSI) -> None:
+        """
+        Draw the current view to the screen (or to any other target, see render.render).
+
+        :rtype: None
+        """
+        render.render(self, target=target, fmt=fmt)
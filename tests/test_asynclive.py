@@ -0,0 +1,110 @@
+import asyncio
+import io
+import threading
+
+import pyshart.asynclive
+import pyshart.graph
+import pyshart.series
+
+
+def _run(coroutine):
+    # asyncio.run is python 3.7+.
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        asyncio.set_event_loop(None)
+        loop.close()
+
+
+async def _samples(values, delay=0):
+    for value in values:
+        await asyncio.sleep(delay)
+        yield value
+
+
+def test_series_samples_are_rendered() -> None:
+    series  = pyshart.series.TimeSeries(window=3, height_y=2)
+    stream  = io.StringIO()
+    chart   = pyshart.asynclive.AsyncLiveChart(series, stream=stream, interval=0.01)
+    chart.subscribe(_samples([1, 2]))
+    chart.subscribe(_samples([0]))
+    _run(chart.run())
+    assert sorted(series.values) == [0, 1, 2]
+    assert stream.getvalue() == '\n'.join(series._draw()) + '\n'
+    assert chart.frames == 1
+
+
+def test_samples_are_coalesced() -> None:
+    graph   = pyshart.graph.Graph([], 3, 2, 1, 1, 10, 10, False, False)
+    batches = []
+
+    def apply(target, samples):
+        batches.append(samples)
+        pyshart.asynclive._apply_samples(target, samples)
+
+    chart = pyshart.asynclive.AsyncLiveChart(graph, stream=io.StringIO(), interval=3600, apply=apply)
+    chart.subscribe(_samples([(1, 1), (2, 2), (9, 9)]))
+    _run(chart.run())
+    assert batches == [[(1, 1), (2, 2), (9, 9)]]
+    assert graph[(1, 1)] == graph[(2, 2)] == 'X'
+
+
+def test_bad_samples_are_dropped() -> None:
+    graph   = pyshart.graph.Graph([], 3, 2, 5, 5, 10, 10, False, False)
+    chart   = pyshart.asynclive.AsyncLiveChart(graph, stream=io.StringIO(), interval=3600)
+    chart.subscribe(_samples([(4.6, 5.2), (float('nan'), 1), ('a', 1), 7, (99.5, 0)]))
+    _run(chart.run())
+    # Data values fall in the cell round(v / step).
+    assert graph._draw() == ['0   ', '5X  ', '0505']
+    series  = pyshart.series.TimeSeries(window=3, height_y=2)
+    chart   = pyshart.asynclive.AsyncLiveChart(series, stream=io.StringIO(), interval=3600)
+    chart.subscribe(_samples([1.5, float('inf'), None, 2]))
+    _run(chart.run())
+    assert series.values == [1.5, 2]
+
+
+class _SlowStream(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, text):
+        self.started.set()
+        self.release.wait(5)
+        return super().write(text)
+
+
+def test_slow_stream_does_not_block_ingestion() -> None:
+    graph   = pyshart.graph.Graph([], 3, 2, 1, 1, 10, 10, False, False)
+    stream  = _SlowStream()
+    chart   = pyshart.asynclive.AsyncLiveChart(graph, stream=stream, interval=0.001)
+
+    async def source(finish):
+        yield (0, 1)
+        # Wait for the first frame to be in flight (its write is blocked), then keep sending samples.
+        while not stream.started.is_set():
+            await asyncio.sleep(0.001)
+        for x in range(1, 4):
+            yield (x, 1)
+        await finish.wait()
+
+    async def in_flight():
+        while not (graph[(3, 1)] == 'X' and chart.skipped > 0):
+            await asyncio.sleep(0.001)
+
+    async def main():
+        finish = asyncio.Event()
+        chart.subscribe(source(finish))
+        task = asyncio.ensure_future(chart.run())
+        # The first frame is still being written, samples kept being applied.
+        await asyncio.wait_for(in_flight(), timeout=5)
+        assert chart.frames == 1
+        stream.release.set()
+        finish.set()
+        await task
+
+    _run(main())
+    assert stream.getvalue().endswith('\x1b[2B\r')
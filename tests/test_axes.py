@@ -0,0 +1,54 @@
+import pytest
+import pyshart.graph
+
+
+@pytest.mark.parametrize('span,cells,expected', [
+    (100, 10, 10),
+    (7, 20, 0.5),
+    (1000, 79, 20),
+    (3, 3, 1),
+    (0, 10, 1),
+])
+def test_nice_step(span: float, cells: int, expected: float) -> None:
+    assert pyshart.graph.nice_step(span, cells) == pytest.approx(expected)
+
+
+def test_asymmetric_graph() -> None:
+    graph = pyshart.graph.Graph([], 3, 1, 1, 1, 10, 10, True, True, neg_height_x=1, neg_height_y=2)
+    graph[(-1, -2)] = 'X'
+    assert (graph.width, graph.height) == (5, 4)
+    assert graph._draw() == [
+        ' 1   ',
+        '10123',
+        ' 1   ',
+        'X2   ',
+    ]
+    with pytest.raises(IndexError):
+        graph[(-2, 0)]
+
+
+def test_auto_one_sided() -> None:
+    graph = pyshart.graph.Graph.auto([0, 3, 7, 10], [0, 5, 1, 0], width=12, height=10)
+    assert not graph.negative_x and not graph.negative_y
+    assert (graph.step_x, graph.height_x, graph.step_y, graph.height_y) == (1, 10, 1, 5)
+    assert graph[(3, 5)] == 'X'
+
+
+def test_auto_units() -> None:
+    graph = pyshart.graph.Graph.auto([-1000, 4000], [-50, 0], width=6, height=3)
+    assert (graph.step_x, graph.neg_height_x, graph.height_x) == (1000, 1, 4)
+    assert (graph.step_y, graph.neg_height_y, graph.height_y) == (50, 1, 0)
+    assert graph._draw() == [
+        '10123X',
+        'X5    ',
+    ]
+
+
+@pytest.mark.parametrize('cells', [3, 5, 21, 80])
+def test_axis_extents_bound(cells: int) -> None:
+    for low in range(-120, 1, 7):
+        for high in range(0, 160, 11):
+            step, height, neg_height, _ = pyshart.graph.axis_extents(low / 3, high / 3, cells)
+            assert height + neg_height + 1 <= cells
+            assert height * step >= high / 3 - 1e-9 and neg_height * step >= -low / 3 - 1e-9
+    assert pyshart.graph.Graph.auto([-47, 111], [0, 1], width=80).width <= 80
@@ -0,0 +1,12 @@
+import benchmarks.run
+
+
+def test_quick_run_and_compare() -> None:
+    results = benchmarks.run.run(quick=True, number=1, repeat=1)
+    names = {result['name'] for result in results['results']}
+    assert {'graph_init', 'graph_setitem', 'graph_getitem', 'graph_draw', 'colored_string_concat', 'get_color'} <= names
+    assert all(result['seconds'] >= 0 and result['peak_bytes'] >= 0 for result in results['results'])
+    assert benchmarks.run.compare(results, results) == []
+
+    slower = dict(results, results=[dict(result, seconds=result['seconds'] * 2 + 1) for result in results['results']])
+    assert len(benchmarks.run.compare(slower, results)) == len(results['results'])
@@ -0,0 +1,39 @@
+import colorama
+import pytest
+import pyshart.binning
+import pyshart.graph
+
+
+XS = [0, 1, 1, 1.2, 2, 2.6]
+YS = [1, 1, 3, 1, 2, 0.4]
+
+
+@pytest.mark.parametrize('reducer,expected', [
+    ('count',   {(0, 1): 1, (1, 1): 2, (1, 3): 1, (2, 2): 1, (3, 0): 1}),
+    ('min',     {(0, 1): 1, (1, 1): 1, (1, 3): 3, (2, 2): 2, (3, 0): 0.4}),
+    ('max',     {(0, 1): 1, (1, 1): 1, (1, 3): 3, (2, 2): 2, (3, 0): 0.4}),
+    ('last',    {(0, 1): 1, (1, 1): 1, (1, 3): 3, (2, 2): 2, (3, 0): 0.4}),
+])
+def test_bin_points(reducer: str, expected: dict) -> None:
+    assert pyshart.binning.bin_points(XS, YS, reducer=reducer) == expected
+
+
+def test_bin_points_values() -> None:
+    values = [1, 2, 3, 4, 5, 6]
+    assert pyshart.binning.bin_points(XS, YS, values=values, reducer=pyshart.binning.Reducer.MEAN)[(1, 1)] == 3
+    assert pyshart.binning.bin_points(XS, YS, values=values, reducer=pyshart.binning.Reducer.LAST)[(1, 1)] == 4
+    assert pyshart.binning.bin_points([10, 20], [0, 0], step_x=10) == {(1, 0): 1, (2, 0): 1}
+
+
+def test_levels() -> None:
+    assert pyshart.binning.levels({(0, 0): 1, (1, 0): 3, (2, 0): 5}, 3) == {(0, 0): 0, (1, 0): 1, (2, 0): 2}
+    assert pyshart.binning.levels({(0, 0): 7}, 4) == {(0, 0): 3}
+
+
+def test_plot_binned() -> None:
+    graph = pyshart.graph.Graph([], 3, 2, 1, 1, 10, 10, False, False)
+    colors = pyshart.binning.density_colors(['g', 'r'])
+    graph.plot_binned([1, 1, 2, 9], [1, 1, 2, 9], tokens='.#', colors=colors)
+
+    assert graph[(1, 1)] == colorama.Fore.RED + '#' + colorama.Style.RESET_ALL
+    assert graph[(2, 2)] == colorama.Fore.GREEN + '.' + colorama.Style.RESET_ALL
@@ -0,0 +1,118 @@
+import array
+import colorama
+import pytest
+import pyshart.canvas
+import pyshart.color
+import pyshart.graph
+
+
+@pytest.fixture
+def canvas() -> pyshart.canvas.Canvas:
+    return pyshart.canvas.Canvas(width=5, height=3)
+
+
+def test_empty_canvas(canvas: pyshart.canvas.Canvas) -> None:
+    assert canvas.render() == [' ' * 5] * 3
+
+
+def test_put_get(canvas: pyshart.canvas.Canvas) -> None:
+    red = canvas.style_id(colorama.Fore.RED)
+    canvas.put(0, 1, 'X', red)
+    canvas.put(2, 4, '10')
+
+    assert canvas.get(0, 1) == colorama.Fore.RED + 'X' + colorama.Style.RESET_ALL
+    assert canvas.get(2, 4) == '10'
+    assert canvas.get(1, 1) == ' '
+
+    canvas.clear(2, 4)
+    assert canvas.get(2, 4) == ' '
+    assert canvas.overflow == {}
+
+
+def test_style_ids_are_shared(canvas: pyshart.canvas.Canvas) -> None:
+    assert canvas.style_id('') == pyshart.canvas.NO_STYLE
+    assert canvas.style_id(colorama.Fore.RED) == canvas.style_id(colorama.Fore.RED)
+    assert canvas.style_id(colorama.Fore.RED) != canvas.style_id(colorama.Fore.GREEN)
+    palette = pyshart.color.get_palette()
+    assert canvas.style_id(colorama.Fore.RED) == canvas.style_id(palette.id('r'))
+    with pytest.raises(ValueError):
+        canvas.style_id(len(palette.codes))
+
+
+def test_style_ids_are_local(canvas: pyshart.canvas.Canvas) -> None:
+    palette = pyshart.color.get_palette()
+    gradient = palette.gradient((0, 0, 0), (255, 0, 0), 256)
+    assert [canvas.style_id(cid) for cid in gradient[:2]] == [1, 2]
+    assert canvas.prefixes == ['', palette.code(gradient[0]), palette.code(gradient[1])]
+
+
+def test_render_runs(canvas: pyshart.canvas.Canvas) -> None:
+    red = canvas.style_id(colorama.Fore.RED)
+    canvas.put(0, 1, 'X', red)
+    canvas.put(0, 2, 'Y', red)
+    canvas.put(0, 4, '10')
+
+    rendered = canvas.render()
+    assert rendered[-1] == ' ' + colorama.Fore.RED + 'XY' + colorama.Style.RESET_ALL + ' 10'
+    assert rendered[0] == ' ' * 5
+
+
+def test_graph_cells() -> None:
+    points = [pyshart.graph.VisualPoint(2, 1, token='o', fore=colorama.Fore.RED)]
+    graph = pyshart.graph.Graph(points, 3, 2, 1, 1, 10, 10, False, False)
+    token = str(points[0].tokenize())
+
+    assert graph[(2, 1)] == token
+    assert graph[(3, 0)] == '3'
+    assert graph._draw() == [
+        '2   ',
+        '1 ' + token + ' ',
+        '0123',
+    ]
+
+    del graph[(2, 1)]
+    assert graph[(2, 1)] == ' '
+
+
+def test_plot_many() -> None:
+    graph = pyshart.graph.Graph([], 3, 3, 1, 1, 10, 10, True, True)
+    expected = pyshart.graph.Graph(
+        [pyshart.graph.VisualPoint(x, y, token='o', fore=colorama.Fore.RED) for x, y in [(-3, 2), (1, -1), (1, -1), (3, 3)]],
+        3, 3, 1, 1, 10, 10, True, True,
+    )
+    graph.plot_many([-3, 1, 1, 3], array.array('i', [2, -1, -1, 3]), token='o', fore=colorama.Fore.RED)
+    assert graph._draw() == expected._draw()
+
+
+def test_plot_many_bounds() -> None:
+    graph = pyshart.graph.Graph([], 3, 3, 1, 1, 10, 10, False, False)
+    with pytest.raises(IndexError):
+        graph.plot_many([-1], [1])
+    with pytest.raises(IndexError):
+        graph.plot_many([1], [4])
+    graph.plot_many([-1, 1, 4], [1, 1, 1], clip=True)
+    assert graph[(1, 1)] == 'X'
+
+
+def test_plot_many_integers_only() -> None:
+    graph = pyshart.graph.Graph([], 3, 3, 1, 1, 10, 10, False, False)
+    drawn = graph._draw()
+    for xs, ys in [([1, 2.5], [1, 1]), ([1, 2], array.array('d', [1, 1])), ([1, 2], [1, '1'])]:
+        with pytest.raises(TypeError):
+            graph.plot_many(xs, ys)
+    assert graph._draw() == drawn
+    graph.plot_many([True, 2], array.array('q', [1, 2]))
+    assert graph[(1, 1)] == graph[(2, 2)] == 'X'
+
+
+def test_plot_many_numpy() -> None:
+    numpy = pytest.importorskip('numpy')
+    graph = pyshart.graph.Graph([], 3, 3, 1, 1, 10, 10, False, False)
+    expected = pyshart.graph.Graph([], 3, 3, 1, 1, 10, 10, False, False)
+    graph.plot_many(numpy.array([1, 2, 9, 2]), numpy.array([1, 3, 1, 3], dtype=numpy.uint8), clip=True)
+    expected.plot_many([1, 2], [1, 3])
+    assert graph._draw() == expected._draw()
+    with pytest.raises(IndexError):
+        graph.plot_many(numpy.array([9]), numpy.array([1]))
+    with pytest.raises(TypeError):
+        graph.plot_many(numpy.array([1.0]), numpy.array([1]))
@@ -0,0 +1,40 @@
+import colorama
+import pyshart.binning
+import pyshart.charts
+import pyshart.color
+
+
+def test_histogram() -> None:
+    histogram = pyshart.charts.Histogram([1, 1, 2, 3, 3, 3, 3.2], width=5, height=5)
+    assert histogram.counts == {1: 2, 2: 1, 3: 4}
+    # The axis covers the highest value (3.2) hence a last empty bucket.
+    assert histogram._draw() == [
+        '4  # ',
+        '3  # ',
+        '2# # ',
+        '1### ',
+        '01234',
+    ]
+
+
+def test_histogram_colors() -> None:
+    colors = pyshart.binning.density_colors(['g', 'r'])
+    histogram = pyshart.charts.Histogram([-1, 1, 1], width=3, height=3, colors=colors)
+    assert histogram[(-1, 1)] == colorama.Fore.GREEN + '#' + colorama.Style.RESET_ALL
+    assert histogram[(1, 2)] == colorama.Fore.RED + '#' + colorama.Style.RESET_ALL
+
+
+def test_heatmap() -> None:
+    colors = pyshart.binning.density_colors(['g', 'r'])
+    heatmap = pyshart.charts.Heatmap([0, 1, 1, 2], [0, 1, 1, 2], width=4, height=4, token='o', colors=colors)
+    assert heatmap[(1, 1)] == colorama.Fore.RED + 'o' + colorama.Style.RESET_ALL
+    assert heatmap[(2, 2)] == colorama.Fore.GREEN + 'o' + colorama.Style.RESET_ALL
+    assert heatmap[(2, 1)] == ' '
+
+
+def test_heatmap_gradient() -> None:
+    palette = pyshart.color.get_palette()
+    colors = pyshart.binning.density_colors(palette.gradient((0, 0, 255), (255, 0, 0), 2))
+    heatmap = pyshart.charts.Heatmap([0, 1, 1, 2], [0, 1, 1, 2], width=4, height=4, token='o', colors=colors)
+    assert heatmap[(1, 1)] == '\x1b[38;2;255;0;0m' + 'o' + colorama.Style.RESET_ALL
+    assert heatmap[(2, 2)] == '\x1b[38;2;0;0;255m' + 'o' + colorama.Style.RESET_ALL
@@ -1,9 +1,12 @@
 import colorama
 import itertools
+import os
 import pytest
 import pyshart.color
 import random
 import string
+import subprocess
+import sys
 
 from .test_point import pos_number
 
@@ -43,4 +46,62 @@ def test_multiplication(rstr: str, pos_number: int) -> None:
     cs = pyshart.color.ColoredString(rstr, colorama.Fore.RED, colorama.Back.GREEN, colorama.Style.BRIGHT)
     assert cs * pos_number == pyshart.color.ColoredString(rstr * pos_number, colorama.Fore.RED, colorama.Back.GREEN, colorama.Style.BRIGHT)._value
     assert pos_number * cs == pyshart.color.ColoredString(pos_number * rstr, colorama.Fore.RED, colorama.Back.GREEN, colorama.Style.BRIGHT)._value
-    
\ No newline at end of file
+    
+def test_immutable(rstr: str) -> None:
+    cs = pyshart.color.ColoredString(rstr, colorama.Fore.RED)
+    with pytest.raises(AttributeError):
+        cs.fore = colorama.Fore.GREEN
+    assert str(cs) == colorama.Fore.RED + rstr + colorama.Style.RESET_ALL
+
+def test_shared_prefixes(rstr1: str, rstr2: str) -> None:
+    cs1 = pyshart.color.ColoredString(rstr1, colorama.Fore.RED, colorama.Back.GREEN)
+    cs2 = pyshart.color.ColoredString(rstr2, colorama.Fore.RED, colorama.Back.GREEN)
+    assert cs1.prefix is cs2.prefix
+    assert pyshart.color.colored(rstr1, colorama.Fore.RED) is pyshart.color.colored(rstr1, colorama.Fore.RED)
+    assert pyshart.color.ColoredString(rstr1)._value == rstr1
+
+@pytest.mark.parametrize('ctype,module', [
+    (pyshart.color.ColorType.FORE, 'Fore'),
+    (pyshart.color.ColorType.BACK, 'Back'),
+    (pyshart.color.ColorType.STYLE, 'Style'),
+])
+def test_get_color(ctype: pyshart.color.ColorType, module: str) -> None:
+    for name in colorama.__getattribute__(module).__dict__.keys():
+        assert pyshart.color.get_color(name, ctype) == get_from_colorama(module, name)
+        assert pyshart.color.get_color(name.lower(), ctype) == get_from_colorama(module, name)
+    with pytest.raises(KeyError):
+        pyshart.color.get_color('nosuchcolor', ctype)
+
+def test_get_color_shortcuts() -> None:
+    assert pyshart.color.get_color('lr') == colorama.Fore.LIGHTRED_EX
+    assert pyshart.color.get_color('blu', pyshart.color.ColorType.BACK) == colorama.Back.BLUE
+    assert pyshart.color.get_color('d', pyshart.color.ColorType.STYLE) == colorama.Style.DIM
+    with pytest.raises(ValueError):
+        pyshart.color.get_color('r', 'fore')
+
+def test_palette_extended_colors() -> None:
+    palette = pyshart.color.get_palette()
+    assert palette.code(palette.xterm(196)) == '\x1b[38;5;196m'
+    assert palette.code(palette.rgb(1, 2, 3, pyshart.color.ColorType.BACK)) == '\x1b[48;2;1;2;3m'
+    assert palette.rgb(1, 2, 3) == palette.rgb(1, 2, 3)
+    gradient = palette.gradient((0, 0, 0), (255, 255, 255), 3)
+    assert [palette.code(cid) for cid in gradient] == ['\x1b[38;2;0;0;0m', '\x1b[38;2;128;128;128m', '\x1b[38;2;255;255;255m']
+    with pytest.raises(ValueError):
+        palette.rgb(0, 256, 0)
+    with pytest.raises(ValueError):
+        palette.xterm(-1)
+
+
+def test_import_does_not_wrap_streams() -> None:
+    code = 'import sys; stdout = sys.stdout; import pyshart.graph; assert sys.stdout is stdout; assert not pyshart.color._INITIALIZED'
+    subprocess.run([sys.executable, '-c', code], check=True, cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_init_once(monkeypatch) -> None:
+    calls = []
+    monkeypatch.setattr(pyshart.color, '_INITIALIZED', False)
+    monkeypatch.setattr(pyshart.color.sys, 'platform', 'win32')
+    monkeypatch.setattr(pyshart.color.colorama, 'just_fix_windows_console', lambda: calls.append(1), raising=False)
+    pyshart.color.init()
+    pyshart.color.init()
+    assert calls == [1]
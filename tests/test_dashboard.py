@@ -0,0 +1,84 @@
+import io
+
+import pytest
+
+import pyshart.dashboard
+import pyshart.graph
+import pyshart.live
+
+
+def _graph(width: int, height: int) -> pyshart.graph.Graph:
+    return pyshart.graph.Graph([], width, height, 1, 1, 10, 10, False, False)
+
+
+def test_grid_layout() -> None:
+    dashboard = pyshart.dashboard.Dashboard(gap=1)
+    dashboard.add(_graph(3, 1), 0, 0, title='a')
+    dashboard.add(_graph(1, 2), 0, 1, title='bb')
+    dashboard.add(_graph(2, 1), 1, 1)
+
+    assert dashboard._draw() == [
+        'a    bb',
+        '1    2',
+        '0123 1',
+        '     01',
+        '',
+        '     1',
+        '     012',
+    ]
+
+
+def test_shared_axes() -> None:
+    dashboard = pyshart.dashboard.Dashboard(gap=1, share_x=True, share_y=True)
+    dashboard.add(_graph(2, 1), 0, 0)
+    dashboard.add(_graph(2, 1), 0, 1)
+    dashboard.add(_graph(2, 1), 1, 0)
+    dashboard.add(_graph(2, 1), 1, 1)
+
+    assert dashboard._draw() == [
+        '1',
+        '',
+        '1',
+        '012 12',
+    ]
+
+
+def test_shared_axes_need_the_same_scale() -> None:
+    dashboard = pyshart.dashboard.Dashboard(share_y=True)
+    dashboard.add(_graph(2, 2), 0, 0)
+    with pytest.raises(ValueError):
+        dashboard.add(pyshart.graph.Graph([], 2, 2, 1, 5, 10, 10, False, False), 0, 1)
+    with pytest.raises(ValueError):
+        dashboard.add(_graph(2, 3), 0, 1)
+    assert list(dashboard.panels) == [(0, 0)]
+    # Other rows and the replaced panel itself are not compared.
+    dashboard.add(_graph(2, 3), 1, 1)
+    dashboard.add(_graph(2, 3), 0, 0)
+
+
+def test_only_changed_panels_are_rendered() -> None:
+    left, right = _graph(2, 1), _graph(2, 1)
+    dashboard = pyshart.dashboard.Dashboard(gap=1)
+    dashboard.add(left, 0, 0)
+    dashboard.add(right, 0, 1)
+    dashboard._draw()
+
+    right[(1, 1)] = 'X'
+    assert dashboard.pop_dirty() == {1}
+    assert dashboard._cache[(0, 0)] == {1: '1  ', 0: '012'}
+    assert 1 not in dashboard._cache[(0, 1)]
+    assert dashboard._draw_row(1) == '1   1X'
+
+
+def test_live_dashboard() -> None:
+    panel = _graph(2, 1)
+    dashboard = pyshart.dashboard.Dashboard()
+    dashboard.add(panel, 0, 0)
+    stream = io.StringIO()
+    renderer = pyshart.live.LiveRenderer(dashboard, stream=stream)
+    renderer.refresh()
+    assert stream.getvalue() == '1\n012\n'
+
+    panel[(2, 1)] = 'X'
+    renderer.refresh()
+    assert stream.getvalue().endswith('\x1b[2A\r1 X\x1b[K\x1b[2B\r')
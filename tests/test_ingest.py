@@ -0,0 +1,69 @@
+import io
+
+import pytest
+
+import pyshart.__main__
+import pyshart.ingest
+
+CSV = b't,value,name\n0,1.5,a\n1,-2,b\n2,oops,c\n3,4,"d,e"\n'
+
+
+def _chunks(data, block_size, **kwargs):
+    blocks = pyshart.ingest.read_blocks(io.BytesIO(data), block_size=block_size)
+    return list(pyshart.ingest.read_columns(pyshart.ingest.split_lines(blocks), **kwargs))
+
+
+@pytest.mark.parametrize('block_size', [1, 7, 1024])
+def test_read_csv_columns(block_size) -> None:
+    chunks = _chunks(CSV, block_size, y='value', x='t')
+    assert [x for xs, _ in chunks for x in xs] == [0, 1, 3]
+    assert [y for _, ys in chunks for y in ys] == [1.5, -2, 4]
+
+
+def test_read_csv_indices_and_line_numbers() -> None:
+    chunks = _chunks(CSV.split(b'\n', 1)[1], 1024, y='1', header=False)
+    assert [(list(xs), list(ys)) for xs, ys in chunks] == [([0, 1, 3], [1.5, -2, 4])]
+    with pytest.raises(KeyError):
+        _chunks(CSV, 1024, y='missing')
+
+
+def test_read_jsonl_columns() -> None:
+    data = b'{"t": 1, "v": 2}\n\n{"t": 2}\nnot json\n{"t": 3, "v": 5}'
+    chunks = _chunks(data, 5, y='v', x='t', fmt=pyshart.ingest.InputFormat.JSONL)
+    assert [(x, y) for xs, ys in chunks for x, y in zip(xs, ys)] == [(1, 2), (3, 5)]
+
+
+def test_read_skips_non_finite_values(tmp_path) -> None:
+    chunks = _chunks(b't,v\n1,2\n2,nan\n3,inf\n-Infinity,4\n5,6\n', 1024, y='v', x='t')
+    assert [(x, y) for xs, ys in chunks for x, y in zip(xs, ys)] == [(1, 2), (5, 6)]
+    data = b'{"t": 1, "v": NaN}\n{"t": 2, "v": Infinity}\n{"t": 3, "v": "inf"}\n{"t": 4, "v": 5}\n'
+    chunks = _chunks(data, 1024, y='v', x='t', fmt=pyshart.ingest.InputFormat.JSONL)
+    assert [(x, y) for xs, ys in chunks for x, y in zip(xs, ys)] == [(4, 5)]
+    path = tmp_path / 'data.csv'
+    path.write_text('t,v\n1,2\n2,nan\n3,inf\n')
+    assert pyshart.__main__.main([str(path), '-y', 'v', '--plain']) == 0
+
+
+def test_input_format_of() -> None:
+    assert pyshart.ingest.InputFormat.of('a.jsonl') is pyshart.ingest.InputFormat.JSONL
+    assert pyshart.ingest.InputFormat.of('a.log') is pyshart.ingest.InputFormat.CSV
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_plot_file_matches_auto(tmp_path, use_mmap) -> None:
+    path = tmp_path / 'data.csv'
+    lines = ['x,y'] + [f'{i},{(i * 7) % 23 - 11}' for i in range(500)]
+    path.write_text('\n'.join(lines) + '\n')
+    graph = pyshart.ingest.plot_file(str(path), y='y', x='x', width=40, height=12, block_size=64, use_mmap=use_mmap)
+    ys = [(i * 7) % 23 - 11 for i in range(500)]
+    expected = pyshart.ingest.fitted_graph((0, 499, min(ys), max(ys)), width=40, height=12)
+    expected.plot_binned(range(500), ys)
+    assert graph._draw() == expected._draw()
+
+
+def test_main(tmp_path, capsys) -> None:
+    path = tmp_path / 'data.jsonl'
+    path.write_text('{"v": 1}\n{"v": 2}\n')
+    assert pyshart.__main__.main([str(path), '-y', 'v', '--plain', '--width', '5', '--height', '3']) == 0
+    assert capsys.readouterr().out == '\n'.join(pyshart.ingest.plot_file(str(path), y='v', width=5, height=3)._draw()) + '\n'
+    assert pyshart.__main__.main([str(tmp_path / 'missing.csv'), '-y', 'v']) == 1
@@ -0,0 +1,99 @@
+import io
+
+import pytest
+
+import pyshart.color
+import pyshart.graph
+import pyshart.instrument
+import pyshart.render
+
+
+def _points():
+    fore = pyshart.color.get_color('r')
+    return [
+        pyshart.graph.VisualPoint(1, 1, fore=fore),
+        pyshart.graph.VisualPoint(1, 1, fore=fore),
+        pyshart.graph.VisualPoint(2, 0),
+    ]
+
+
+def test_disabled_by_default() -> None:
+    assert pyshart.instrument.active() is None
+    with pyshart.instrument.phase(pyshart.instrument.ROWS):
+        pass
+
+
+def test_profile_graph() -> None:
+    reports = []
+    with pyshart.instrument.Profile(callback=reports.append) as profile:
+        assert pyshart.instrument.active() is profile
+        graph = pyshart.graph.Graph(_points(), 3, 2, 1, 1, 10, 10, False, False)
+        graph.draw(io.StringIO())
+    assert pyshart.instrument.active() is None
+    assert reports == [profile]
+
+    assert set(profile.times) == {
+        pyshart.instrument.LABELS, pyshart.instrument.TOKENIZE, pyshart.instrument.POINTS,
+        pyshart.instrument.ROWS, pyshart.instrument.OUTPUT,
+    }
+    assert profile.counts[pyshart.instrument.PLOTTED] == 3
+    # The duplicated point, and the point over the '2' label.
+    assert profile.counts[pyshart.instrument.COLLISIONS] == 2
+    drawn = '\n'.join(graph._draw())
+    assert profile.counts[pyshart.instrument.ESCAPE_BYTES] == len(drawn) - len(pyshart.render.strip_ansi(drawn)) > 0
+    assert 'points_plotted' in profile.report()
+
+
+def test_profiled_graph_matches() -> None:
+    graph = pyshart.graph.Graph(_points(), 3, 2, 1, 1, 10, 10, False, False)
+    with pyshart.instrument.Profile():
+        profiled = pyshart.graph.Graph(_points(), 3, 2, 1, 1, 10, 10, False, False)
+    assert profiled._draw() == graph._draw()
+
+
+def _counts(profile):
+    return [profile.counts[name] for name in (pyshart.instrument.PLOTTED, pyshart.instrument.CLIPPED, pyshart.instrument.COLLISIONS)]
+
+
+def test_clipped_counts() -> None:
+    with pyshart.instrument.Profile() as profile:
+        with pytest.raises(IndexError):
+            pyshart.graph.Graph([pyshart.graph.VisualPoint(5, 0), pyshart.graph.VisualPoint(1, 9)], 3, 2, 1, 1, 10, 10, False, False)
+    assert _counts(profile) == [0, 2, 0]
+
+    graph = pyshart.graph.Graph([], 3, 2, 1, 1, 10, 10, False, False)
+    with pyshart.instrument.Profile() as profile:
+        # Raw points are counted: two clipped duplicates, then a point over an earlier one (and one in the same call).
+        graph.plot_many([1, 9, 9, 2, 2], [1, 9, 9, 2, 2], clip=True)
+        graph.plot_many([1], [1])
+    assert _counts(profile) == [4, 2, 2]
+    with pyshart.instrument.Profile() as profile:
+        with pytest.raises(IndexError):
+            graph.plot_many([1, 9], [1, 1])
+    assert _counts(profile) == [0, 1, 0]
+    with pyshart.instrument.Profile() as profile:
+        # Binned plots count cells, (0, 1) overwrites the '1' label.
+        graph.plot_binned([0.4, 2.6, 30], [0.6, 1, 30])
+    assert _counts(profile) == [2, 1, 1]
+
+
+def test_lazy_counts() -> None:
+    with pyshart.instrument.Profile() as profile:
+        graph = pyshart.graph.Graph(_points(), 3, 2, 1, 1, 10, 10, False, False, lazy=True)
+        graph[(1, 1)]
+        assert _counts(profile) == [2, 0, 1]
+        graph.canvas
+    assert _counts(profile) == [3, 0, 2]
+    assert pyshart.instrument.POINTS in profile.times
+    with pyshart.instrument.Profile() as profile:
+        graph = pyshart.graph.Graph([pyshart.graph.VisualPoint(7, 0)], 3, 2, 1, 1, 10, 10, False, False, lazy=True)
+        with pytest.raises(IndexError):
+            graph.canvas
+    assert _counts(profile) == [0, 1, 0]
+
+
+def test_nested_profiles() -> None:
+    with pyshart.instrument.Profile() as outer:
+        with pyshart.instrument.Profile() as inner:
+            assert pyshart.instrument.active() is inner
+        assert pyshart.instrument.active() is outer
@@ -0,0 +1,60 @@
+import colorama
+import pytest
+import pyshart.graph
+import pyshart.layers
+
+
+@pytest.fixture
+def layered() -> pyshart.layers.LayeredGraph:
+    return pyshart.layers.LayeredGraph([], 3, 1, 1, 1, 10, 10, False, False)
+
+
+@pytest.mark.parametrize('policy,expected', [
+    (pyshart.layers.Collision.OVERWRITE,    'b'),
+    (pyshart.layers.Collision.KEEP_FIRST,   'a'),
+    (pyshart.layers.Collision.BLEND,        ':'),
+    (pyshart.layers.Collision.LEGEND,       '#'),
+])
+def test_collision_policies(layered: pyshart.layers.LayeredGraph, policy: str, expected: str) -> None:
+    layered.add_layer('p99', [1, 3], [1, 1], z=1, token='b', policy=policy)
+    layered.add_layer('p50', [1, 2], [1, 1], z=0, token='a')
+    layered.compose()
+    assert layered._draw() == [
+        '1' + expected + 'ab',
+        '0123',
+    ]
+
+
+def test_remove_layer_restores_axes(layered: pyshart.layers.LayeredGraph) -> None:
+    layered.add_layer('p50', [1, 2, 9], [0, 1, 9], token='a')
+    layered.compose()
+    assert layered._draw() == ['1 a ', '0a23']
+
+    layered.remove_layer('p50')
+    layered.compose()
+    assert layered._draw() == ['1   ', '0123']
+
+
+def test_direct_writes_rejected() -> None:
+    layered = pyshart.layers.LayeredGraph([pyshart.graph.VisualPoint(3, 1)], 3, 1, 1, 1, 10, 10, False, False)
+    for write in (
+        lambda: layered.__setitem__((1, 1), 'Q'),
+        lambda: layered.plot_many([1], [1]),
+        lambda: layered.plot_binned([1], [1]),
+    ):
+        with pytest.raises(TypeError):
+            write()
+    layered.add_layer('p50', [1], [0], token='a')
+    layered.compose()
+    # Constructor points lie under the layers.
+    assert layered._draw() == ['1  X', '0a23']
+
+
+def test_legend(layered: pyshart.layers.LayeredGraph) -> None:
+    layered.add_layer('p50', [1], [1], z=0, token='a', fore=colorama.Fore.RED)
+    layered.add_layer('p99', [1], [1], z=1, token='b', policy='legend')
+    assert layered.legend() == [
+        'b p99',
+        colorama.Fore.RED + 'a' + colorama.Style.RESET_ALL + ' p50',
+        '# overlap',
+    ]
@@ -0,0 +1,70 @@
+import pytest
+
+import pyshart.color
+import pyshart.graph
+
+
+def _points():
+    fore = pyshart.color.get_color('r')
+    return [
+        pyshart.graph.VisualPoint(-2, 1, fore=fore),
+        pyshart.graph.VisualPoint(1, -1, token='O'),
+        pyshart.graph.VisualPoint(1, -1, token='Y'),
+        pyshart.graph.VisualPoint(2, 2),
+    ]
+
+
+def _graph(points, lazy):
+    return pyshart.graph.Graph(points, 3, 2, 1, 1, 10, 10, True, True, neg_height_y=1, lazy=lazy)
+
+
+def test_lazy_graph_is_deferred() -> None:
+    graph = _graph(_points(), lazy=True)
+    assert graph._canvas is None
+    assert 'canvas' not in graph.__dict__
+
+
+def test_lazy_rows_written_on_read() -> None:
+    eager   = _graph(_points(), lazy=False)
+    graph   = _graph(_points(), lazy=True)
+    assert graph[(1, -1)] == eager[(1, -1)] == 'Y'
+    assert graph._pending == {1, 2, 3}
+    assert graph._draw_row(2) == eager._draw_row(2)
+    assert graph._pending == {1, 3}
+    assert graph._draw() == eager._draw()
+    assert graph.canvas is graph._canvas
+
+
+def test_lazy_canvas_access_writes_all_rows() -> None:
+    eager   = _graph(_points(), lazy=False)
+    graph   = _graph(_points(), lazy=True)
+    assert graph.canvas.render() == eager.canvas.render()
+    assert not graph._pending
+
+
+def test_lazy_writes_dirty_only_their_rows() -> None:
+    graph = _graph(_points(), lazy=True)
+    graph.pop_dirty()
+    graph[(0, 2)] = 'Z'
+    assert graph.pop_dirty() == {3}
+    graph._draw()
+    assert graph.pop_dirty() == {0, 1, 2}
+    graph[(-3, 1)] = 'W'
+    assert graph.pop_dirty() == {2}
+    assert graph._draw()[0] == '   Z X '
+
+
+def test_lazy_invalid_point_raises_on_access() -> None:
+    graph = _graph([pyshart.graph.VisualPoint(5, 0)], lazy=True)
+    with pytest.raises(IndexError):
+        graph._draw()
+
+
+def test_from_canvas() -> None:
+    drawn = pyshart.graph.Graph([pyshart.graph.VisualPoint(1, 1)], 3, 1, 1, 1, 10, 10, False, False)
+    graph = pyshart.graph.Graph.from_canvas(drawn.canvas, height_x=3, height_y=1)
+    assert graph._draw() == drawn._draw() == ['1X  ', '0123']
+    graph[(2, 1)] = 'O'
+    assert graph._draw() == ['1XO ', '0123']
+    with pytest.raises(ValueError):
+        pyshart.graph.Graph.from_canvas(drawn.canvas, height_x=4, height_y=1)
@@ -0,0 +1,58 @@
+import io
+import pyshart.color
+import pyshart.graph
+import pyshart.live
+import pyshart.render
+
+
+def test_first_frame_is_whole_graph() -> None:
+    graph = pyshart.graph.Graph([], 3, 2, 1, 1, 10, 10, False, False)
+    stream = io.StringIO()
+    renderer = pyshart.live.LiveRenderer(graph, stream=stream)
+
+    assert renderer.refresh()
+    assert stream.getvalue() == '\n'.join(graph._draw()) + '\n'
+
+
+def test_only_dirty_rows_are_sent() -> None:
+    graph = pyshart.graph.Graph([], 3, 2, 1, 1, 10, 10, False, False)
+    stream = io.StringIO()
+    renderer = pyshart.live.LiveRenderer(graph, stream=stream)
+    renderer.refresh()
+
+    stream.seek(0)
+    stream.truncate()
+    graph[(2, 1)] = 'X'
+    renderer.refresh()
+    assert stream.getvalue() == '\x1b[2A\r1 X \x1b[K\x1b[2B\r'
+
+    stream.seek(0)
+    stream.truncate()
+    renderer.refresh()
+    assert stream.getvalue() == ''
+
+
+def test_frame_rate_cap() -> None:
+    graph = pyshart.graph.Graph([], 3, 2, 1, 1, 10, 10, False, False)
+    renderer = pyshart.live.LiveRenderer(graph, stream=io.StringIO(), max_fps=0.001)
+
+    assert renderer.refresh()
+    graph[(2, 1)] = 'X'
+    assert not renderer.refresh()
+    assert graph.canvas.dirty == {1}
+    assert renderer.refresh(force=True)
+    assert graph.canvas.dirty == set()
+
+
+def test_encoder() -> None:
+    graph = pyshart.graph.Graph([], 3, 2, 1, 1, 10, 10, False, False)
+    stream = io.StringIO()
+    renderer = pyshart.live.LiveRenderer(graph, stream=stream, encoder=pyshart.render.SGREncoder())
+    renderer.refresh()
+
+    stream.seek(0)
+    stream.truncate()
+    graph[(1, 1)] = pyshart.color.ColoredString('X', fore=pyshart.color.get_color('r'))
+    graph[(2, 1)] = pyshart.color.ColoredString('X', fore=pyshart.color.get_color('r'))
+    renderer.refresh()
+    assert stream.getvalue() == '\x1b[2A\r1\x1b[31mXX \x1b[0m\x1b[K\x1b[2B\r'
@@ -0,0 +1,25 @@
+import array
+import io
+import pyshart.graph
+import pyshart.parallel
+
+
+def _expected(xs: list, ys: list) -> bytes:
+    target = io.BytesIO()
+    pyshart.graph.Graph.auto(xs, ys, width=10, height=5).draw(target)
+    return target.getvalue()
+
+
+def test_panel_arrays() -> None:
+    panel = pyshart.parallel.Panel([1, 2], [3, 4])
+    assert panel.xs == array.array('d', [1, 2])
+    assert panel.ys == array.array('d', [3, 4])
+
+
+def test_render_panels_keeps_order() -> None:
+    data = [([i, i + 3, 7], [0, i, 2 * i]) for i in range(4)]
+    panels = [pyshart.parallel.Panel(xs, ys, width=10, height=5) for xs, ys in data]
+    expected = [_expected(xs, ys) for xs, ys in data]
+
+    assert pyshart.parallel.render_panels(panels, max_workers=1) == expected
+    assert pyshart.parallel.render_panels(panels, max_workers=2, chunksize=2) == expected
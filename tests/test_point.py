@@ -95,3 +95,22 @@ def test_quarter(posnum1: int, posnum2: int, negnum1: int, negnum2: int) -> None
     assert (q1.quarter | q2.quarter | q3.quarter).plane == pyshart.graph.Quarter.WHOLE_PLANE
 
     assert (q1.quarter | q2.quarter | q3.quarter | q4.quarter).plane == pyshart.graph.Quarter.WHOLE_PLANE
+
+
+def test_slotted_points() -> None:
+    p = pyshart.graph.VisualPoint(1, 2, token='o')
+    assert not hasattr(p, '__dict__')
+    assert p == pyshart.graph.VisualPoint(1, 2, token='o')
+    with pytest.raises(ValueError):
+        pyshart.graph.VisualPoint(1, 2, token='oo')
+
+
+def test_point_array(posnum1: int, negnum1: int) -> None:
+    points = pyshart.graph.PointArray([posnum1, negnum1], [posnum1, posnum1 + 1])
+    points.append(negnum1, negnum1)
+    points.extend([posnum1], [-1])
+
+    assert len(points) == 4
+    assert list(points) == [(posnum1, posnum1), (negnum1, posnum1 + 1), (negnum1, negnum1), (posnum1, -1)]
+    assert points[3] == pyshart.graph.Point(posnum1, -1)
+    assert points.quarters() == [p.quarter for p in map(lambda xy: pyshart.graph.Point(*xy), points)]
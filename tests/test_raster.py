@@ -0,0 +1,54 @@
+import pytest
+import pyshart.graph
+import pyshart.raster
+
+BOUNDS = (0, 0, 10, 5)
+
+
+@pytest.mark.parametrize('segment,expected', [
+    ((0, 0, 3, 0), [(0, 0), (1, 0), (2, 0), (3, 0)]),
+    ((0, 0, 0, -2), [(0, 0), (0, -1), (0, -2)]),
+    ((0, 0, 4, 2), [(0, 0), (1, 1), (2, 1), (3, 2), (4, 2)]),
+    ((2, 2, 2, 2), [(2, 2)]),
+])
+def test_bresenham(segment: tuple, expected: list) -> None:
+    assert list(pyshart.raster.bresenham(*segment)) == expected
+    reverse = list(pyshart.raster.bresenham(*segment[2:], *segment[:2]))
+    assert reverse[0] == expected[-1] and reverse[-1] == expected[0] and len(reverse) == len(expected)
+
+
+@pytest.mark.parametrize('segment,expected', [
+    ((1, 1, 4, 4), (1, 1, 4, 4)),
+    ((-5, 2, 15, 2), (0, 2, 10, 2)),
+    ((-10, 0, 20, 15), (0, 5, 0, 5)),
+    ((-5, -5, -1, -1), None),
+    ((3, 10, 3, -10), (3, 5, 3, 0)),
+])
+def test_clip_segment(segment: tuple, expected: tuple) -> None:
+    assert pyshart.raster.clip_segment(*segment, BOUNDS) == expected
+
+
+def test_plot_line() -> None:
+    graph = pyshart.graph.Graph([], 4, 2, 1, 1, 10, 10, False, False)
+    graph.plot_line([1, 3, 9], [1, 1, 7], token='*')
+    assert graph._draw() == [
+        '2   *',
+        '1*** ',
+        '01234',
+    ]
+
+
+def test_plot_data_values() -> None:
+    xs, ys  = [0, 60], [0, 60]
+    graph   = pyshart.graph.Graph.auto(xs, ys, width=5, height=5)
+    cells   = pyshart.graph.Graph.auto(xs, ys, width=5, height=5)
+    assert (graph.step_x, graph.step_y) == (20, 20)
+    # Data values are divided by the steps: the same drawing as in cell coordinates.
+    graph.plot_line(xs, ys, token='*', data=True)
+    cells.plot_line([0, 3], [0, 3], token='*')
+    graph.plot_many([41], [19], token='o', data=True)
+    cells.plot_many([2], [1], token='o')
+    graph.plot_subcell([30], [50], data=True)
+    cells.plot_subcell([1.5], [2.5])
+    assert graph._draw() == cells._draw()
+    assert graph[(1, 1)] == '*' and graph[(2, 1)] == 'o'
@@ -0,0 +1,125 @@
+import colorama
+import io
+import os
+import pytest
+import socket
+import sys
+import pyshart.color
+import pyshart.graph
+import pyshart.render
+
+
+@pytest.fixture
+def graph() -> pyshart.graph.Graph:
+    points = [pyshart.graph.VisualPoint(2, 1, token='<', fore=colorama.Fore.RED)]
+    return pyshart.graph.Graph(points, 3, 1, 1, 1, 10, 10, False, False)
+
+
+def test_draw_prints(graph: pyshart.graph.Graph, capsys) -> None:
+    # Escape codes are not written to a redirected standard output.
+    graph.draw()
+    assert capsys.readouterr().out == pyshart.render.strip_ansi('\n'.join(graph._draw())) + '\n'
+
+
+class _Terminal(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
+def test_draw_to_terminal(graph: pyshart.graph.Graph, monkeypatch) -> None:
+    terminal = _Terminal()
+    monkeypatch.setattr(sys, 'stdout', terminal)
+    monkeypatch.setattr(pyshart.color, '_INITIALIZED', False)
+    graph.draw()
+    assert terminal.getvalue() == '\n'.join(graph._draw()) + '\n'
+    assert pyshart.color._INITIALIZED
+    # The standard output is written directly (not wrapped).
+    assert sys.stdout is terminal
+
+
+def test_text_and_binary_targets(graph: pyshart.graph.Graph) -> None:
+    text = io.StringIO()
+    binary = io.BytesIO()
+    graph.draw(text)
+    graph.draw(binary)
+    assert binary.getvalue() == text.getvalue().encode()
+
+
+def test_fd_and_socket_targets(graph: pyshart.graph.Graph) -> None:
+    expected = ('\n'.join(graph._draw()) + '\n').encode()
+
+    read_fd, write_fd = os.pipe()
+    graph.draw(write_fd)
+    os.close(write_fd)
+    with os.fdopen(read_fd, 'rb') as reader:
+        assert reader.read() == expected
+
+    left, right = socket.socketpair()
+    with left, right:
+        graph.draw(left)
+        assert right.recv(len(expected) + 1) == expected
+
+
+def test_plain(graph: pyshart.graph.Graph) -> None:
+    target = io.StringIO()
+    graph.draw(target, fmt='plain')
+    assert target.getvalue() == '1 < \n0123\n'
+
+
+def test_html(graph: pyshart.graph.Graph) -> None:
+    target = io.StringIO()
+    graph.draw(target, fmt=pyshart.render.Format.HTML)
+    assert target.getvalue() == '<pre>1 <span style="color:#cd0000">&lt;</span> \n0123\n</pre>\n'
+
+
+def test_to_html_extended_colors() -> None:
+    row = '\x1b[38;5;196m\x1b[48;2;1;2;3m\x1b[1mX\x1b[0mY'
+    assert pyshart.render.to_html(row) == '<span style="background:#010203;color:#ff0000;font-weight:bold">X</span>Y'
+
+
+@pytest.mark.parametrize('environ, capability', [
+    ({'TERM': 'xterm'}, pyshart.render.Capability.BASIC),
+    ({'TERM': 'xterm-256color'}, pyshart.render.Capability.EXTENDED),
+    ({'TERM': 'xterm-256color', 'COLORTERM': 'truecolor'}, pyshart.render.Capability.TRUECOLOR),
+    ({'TERM': 'xterm', 'NO_COLOR': ''}, pyshart.render.Capability.NONE),
+    ({'TERM': 'dumb'}, pyshart.render.Capability.NONE),
+])
+def test_detect_capability(environ, capability) -> None:
+    assert pyshart.render.detect_capability(environ) is capability
+
+
+def test_encoder_merges_runs_and_resets() -> None:
+    encoder = pyshart.render.SGREncoder()
+    row = '\x1b[31mX\x1b[0m  \x1b[31mX\x1b[0m\x1b[31mY\x1b[0m\x1b[41m \x1b[0m \x1b[1;31mZ\x1b[0m\x1b[31mW\x1b[0m'
+    assert encoder.encode(row) == '\x1b[31mX  XY\x1b[0;41m \x1b[0m \x1b[1;31mZ\x1b[22mW\x1b[0m'
+    assert encoder.encode('plain') == 'plain'
+
+
+@pytest.mark.parametrize('capability, expected', [
+    (pyshart.render.Capability.TRUECOLOR, '\x1b[38;2;250;10;10mX\x1b[38;5;21mY\x1b[0m'),
+    (pyshart.render.Capability.EXTENDED, '\x1b[38;5;196mX\x1b[38;5;21mY\x1b[0m'),
+    (pyshart.render.Capability.BASIC, '\x1b[91mX\x1b[34mY\x1b[0m'),
+    (pyshart.render.Capability.NONE, 'XY'),
+])
+def test_encoder_reduces_colors(capability, expected) -> None:
+    encoder = pyshart.render.SGREncoder(capability)
+    assert encoder.encode('\x1b[38;2;250;10;10mX\x1b[38;5;21mY\x1b[0m') == expected
+
+
+def test_compact_format(graph: pyshart.graph.Graph) -> None:
+    pyshart.render.terminal_capability.cache_clear()
+    target = io.StringIO()
+    graph.draw(target, fmt=pyshart.render.Format.COMPACT)
+    assert pyshart.render.strip_ansi(target.getvalue()) == '1 < \n0123\n'
+    pyshart.render.terminal_capability.cache_clear()
+
+
+def test_compact_is_smaller() -> None:
+    fore    = pyshart.color.get_color('r')
+    points  = [pyshart.graph.VisualPoint(x, y, fore=fore) for x in range(-20, 21, 2) for y in range(-5, 6)]
+    graph   = pyshart.graph.Graph(points, 20, 5, 1, 1, 10, 10, True, True)
+    encoder = pyshart.render.SGREncoder()
+    rows    = graph._draw()
+    encoded = [encoder.encode(row) for row in rows]
+    assert [pyshart.render.strip_ansi(row) for row in encoded] == [pyshart.render.strip_ansi(row) for row in rows]
+    assert 3 * len(''.join(encoded)) < len(''.join(rows))
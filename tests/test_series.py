@@ -0,0 +1,74 @@
+import pytest
+
+import pyshart.series
+
+
+def test_empty_series() -> None:
+    series = pyshart.series.TimeSeries(window=4, height_y=2)
+    assert series._draw() == [
+        '2    ',
+        '1    ',
+        '01234',
+    ]
+
+
+@pytest.mark.parametrize('window', [0, -3])
+def test_illegal_window(window: int) -> None:
+    with pytest.raises(ValueError):
+        pyshart.series.TimeSeries(window=window, height_y=2)
+
+
+def test_append_scrolls_left() -> None:
+    series = pyshart.series.TimeSeries(window=3, height_y=2)
+    for value in [1, 2]:
+        series.append(value)
+    assert series._draw() == [
+        '2  X',
+        '1 X ',
+        '0123',
+    ]
+
+    for value in [0, 5, 1]:
+        series.append(value)
+    assert series.values == [0, 5, 1]
+    assert series._draw() == [
+        '2 X ',
+        '1  X',
+        '0X23',
+    ]
+
+
+def test_negative_series() -> None:
+    series = pyshart.series.TimeSeries(window=2, height_y=1, step_y=10, negative_y=True)
+    series.append(-10)
+    series.append(10)
+    assert series._draw() == [
+        '0 X',
+        '012',
+        '0X ',
+    ]
+
+
+def test_draw_row_start() -> None:
+    series = pyshart.series.TimeSeries(window=3, height_y=1)
+    for value in [1, 0, 1, 1]:
+        series.append(value)
+    assert series._draw() == ['1 XX', '0X23']
+    for start in range(5):
+        assert [series._draw_row(row, start) for row in (1, 0)] == [line[start:] for line in series._draw()]
+
+
+def test_items_match_drawing() -> None:
+    series = pyshart.series.TimeSeries(window=3, height_y=2)
+    for value in [1, 2]:
+        series.append(value)
+    assert [series[(x, y)] for y in (2, 1, 0) for x in (1, 2, 3)] == list('  X' + ' X ' + '123')
+    for write in (
+        lambda: series.__setitem__((3, 2), 'Q'),
+        lambda: series.plot_many([1], [1]),
+        lambda: series.plot_binned([1], [1]),
+        lambda: series.plot_line([1, 3], [0, 2]),
+    ):
+        with pytest.raises(TypeError):
+            write()
+    assert series._draw() == ['2  X', '1 X ', '0123']
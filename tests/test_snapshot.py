@@ -0,0 +1,108 @@
+import array
+import io
+import json
+import sys
+
+import pytest
+
+import pyshart.canvas
+import pyshart.graph
+import pyshart.series
+import pyshart.snapshot
+
+
+def _graph():
+    points = [
+        pyshart.graph.VisualPoint(-2, 1, fore=pyshart.color.get_color('r')),
+        pyshart.graph.VisualPoint(3, -1, token='O', back=pyshart.color.get_color('blu', pyshart.color.ColorType.BACK)),
+    ]
+    graph = pyshart.graph.Graph(points, 12, 2, 5, 1, 10, 10, True, True, neg_height_y=1, unit_x=10)
+    graph[(0, 2)] = 'multi'
+    return graph
+
+
+def _header(data):
+    offset  = len(pyshart.snapshot.MAGIC)
+    size    = pyshart.snapshot._HEADER_SIZE.unpack(data[offset:offset + 4])[0]
+    return json.loads(data[offset + 4:offset + 4 + size])
+
+
+@pytest.mark.parametrize('use_mmap', [False, True])
+def test_save_load_roundtrip(tmp_path, use_mmap) -> None:
+    graph   = _graph()
+    path    = tmp_path / 'graph.snap'
+    pyshart.snapshot.save(graph, path, series={'ys': [1.5, -2]})
+    loaded, series = pyshart.snapshot.load(str(path), use_mmap=use_mmap)
+    assert loaded._draw() == graph._draw()
+    assert series == {'ys': array.array('d', [1.5, -2])}
+    for name in pyshart.snapshot.AXES_FIELDS:
+        assert getattr(loaded, name) == getattr(graph, name)
+    assert loaded.pop_dirty() == set(range(graph.height))
+
+
+def test_only_used_styles_are_saved() -> None:
+    graph = _graph()
+    graph.plot_many([1], [1], fore=pyshart.color.get_color('g'))
+    graph.plot_many([1], [1])
+    buffer = io.BytesIO()
+    pyshart.snapshot.save(graph, buffer)
+    data = buffer.getvalue()
+    assert _header(data)['prefixes'] == ['', pyshart.color.get_color('r'), pyshart.color.get_color('blu', pyshart.color.ColorType.BACK)]
+    loaded, _ = pyshart.snapshot.loads(data)
+    assert loaded._draw() == graph._draw()
+
+
+def test_loaded_graph_is_editable() -> None:
+    graph   = _graph()
+    buffer  = io.BytesIO()
+    pyshart.snapshot.save(graph, buffer)
+    loaded, series = pyshart.snapshot.loads(buffer.getvalue())
+    assert series == {}
+    loaded.pop_dirty()
+    loaded[(1, 1)] = pyshart.color.ColoredString('Z', fore=pyshart.color.get_color('g'))
+    graph[(1, 1)] = pyshart.color.ColoredString('Z', fore=pyshart.color.get_color('g'))
+    assert loaded.pop_dirty() == {2}
+    assert loaded._draw() == graph._draw()
+
+
+@pytest.mark.skipif(sys.byteorder != 'little', reason='little endian host only')
+def test_load_other_char_size() -> None:
+    graph   = _graph()
+    buffer  = io.BytesIO()
+    pyshart.snapshot.save(graph, buffer)
+    header  = _header(buffer.getvalue())
+    text    = ''.join(row.tounicode() for row in graph.canvas.chars)
+    other   = 2 if header['char_size'] == 4 else 4
+    header['char_size'] = other
+    encoded = json.dumps(header).encode()
+    data    = b''.join([
+        pyshart.snapshot.MAGIC,
+        pyshart.snapshot._HEADER_SIZE.pack(len(encoded)),
+        encoded,
+        text.encode('utf-16-le' if other == 2 else 'utf-32-le'),
+        b''.join(row.tobytes() for row in graph.canvas.styles),
+    ])
+    loaded, _ = pyshart.snapshot.loads(data)
+    assert loaded._draw() == graph._draw()
+
+
+def test_time_series_rejected() -> None:
+    series = pyshart.series.TimeSeries(window=3, height_y=2)
+    series.append(1)
+    with pytest.raises(TypeError):
+        pyshart.snapshot.save(series, io.BytesIO())
+
+
+def test_not_a_snapshot() -> None:
+    with pytest.raises(ValueError):
+        pyshart.snapshot.loads(b'nope')
+
+
+def test_canvas_from_rows() -> None:
+    chars   = [array.array(pyshart.canvas.CHAR_TYPECODE, 'ab')]
+    styles  = [array.array(pyshart.canvas.STYLE_TYPECODE, [0, 1])]
+    cells   = pyshart.canvas.Canvas.from_rows(chars, styles, prefixes=['', '\x1b[31m'])
+    assert cells.render() == ['a\x1b[31mb\x1b[0m']
+    assert cells.style_id('\x1b[31m') == 1
+    with pytest.raises(ValueError):
+        pyshart.canvas.Canvas.from_rows(chars, [array.array(pyshart.canvas.STYLE_TYPECODE, [0])])
@@ -0,0 +1,31 @@
+import pytest
+import pyshart.graph
+import pyshart.subcell
+
+
+def test_pack_braille() -> None:
+    # Top left and bottom right dots of cell (0, 0), and the bottom left dot of cell (1, 0).
+    masks = pyshart.subcell.pack([-0.5, 0.4, 0.6], [0.4, -0.5, -0.5])
+    assert masks == {(0, 0): 0x01 | 0x80, (1, 0): 0x40}
+
+
+def test_pack_half_block() -> None:
+    masks = pyshart.subcell.pack([0, 0, 1], [0.3, -0.3, -0.3], pyshart.subcell.SubcellMode.HALF_BLOCK)
+    assert masks == {(0, 0): 0x03, (1, 0): 0x02}
+
+
+@pytest.mark.parametrize('mode', list(pyshart.subcell.SubcellMode))
+def test_mask_of(mode: pyshart.subcell.SubcellMode) -> None:
+    for mask, glyph in enumerate(mode.glyphs):
+        assert pyshart.subcell.mask_of(glyph, mode) == mask
+    assert pyshart.subcell.mask_of('X', mode) == 0
+
+
+def test_plot_subcell_merges_dots() -> None:
+    graph = pyshart.graph.Graph([], 2, 1, 1, 1, 10, 10, False, False)
+    graph.plot_subcell([0.6], [1.4])
+    graph.plot_subcell([1.4, 9], [1.4, 9])
+    assert graph[(1, 1)] == chr(pyshart.subcell.BRAILLE_BASE + 0x01 | 0x08)
+
+    graph.plot_subcell([2, 2], [1.3, 0.7], mode='half_block')
+    assert graph._draw() == ['1' + chr(0x2809) + '█', '012']
@@ -0,0 +1,87 @@
+import random
+
+import pytest
+
+import pyshart.graph
+import pyshart.viewport
+
+
+def _index(count=2000):
+    rand    = random.Random(count)
+    xs      = [rand.uniform(-500, 500) for _ in range(count)]
+    ys      = [rand.uniform(-300, 300) for _ in range(count)]
+    index   = pyshart.viewport.PointIndex(bucket_x=40, bucket_y=25)
+    index.extend(xs, ys)
+    return index, xs, ys
+
+
+@pytest.mark.parametrize('rect', [(-100, -60, 100, 60), (10, 10, 90, 45), (-500, -300, 0, 0), (-1000, -1000, 1000, 1000)])
+def test_query_matches_scan(rect) -> None:
+    index, xs, ys = _index()
+    low_x, low_y, high_x, high_y = rect
+    expected = sorted((x, y) for x, y in zip(xs, ys) if low_x <= x < high_x and low_y <= y < high_y)
+    assert sorted(zip(*index.query(*rect))) == expected
+
+
+def test_index_bounds_and_quarters() -> None:
+    index = pyshart.viewport.PointIndex(bucket_x=1, bucket_y=1)
+    assert index.bounds() is None
+    index.extend([1, -1, -1, 1], [1, 1, -1, -1])
+    assert len(index) == 4
+    assert index.bounds() == (-1, -1, 1, 1)
+    assert all(len(buckets) == 1 for buckets in index.buckets.values())
+    with pytest.raises(ValueError):
+        index.extend([1], [])
+
+
+def test_viewport_pan_and_zoom() -> None:
+    index = pyshart.viewport.PointIndex(bucket_x=4, bucket_y=4)
+    index.extend([2, 3], [1, 1])
+    view = pyshart.viewport.Viewport(index, width=5, height=3)
+    assert view._draw() == [
+        '  1 @',
+        '21012',
+        '  1  ',
+    ]
+    assert view.pop_dirty() == {0, 1, 2}
+    assert view.pop_dirty() == set()
+
+    # The data origin is still in view: the axes stay on it.
+    view.pan(2, 0)
+    assert view.bounds() == (-0.5, -1.5, 4.5, 1.5)
+    assert view._draw() == [
+        '1 @@ ',
+        '01234',
+        '1    ',
+    ]
+    assert view.pop_dirty() == {0, 1, 2}
+
+    view.zoom(0.5)
+    assert view.step_x == view.step_y == 2
+    assert view._draw() == [
+        ' 2   ',
+        '20@@6',
+        ' 2   ',
+    ]
+
+
+def test_viewport_labels_are_absolute() -> None:
+    index = pyshart.viewport.PointIndex(bucket_x=4, bucket_y=4)
+    index.extend([11], [4])
+    view = pyshart.viewport.Viewport(index, width=5, height=3, center_x=10.2, center_y=2.8)
+    # The origin is out of view: the axes cross at the (snapped) center of the view.
+    assert view.bounds() == (7.5, 1.5, 12.5, 4.5)
+    assert view._draw() == [
+        '  4@ ',
+        '89012',
+        '  2  ',
+    ]
+
+
+def test_viewport_fit() -> None:
+    index, _, _ = _index()
+    view = pyshart.viewport.Viewport(index, width=41, height=11)
+    view.fit()
+    assert (view.center_x, view.center_y) == pytest.approx(((index.bounds()[0] + index.bounds()[2]) / 2, (index.bounds()[1] + index.bounds()[3]) / 2))
+    assert isinstance(view.view, pyshart.graph.Graph)
+    assert len(index.query(*view.bounds())[0]) == len(index)